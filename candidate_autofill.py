@@ -70,7 +70,7 @@ class CandidateAutoFill:
         # Check availability
         if not RESUME_PARSER_AVAILABLE and not LINKEDIN_SCRAPER_AVAILABLE:
             st.error("❌ Auto-fill modules not available. Please install required dependencies.")
-            st.code("pip install PyPDF2 python-docx requests beautifulsoup4")
+            st.code("pip install PyMuPDF PyPDF2 python-docx requests beautifulsoup4")
             return {}
         
         # Auto-fill method selection
@@ -93,7 +93,7 @@ class CandidateAutoFill:
         """Render resume upload interface"""
         if not RESUME_PARSER_AVAILABLE or not self.resume_parser:
             st.error("❌ Resume parser not available")
-            st.code("pip install PyPDF2 python-docx spacy")
+            st.code("pip install PyMuPDF PyPDF2 python-docx spacy")
             return {}
         
         st.write("📄 **Upload Resume File**")
@@ -369,7 +369,7 @@ def render_dependency_help():
     
     # Resume parsing dependencies
     st.write("**For Resume Parsing:**")
-    st.code("pip install PyPDF2 python-docx spacy")
+    st.code("pip install PyMuPDF PyPDF2 python-docx spacy")
     st.code("python -m spacy download en_core_web_sm")
     
     # LinkedIn scraping dependencies
@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+@pytest.fixture
+def resume_files(tmp_path):
+    """Two plain-text resumes with an unreadable PDF between them, in that order"""
+    files = [
+        ('jane_doe.txt', b"Jane Doe\njane.doe@example.com\nSkills: Python, SQL\n"),
+        ('broken.pdf', b"not a pdf"),
+        ('john_roe.txt', b"John Roe\njohn.roe@example.com\nSkills: Java\n"),
+    ]
+    paths = []
+    for filename, content in files:
+        path = tmp_path / filename
+        path.write_bytes(content)
+        paths.append(path)
+    return paths
@@ -4,10 +4,31 @@ Handles email personalization, template rendering, and content generation
 """
 
 import re
-from typing import Dict, Any, Optional, List
+import string
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, FrozenSet
 from dataclasses import dataclass
 from email_config import get_email_config, get_email_template
 
+# Variables supplied by CandidateData.to_dict()
+_CANDIDATE_FIELDS = frozenset({
+    'candidate_name', 'candidate_email', 'job_title',
+    'experience_years', 'skills', 'location'
+})
+
+_FORMATTER = string.Formatter()
+
+@lru_cache(maxsize=None)
+def _template_fields(template_name: str) -> FrozenSet[str]:
+    """Parse the field names used by a template's subject and body once"""
+    template = get_email_template(template_name)
+    return frozenset(
+        field_name
+        for text in (template['subject'], template['body'])
+        for _, field_name, _, _ in _FORMATTER.parse(text)
+        if field_name
+    )
+
 @dataclass 
 class CandidateData:
     """Data structure for candidate information"""
@@ -32,6 +53,9 @@ class CandidateData:
 class EmailTemplateRenderer:
     """Handles email template rendering and personalization"""
     
+    # Company + candidate variable names, frozen by the first instance
+    _available_vars: Optional[FrozenSet[str]] = None
+    
     def __init__(self):
         self.config = get_email_config()
         self.company_vars = {
@@ -42,6 +66,8 @@ class EmailTemplateRenderer:
             'hr_contact_phone': self.config.HR_CONTACT_PHONE,
             'sender_name': self.config.SENDER_NAME
         }
+        if EmailTemplateRenderer._available_vars is None:
+            EmailTemplateRenderer._available_vars = frozenset(self.company_vars) | _CANDIDATE_FIELDS
     
     def render_email(self, candidate: CandidateData, template_name: str = "recruitment_interest") -> Dict[str, str]:
         """
@@ -118,18 +144,8 @@ Subject: {email_content['subject']}
         Returns:
             Dictionary with validation results
         """
-        template = get_email_template(template_name)
-        
-        # Extract variables from template
-        subject_vars = re.findall(r'\{(\w+)\}', template['subject'])
-        body_vars = re.findall(r'\{(\w+)\}', template['body'])
-        all_vars = set(subject_vars + body_vars)
-        
-        # Check which variables are available
-        available_vars = set(self.company_vars.keys()) | {
-            'candidate_name', 'candidate_email', 'job_title', 
-            'experience_years', 'skills', 'location'
-        }
+        all_vars = _template_fields(template_name)
+        available_vars = self._available_vars
         
         missing_vars = all_vars - available_vars
         
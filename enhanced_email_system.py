@@ -3,22 +3,37 @@ HR Automation - Enhanced Email System
 Includes manual email sending and updated configuration
 """
 
-import smtplib
-import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import json
+import itertools
+import threading
+from queue import Queue
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
 # Import the new configuration
-from hr_email_config import get_email_config, get_email_template, get_available_templates
+from hr_email_config import (
+    get_email_config, get_available_templates, render_email_template,
+    send_email_message, close_smtp_connection
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of candidates shown per page in the interactive interface
+CANDIDATE_PAGE_SIZE = 25
+
+# Bulk sending pipeline: SMTP worker threads and rendered-email backlog
+BULK_EMAIL_WORKERS = 4
+BULK_EMAIL_QUEUE_SIZE = 128
+
+def _iter_page(candidates: List[Dict[str, Any]], page_size: int = CANDIDATE_PAGE_SIZE, page: int = 0):
+    """Iterate over a single page of candidates without copying the list"""
+    return itertools.islice(candidates, page * page_size, (page + 1) * page_size)
+
 class EnhancedEmailManager:
     """Enhanced email manager with manual sending capabilities"""
     
@@ -45,41 +60,14 @@ class EnhancedEmailManager:
             print(f"📋 Job: {job_title}")
             print(f"📝 Template: {template_type}")
             
-            # Get email template
-            template = get_email_template(template_type)
-            
-            # Prepare template variables
-            template_vars = {
-                'candidate_name': candidate_name,
-                'job_title': job_title,
-                'company_name': self.config.COMPANY_NAME,
-                'company_website': self.config.COMPANY_WEBSITE,
-                'sender_name': self.config.SENDER_NAME,
-                'hr_contact_name': self.config.HR_CONTACT_NAME,
-                'hr_contact_email': self.config.HR_CONTACT_EMAIL,
-                'hr_contact_phone': self.config.HR_CONTACT_PHONE,
-                'experience_years': '3+',  # Default
-                'skills': 'Technical Skills'  # Default
-            }
-            
             # Format email content
-            subject = template['subject'].format(**template_vars)
-            body = template['body'].format(**template_vars)
+            subject, body = self._render_email(template_type, candidate_name, job_title)
             
             # Send email
             success = self._send_email(candidate_email, subject, body)
             
             # Log the result
-            log_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'candidate_name': candidate_name,
-                'candidate_email': candidate_email,
-                'job_title': job_title,
-                'template_type': template_type,
-                'success': success,
-                'subject': subject
-            }
-            self.email_log.append(log_entry)
+            self._log_email(candidate_name, candidate_email, job_title, template_type, success, subject)
             
             if success:
                 print(f"✅ Email sent successfully to {candidate_name}")
@@ -111,6 +99,9 @@ class EnhancedEmailManager:
         if job_title not in shortlists:
             return {'error': f'Job title "{job_title}" not found in shortlists'}
         
+        if template_type not in get_available_templates():
+            return {'error': f'Template "{template_type}" not found'}
+        
         candidates = shortlists[job_title]
         results = {
             'total_candidates': 0,
@@ -124,43 +115,52 @@ class EnhancedEmailManager:
         print(f"\n📧 BULK EMAIL SENDING FOR: {job_title}")
         print("="*60)
         
-        for candidate_match in candidates:
-            candidate = candidate_match.get('candidate', {})
-            candidate_name = candidate.get('full_name', 'Unknown')
-            candidate_email = candidate.get('email', '').strip()
-            
-            # Skip if specific candidates selected and this one is not included
-            if selected_candidates and candidate_name not in selected_candidates:
-                continue
-            
-            results['total_candidates'] += 1
-            
-            # Skip if no email
-            if not candidate_email or candidate_email.lower() in ['', 'not available', 'n/a']:
-                print(f"⚠️  No email for {candidate_name}")
-                results['emails_failed'] += 1
-                results['failed_to'].append({
-                    'name': candidate_name,
-                    'reason': 'No email address'
-                })
-                continue
-            
-            # Send email
-            success = self.send_manual_email(candidate_name, candidate_email, job_title, template_type)
-            
-            if success:
-                results['emails_sent'] += 1
-                results['sent_to'].append({
-                    'name': candidate_name,
-                    'email': candidate_email
-                })
-            else:
-                results['emails_failed'] += 1
-                results['failed_to'].append({
-                    'name': candidate_name,
-                    'email': candidate_email,
-                    'reason': 'SMTP error'
-                })
+        # Rendering happens here while SMTP workers drain the queue, each
+        # over a single session that stays open for the whole batch
+        email_queue = Queue(maxsize=BULK_EMAIL_QUEUE_SIZE)
+        results_lock = threading.Lock()
+        workers = [
+            threading.Thread(
+                target=self._smtp_worker,
+                args=(email_queue, results, results_lock, job_title, template_type),
+                daemon=True
+            )
+            for _ in range(BULK_EMAIL_WORKERS)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        try:
+            for candidate_match in candidates:
+                candidate = candidate_match.get('candidate', {})
+                candidate_name = candidate.get('full_name', 'Unknown')
+                candidate_email = (candidate.get('email') or '').strip()
+                
+                # Skip if specific candidates selected and this one is not included
+                if selected_candidates and candidate_name not in selected_candidates:
+                    continue
+                
+                with results_lock:
+                    results['total_candidates'] += 1
+                
+                # Skip if no email
+                if not candidate_email or candidate_email.lower() in ['', 'not available', 'n/a']:
+                    print(f"⚠️  No email for {candidate_name}")
+                    with results_lock:
+                        results['emails_failed'] += 1
+                        results['failed_to'].append({
+                            'name': candidate_name,
+                            'reason': 'No email address'
+                        })
+                    continue
+                
+                subject, body = self._render_email(template_type, candidate_name, job_title)
+                email_queue.put((candidate_name, candidate_email, subject, body))
+        finally:
+            for _ in workers:
+                email_queue.put(None)
+            for worker in workers:
+                worker.join()
         
         # Print summary
         print(f"\n📊 BULK EMAIL SUMMARY:")
@@ -171,54 +171,109 @@ class EnhancedEmailManager:
         
         return results
     
+    def _smtp_worker(self, email_queue: Queue, results: Dict[str, Any], results_lock: threading.Lock,
+                     job_title: str, template_type: str):
+        """Send queued emails over this thread's SMTP connection until a None sentinel arrives"""
+        try:
+            while True:
+                item = email_queue.get()
+                if item is None:
+                    break
+                
+                candidate_name, candidate_email, subject, body = item
+                try:
+                    message = self._build_message(candidate_email, subject, body)
+                    send_email_message(candidate_email, message.as_string(), self.config)
+                    success = True
+                except Exception as e:
+                    logger.error(f"SMTP Error: {e}")
+                    success = False
+                    # Reconnect for the next email in case the session broke
+                    close_smtp_connection()
+                
+                with results_lock:
+                    self._log_email(candidate_name, candidate_email, job_title, template_type, success, subject)
+                    if success:
+                        print(f"✅ Email sent successfully to {candidate_name}")
+                        results['emails_sent'] += 1
+                        results['sent_to'].append({
+                            'name': candidate_name,
+                            'email': candidate_email
+                        })
+                    else:
+                        print(f"❌ Failed to send email to {candidate_name}")
+                        results['emails_failed'] += 1
+                        results['failed_to'].append({
+                            'name': candidate_name,
+                            'email': candidate_email,
+                            'reason': 'SMTP error'
+                        })
+        finally:
+            close_smtp_connection()
+    
+    def _render_email(self, template_type: str, candidate_name: str, job_title: str):
+        """Format a template's subject and body for a candidate"""
+        template_vars = {
+            'candidate_name': candidate_name,
+            'job_title': job_title,
+            'company_name': self.config.COMPANY_NAME,
+            'company_website': self.config.COMPANY_WEBSITE,
+            'sender_name': self.config.SENDER_NAME,
+            'hr_contact_name': self.config.HR_CONTACT_NAME,
+            'hr_contact_email': self.config.HR_CONTACT_EMAIL,
+            'hr_contact_phone': self.config.HR_CONTACT_PHONE,
+            'experience_years': '3+',  # Default
+            'skills': 'Technical Skills'  # Default
+        }
+        
+        rendered = render_email_template(template_type, **template_vars)
+        return rendered['subject'], rendered['body']
+    
+    def _log_email(self, candidate_name: str, candidate_email: str, job_title: str,
+                   template_type: str, success: bool, subject: str):
+        """Record a send attempt in the email log"""
+        self.email_log.append({
+            'timestamp': datetime.now().isoformat(),
+            'candidate_name': candidate_name,
+            'candidate_email': candidate_email,
+            'job_title': job_title,
+            'template_type': template_type,
+            'success': success,
+            'subject': subject
+        })
+    
+    def _build_message(self, to_email: str, subject: str, body: str) -> MIMEMultipart:
+        """Create a plain-text email message"""
+        message = MIMEMultipart()
+        message["From"] = self.config.SMTP_USERNAME
+        message["To"] = to_email
+        message["Subject"] = subject
+        
+        # Add body to email
+        message.attach(MIMEText(body, "plain"))
+        return message
+    
     def _send_email(self, to_email: str, subject: str, body: str) -> bool:
         """Send a single email using SMTP"""
         try:
-            # Create message
-            message = MIMEMultipart()
-            message["From"] = self.config.SMTP_USERNAME
-            message["To"] = to_email
-            message["Subject"] = subject
-            
-            # Add body to email
-            message.attach(MIMEText(body, "plain"))
-            
-            # Create SMTP session
-            context = ssl.create_default_context()
-            
-            with smtplib.SMTP(self.config.SMTP_SERVER, self.config.SMTP_PORT) as server:
-                server.starttls(context=context)  # Enable security
-                server.login(self.config.SMTP_USERNAME, self.config.SMTP_PASSWORD)
-                text = message.as_string()
-                server.sendmail(self.config.SMTP_USERNAME, to_email, text)
+            message = self._build_message(to_email, subject, body)
+            send_email_message(to_email, message.as_string(), self.config)
             
             return True
             
         except Exception as e:
             logger.error(f"SMTP Error: {e}")
             return False
+        finally:
+            # One-off send: an idle session would only be dropped by the server and
+            # make the next send fail and reconnect, so close it now
+            close_smtp_connection()
     
     def preview_email(self, candidate_name: str, job_title: str, 
                      template_type: str = "recruitment_interest") -> str:
         """Preview email content before sending"""
         try:
-            template = get_email_template(template_type)
-            
-            template_vars = {
-                'candidate_name': candidate_name,
-                'job_title': job_title,
-                'company_name': self.config.COMPANY_NAME,
-                'company_website': self.config.COMPANY_WEBSITE,
-                'sender_name': self.config.SENDER_NAME,
-                'hr_contact_name': self.config.HR_CONTACT_NAME,
-                'hr_contact_email': self.config.HR_CONTACT_EMAIL,
-                'hr_contact_phone': self.config.HR_CONTACT_PHONE,
-                'experience_years': '3+',
-                'skills': 'Technical Skills'
-            }
-            
-            subject = template['subject'].format(**template_vars)
-            body = template['body'].format(**template_vars)
+            subject, body = self._render_email(template_type, candidate_name, job_title)
             
             preview = f"""
 === EMAIL PREVIEW ===
@@ -264,6 +319,8 @@ class ManualEmailInterface:
     
     def __init__(self):
         self.email_manager = EnhancedEmailManager()
+        self._email_counts = {}
+        self._email_counts_source = None
     
     def interactive_email_sending(self):
         """Interactive interface for sending emails"""
@@ -318,11 +375,11 @@ class ManualEmailInterface:
             # Show candidates for the job
             candidates = shortlists[job_title]
             print(f"\n👥 Candidates for {job_title}:")
-            for i, candidate_match in enumerate(candidates, 1):
-                candidate = candidate_match['candidate']
-                print(f"  {i}. {candidate['full_name']} ({candidate.get('email', 'No email')})")
-            
-            candidate_choice = input(f"\nSelect candidate (1-{len(candidates)}): ").strip()
+            candidate_choice = self._page_candidates(
+                candidates,
+                lambda i, candidate: f"  {i}. {candidate['full_name']} ({candidate.get('email', 'No email')})",
+                f"\nSelect candidate (1-{len(candidates)}): "
+            )
             try:
                 candidate_idx = int(candidate_choice) - 1
                 if 0 <= candidate_idx < len(candidates):
@@ -386,10 +443,13 @@ class ManualEmailInterface:
             # Show candidates
             candidates = shortlists[job_title]
             print(f"\n👥 Candidates for {job_title}:")
-            for i, candidate_match in enumerate(candidates, 1):
-                candidate = candidate_match['candidate']
-                email_status = "✅" if candidate.get('email', '').strip() else "❌"
-                print(f"  {i}. {candidate['full_name']} - {email_status} {candidate.get('email', 'No email')}")
+            self._page_candidates(
+                candidates,
+                lambda i, candidate: (
+                    f"  {i}. {candidate['full_name']} - "
+                    f"{'✅' if (candidate.get('email') or '').strip() else '❌'} {candidate.get('email', 'No email')}"
+                )
+            )
             
             send_all = input(f"\nSend to all candidates with emails? (y/n): ").strip().lower()
             
@@ -443,12 +503,56 @@ class ManualEmailInterface:
         except ValueError:
             print("❌ Invalid input")
     
+    def _page_candidates(self, candidates: List[Dict[str, Any]], format_line,
+                         prompt: Optional[str] = None) -> str:
+        """
+        Print candidates one page at a time with 'n'/'p' navigation
+        
+        Args:
+            candidates: Candidate matches for a job
+            format_line: Callable taking (number, candidate) and returning the line to print
+            prompt: Input prompt shown below each page (optional)
+            
+        Returns:
+            The first answer that is not a page navigation command
+        """
+        page_count = max(1, -(-len(candidates) // CANDIDATE_PAGE_SIZE))
+        page = 0
+        
+        while True:
+            first_number = page * CANDIDATE_PAGE_SIZE + 1
+            for i, candidate_match in enumerate(_iter_page(candidates, page=page), first_number):
+                print(format_line(i, candidate_match['candidate']))
+            
+            if page_count == 1:
+                return input(prompt).strip() if prompt else ""
+            
+            print(f"  📄 Page {page + 1}/{page_count} ('n' next page, 'p' previous page)")
+            choice = input(prompt or "\nPress Enter to continue: ").strip()
+            
+            if choice.lower() == 'n':
+                page = min(page + 1, page_count - 1)
+            elif choice.lower() == 'p':
+                page = max(page - 1, 0)
+            else:
+                return choice
+    
+    def _get_email_counts(self, shortlists: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Count candidates with an email address per job, cached for the loaded shortlists"""
+        if self._email_counts_source is not shortlists:
+            self._email_counts = {
+                job_title: sum(1 for c in candidates if (c['candidate'].get('email') or '').strip())
+                for job_title, candidates in shortlists.items()
+            }
+            self._email_counts_source = shortlists
+        return self._email_counts
+    
     def _show_available_jobs(self, shortlists: Dict[str, List[Dict[str, Any]]]):
         """Show available job titles and candidate counts"""
         print(f"\n📋 Available Jobs:")
+        email_counts = self._get_email_counts(shortlists)
         for job_title, candidates in shortlists.items():
-            email_count = sum(1 for c in candidates if c['candidate'].get('email', '').strip())
-            print(f"   📊 {job_title}: {len(candidates)} candidates ({email_count} with emails)")
+            print(f"   📊 {job_title}: {len(candidates)} candidates ({email_counts[job_title]} with emails)")
 
 def main():
     """Main function for testing the enhanced email system"""
@@ -3,11 +3,22 @@ Gemini AI Integration for Resume Parsing
 Uses Google's Gemini AI to intelligently categorize and clean resume data
 """
 
+import asyncio
+import contextlib
+import functools
 import json
 import logging
+import os
+import time
 import re
+import hashlib
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field, asdict
+
+import msgspec
 
 # Gemini AI imports
 try:
@@ -16,76 +27,128 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+try:
+    from google.api_core import exceptions as google_exceptions
+    _TRANSIENT_ERRORS = (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError,
+    )
+except ImportError:
+    _TRANSIENT_ERRORS = ()
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class GeminiParsedCandidate:
-    """Represents a candidate parsed and cleaned by Gemini AI"""
+GEMINI_MODEL_NAME = 'gemini-2.5-flash'
+
+# Bump whenever the parsing prompt changes so cached extractions are not reused
+PROMPT_VERSION = 'v1'
+
+DEFAULT_CACHE_DIR = 'gemini_cache'
+
+EMBEDDING_MODEL_NAME = 'models/text-embedding-004'
+
+# Matches server hints such as "retry_delay { seconds: 17 }" or "Please retry in 17.5s"
+_RETRY_DELAY_RE = re.compile(r'retry[_ ](?:delay|after|in)\D{0,20}(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# Field validation patterns and categorization-error terms
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'\d{3,}')
+_EDU_TERMS = frozenset({'university', 'college', 'bachelor', 'master', 'phd', 'degree'})
+_COMPANY_TERMS = frozenset({'inc', 'corp', 'ltd', 'llc', 'company'})
+
+# One scan per skill finds terms of both kinds; the group name tags the kind
+_SKILL_TERMS_RE = re.compile(
+    r'\b(?:(?P<education>' + '|'.join(map(re.escape, sorted(_EDU_TERMS))) + r')'
+    r'|(?P<company>' + '|'.join(map(re.escape, sorted(_COMPANY_TERMS))) + r'))\b'
+)
+
+# Inputs shorter than this, or without a real word, are not worth an LLM call
+MIN_RESUME_LENGTH = 120
+_WORD_RE = re.compile(r'[A-Za-z]{3,}')
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Re-prompts allowed when Gemini's output fails schema validation
+MAX_VALIDATION_RETRIES = 2
+
+class ResumeExtraction(msgspec.Struct):
+    """
+    Structured-output schema Gemini fills in for a resume
+    Keys outside these fields are skipped while decoding, without building Python objects;
+    missing ones default to empty instead of failing the whole extraction
+    """
     full_name: str = ""
     email: str = ""
     phone: str = ""
     linkedin_url: str = ""
     location: str = ""
-    skills: List[str] = None
-    experience_summary: str = ""
-    education: List[str] = None
     current_company: str = ""
     current_position: str = ""
     total_experience: str = ""
-    certifications: List[str] = None
-    languages: List[str] = None
-    
-    def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-        if self.education is None:
-            self.education = []
-        if self.certifications is None:
-            self.certifications = []
-        if self.languages is None:
-            self.languages = []
+    skills: List[str] = []
+    experience_summary: str = ""
+    education: List[str] = []
+    certifications: List[str] = []
+    languages: List[str] = []
 
-class GeminiResumeParser:
-    """Resume parser using Gemini AI for intelligent data extraction"""
-    
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key
-        self.model = None
-        self.initialized = False
-        
-        if api_key:
-            self.initialize_gemini(api_key)
-    
-    def initialize_gemini(self, api_key: str) -> bool:
-        """Initialize Gemini AI with API key"""
-        if not GEMINI_AVAILABLE:
-            logger.error("Gemini AI library not available. Install with: pip install google-generativeai")
-            return False
-        
-        try:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-2.5-flash')
-            self.api_key = api_key
-            self.initialized = True
-            logger.info("Gemini AI initialized successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize Gemini AI: {e}")
-            return False
-    
-    def create_parsing_prompt(self, resume_text: str) -> str:
-        """Create a structured prompt for Gemini to parse resume data"""
-        prompt = f"""
+_LIST_FIELDS = frozenset({'skills', 'education', 'certifications', 'languages'})
+
+def _response_schema() -> Dict[str, Any]:
+    """JSON schema for ResumeExtraction, inlined since Gemini does not resolve $ref"""
+    schema = msgspec.json.schema(ResumeExtraction)
+    schema = schema['$defs'][schema['$ref'].rsplit('/', 1)[-1]]
+    # Gemini's schema has no "default"; still ask for every field even though decoding tolerates gaps
+    for prop in schema['properties'].values():
+        prop.pop('default', None)
+    schema['required'] = list(schema['properties'])
+    return schema
+
+# Gemini returns JSON conforming to ResumeExtraction instead of free-form text
+_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": _response_schema(),
+}
+
+# Decodes Gemini's JSON straight into a typed struct, validating as it goes
+_EXTRACTION_DECODER = msgspec.json.Decoder(ResumeExtraction)
+
+# Batched requests return one extraction per packed resume
+_BATCH_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {"type": "array", "items": _response_schema()},
+}
+
+_BATCH_EXTRACTION_DECODER = msgspec.json.Decoder(List[ResumeExtraction])
+
+# Resumes packed into one Gemini call by parse_resumes_batched; bounded by the context window
+DEFAULT_BATCH_SIZE = 6
+
+class _CacheEntry(msgspec.Struct):
+    """On-disk cache entry; only the extraction is decoded, the timestamp is skipped"""
+    data: ResumeExtraction
+
+_CACHE_ENTRY_DECODER = msgspec.json.Decoder(_CacheEntry)
+
+# Parsing prompt, split around the resume text
+_PROMPT_PREFIX = """
 You are an expert HR assistant specializing in resume parsing. Please analyze the following resume text and extract information into the specified JSON format. Be very careful to categorize information correctly and avoid mixing up different types of data.
 
 RESUME TEXT:
-{resume_text}
-
-Please extract and categorize the information into the following JSON structure. If a field cannot be determined from the resume, leave it empty or as an empty array:
+"""
 
-{{
+# Field layout and categorization rules shared by the single and batched prompts
+_EXTRACTION_FORMAT = """{
     "full_name": "Full name of the candidate",
     "email": "Email address only (no other contact info)",
     "phone": "Phone number only (formatted as +1-XXX-XXX-XXXX or similar)",
@@ -99,7 +162,7 @@ Please extract and categorize the information into the following JSON structure.
     "education": ["Educational qualifications only - degrees, universities, graduation years"],
     "certifications": ["Professional certifications only - no skills or education degrees"],
     "languages": ["Spoken languages only (e.g., English, Spanish, French)"]
-}}
+}
 
 IMPORTANT PARSING RULES:
 1. SKILLS should only contain technical skills, tools, programming languages, frameworks, and professional competencies
@@ -112,10 +175,248 @@ IMPORTANT PARSING RULES:
 8. Current company and position should be the most recent/current role
 9. Experience summary should focus on achievements and responsibilities, not list skills
 10. Be precise and avoid categorization errors
+"""
+
+_PROMPT_SUFFIX = """
+
+Please extract and categorize the information into the following JSON structure. If a field cannot be determined from the resume, leave it empty or as an empty array:
 
+""" + _EXTRACTION_FORMAT + """
 Please respond with ONLY the JSON object, no additional text or explanation.
 """
-        return prompt
+
+# Batched prompt packing several resumes into one request
+_BATCH_PROMPT_PREFIX = """
+You are an expert HR assistant specializing in resume parsing. Please analyze each of the following resumes and extract its information into the specified JSON format. Be very careful to categorize information correctly, avoid mixing up different types of data, and never mix data between resumes.
+
+"""
+
+_BATCH_PROMPT_SUFFIX = """
+
+Return a JSON array with exactly one object per resume, in the same order as the resumes above. If a field cannot be determined from a resume, leave it empty or as an empty array. Each object uses the following JSON structure:
+
+""" + _EXTRACTION_FORMAT + """
+Please respond with ONLY the JSON array, no additional text or explanation.
+"""
+
+@dataclass(slots=True)
+class GeminiParsedCandidate:
+    """Represents a candidate parsed and cleaned by Gemini AI"""
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    linkedin_url: str = ""
+    location: str = ""
+    skills: List[str] = field(default_factory=list)
+    experience_summary: str = ""
+    education: List[str] = field(default_factory=list)
+    current_company: str = ""
+    current_position: str = ""
+    total_experience: str = ""
+    certifications: List[str] = field(default_factory=list)
+    languages: List[str] = field(default_factory=list)
+
+
+def has_core_fields(candidate: GeminiParsedCandidate) -> bool:
+    """Cheap structural check that an extraction has a name and at least one other core field"""
+    core_fields = (candidate.full_name, candidate.email, candidate.phone, candidate.skills)
+    return bool(candidate.full_name) and sum(bool(value) for value in core_fields) >= 2
+
+def is_parseable_text(resume_text: str) -> bool:
+    """Reject empty, tiny or non-textual inputs before any parsing work"""
+    return len(resume_text.strip()) >= MIN_RESUME_LENGTH and bool(_WORD_RE.search(resume_text))
+
+class ExtractionCache:
+    """Content-addressable disk cache of Gemini extractions, one JSON file per key"""
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def make_key(resume_text: str, model_name: str = GEMINI_MODEL_NAME,
+                 prompt_version: str = PROMPT_VERSION) -> str:
+        """Hash the model, prompt version and resume text into a cache key"""
+        prefix = f"{prompt_version}|{model_name}|".encode('utf-8')
+        return hashlib.sha256(prefix + resume_text.encode('utf-8', 'ignore')).hexdigest()
+    
+    def get(self, key: str) -> Optional[ResumeExtraction]:
+        """Return the cached extraction for a key, or None on a miss"""
+        try:
+            with open(self.cache_dir / f"{key}.json", 'rb') as f:
+                return _CACHE_ENTRY_DECODER.decode(f.read()).data
+        except FileNotFoundError:
+            return None
+        except (OSError, msgspec.DecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+    
+    def put(self, key: str, data: Dict[str, Any]):
+        """Store an extraction together with a UTC timestamp"""
+        entry = {
+            'cached_at': datetime.now(timezone.utc).isoformat(),
+            'data': data
+        }
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+
+class SemanticExtractionCache:
+    """
+    In-memory near-duplicate cache of Gemini extractions
+    Matches resumes by cosine similarity of embeddings of their normalized text.
+    Opt-in (use_semantic_cache): every exact-cache miss costs an embedding call.
+    """
+    
+    def __init__(self, capacity: int = 1024, threshold: float = 0.97):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.embeddings = None  # (capacity, dim) float32, allocated on first put
+        self.norms = np.zeros(capacity, dtype=np.float32)
+        self.entries: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self.size = 0
+        self._next_slot = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def normalize_text(resume_text: str) -> str:
+        """Lowercase, drop punctuation and collapse whitespace"""
+        return _WHITESPACE_RE.sub(' ', _PUNCTUATION_RE.sub(' ', resume_text.lower())).strip()
+    
+    @staticmethod
+    def embed(resume_text: str):
+        """Embed normalized resume text with Gemini, returning None on failure"""
+        try:
+            result = genai.embed_content(
+                model=EMBEDDING_MODEL_NAME,
+                content=SemanticExtractionCache.normalize_text(resume_text)
+            )
+            return np.asarray(result['embedding'], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Failed to embed resume text: {e}")
+            return None
+    
+    def get(self, embedding) -> Optional[Dict[str, Any]]:
+        """Return the most similar cached extraction above the threshold"""
+        with self._lock:
+            if not self.size:
+                return None
+            query_norm = float(np.linalg.norm(embedding))
+            if not query_norm:
+                return None
+            sims = self.embeddings[:self.size] @ embedding / (self.norms[:self.size] * query_norm + 1e-12)
+            best = int(sims.argmax())
+            if sims[best] > self.threshold:
+                return self.entries[best]
+            return None
+    
+    def put(self, embedding, data: Dict[str, Any]):
+        """Store an extraction, overwriting the oldest entry when full"""
+        with self._lock:
+            if self.embeddings is None:
+                self.embeddings = np.zeros((self.capacity, embedding.shape[0]), dtype=np.float32)
+            slot = self._next_slot
+            self.embeddings[slot] = embedding
+            self.norms[slot] = np.linalg.norm(embedding)
+            self.entries[slot] = data
+            self._next_slot = (slot + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+
+_semantic_cache: Optional[SemanticExtractionCache] = None
+
+class RateLimiter:
+    """
+    Token bucket for async requests: refills at `rps` tokens per second and holds
+    up to `burst`, so short bursts go out at once while the average stays at `rps`
+    """
+    
+    def __init__(self, rps: float, burst: Optional[int] = None):
+        self.rate = rps
+        self.capacity = max(1, burst if burst is not None else int(rps))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def wait(self):
+        """Take a token, sleeping until one is available"""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+def get_semantic_cache() -> Optional[SemanticExtractionCache]:
+    """Get the process-wide semantic cache, or None when numpy is unavailable"""
+    global _semantic_cache
+    if _semantic_cache is None and NUMPY_AVAILABLE:
+        _semantic_cache = SemanticExtractionCache()
+    return _semantic_cache
+
+@functools.lru_cache(maxsize=8)
+def _get_model(api_key: str, name: str = GEMINI_MODEL_NAME):
+    """Configure Gemini and build the model client once per process for each key and model"""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(name)
+
+@functools.lru_cache(maxsize=1)
+def get_traditional_parser():
+    """Get the process-wide traditional resume parser, or None when it is unavailable"""
+    try:
+        from resume_parser import ResumeParser
+    except ImportError:
+        logger.warning("Traditional resume parser not available")
+        return None
+    return ResumeParser()
+
+class GeminiResumeParser:
+    """Resume parser using Gemini AI for intelligent data extraction"""
+    
+    def __init__(self, api_key: str = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 use_semantic_cache: bool = False):
+        self.api_key = api_key
+        self.model = None
+        self.initialized = False
+        self.cache = ExtractionCache(cache_dir) if cache_dir else None
+        self.semantic_cache = get_semantic_cache() if use_semantic_cache else None
+        
+        if api_key:
+            self.initialize_gemini(api_key)
+    
+    def initialize_gemini(self, api_key: str) -> bool:
+        """Initialize Gemini AI with API key"""
+        if not GEMINI_AVAILABLE:
+            logger.error("Gemini AI library not available. Install via: pip install google-generativeai")
+            return False
+        
+        try:
+            self.model = _get_model(api_key)
+            self.api_key = api_key
+            self.initialized = True
+            logger.info("Gemini AI initialized successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize Gemini AI: {e}")
+            return False
+    
+    def create_parsing_prompt(self, resume_text: str) -> str:
+        """Create a structured prompt for Gemini to parse resume data"""
+        return _PROMPT_PREFIX + resume_text + _PROMPT_SUFFIX
+    
+    def create_batch_prompt(self, resume_texts: List[str]) -> str:
+        """Create one prompt packing several resumes, sharing the instruction text"""
+        packed = "\n===\n".join(
+            f"RESUME {number}:\n{resume_text}" for number, resume_text in enumerate(resume_texts, 1)
+        )
+        return _BATCH_PROMPT_PREFIX + packed + _BATCH_PROMPT_SUFFIX
     
     def parse_resume_with_gemini(self, resume_text: str) -> GeminiParsedCandidate:
         """
@@ -131,37 +432,352 @@ Please respond with ONLY the JSON object, no additional text or explanation.
             logger.error("Gemini AI not initialized. Please provide API key.")
             return GeminiParsedCandidate()
         
+        cached, cache_key, embedding = self._lookup_caches(resume_text)
+        if cached is not None:
+            return cached
+        
+        return self._parse_uncached(resume_text, cache_key, embedding)
+    
+    def parse_resumes_batched(self, resume_texts: List[str],
+                              batch_size: int = DEFAULT_BATCH_SIZE) -> List[GeminiParsedCandidate]:
+        """
+        Parse several resumes, packing up to batch_size of them into each Gemini call
+        
+        Args:
+            resume_texts: Raw resume text contents
+            batch_size: Maximum number of resumes per Gemini call
+            
+        Returns:
+            GeminiParsedCandidate objects in the same order as resume_texts
+        """
+        if not self.initialized:
+            logger.error("Gemini AI not initialized. Please provide API key.")
+            return [GeminiParsedCandidate() for _ in resume_texts]
+        
+        candidates: List[Optional[GeminiParsedCandidate]] = [None] * len(resume_texts)
+        pending = []  # (index, cache key, embedding) for cache misses
+        for index, resume_text in enumerate(resume_texts):
+            cached, cache_key, embedding = self._lookup_caches(resume_text)
+            if cached is not None:
+                candidates[index] = cached
+            else:
+                pending.append((index, cache_key, embedding))
+        
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            extractions = None
+            if len(batch) > 1:
+                extractions = self._generate_batch_extraction([resume_texts[index] for index, _, _ in batch])
+            
+            if extractions is None:
+                # Single leftover resume, or the batched call failed - parse one at a time
+                for index, cache_key, embedding in batch:
+                    candidates[index] = self._parse_uncached(resume_texts[index], cache_key, embedding)
+                continue
+            
+            for (index, cache_key, embedding), extraction in zip(batch, extractions):
+                candidates[index] = self._store_candidate(extraction, cache_key, embedding)
+        
+        return candidates
+    
+    def _parse_uncached(self, resume_text: str, cache_key: Optional[str],
+                        embedding) -> GeminiParsedCandidate:
+        """Parse a resume that missed every cache with a single Gemini call"""
         try:
             # Create the parsing prompt
             prompt = self.create_parsing_prompt(resume_text)
             
-            # Generate response from Gemini
-            response = self.model.generate_content(prompt)
-            
-            if not response or not response.text:
-                logger.error("Empty response from Gemini AI")
+            # Generate a schema-validated extraction from Gemini
+            extraction = self._generate_extraction(prompt)
+            if extraction is None:
                 return GeminiParsedCandidate()
+            return self._store_candidate(extraction, cache_key, embedding)
+                
+        except Exception as e:
+            logger.error(f"Error parsing resume with Gemini AI: {e}")
+            return GeminiParsedCandidate()
+    
+    def _generate_batch_extraction(self, resume_texts: List[str]) -> Optional[List[ResumeExtraction]]:
+        """
+        Extract several resumes with one Gemini call
+        
+        Returns:
+            One extraction per resume, or None when the response is invalid or
+            does not line up with the inputs
+        """
+        try:
+            response = self._call_with_retry(self.create_batch_prompt(resume_texts),
+                                             generation_config=_BATCH_GENERATION_CONFIG)
+            response_text = response.text if response else ''
+            extractions = _BATCH_EXTRACTION_DECODER.decode(response_text.encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Batched Gemini parsing failed, parsing individually: {e}")
+            return None
+        
+        if len(extractions) != len(resume_texts):
+            logger.warning(f"Batched Gemini parsing returned {len(extractions)} extractions "
+                           f"for {len(resume_texts)} resumes, parsing individually")
+            return None
+        return extractions
+    
+    async def parse_resume_with_gemini_async(self, resume_text: str,
+                                             semaphore: Optional[asyncio.Semaphore] = None,
+                                             rate_limiter: Optional['RateLimiter'] = None) -> GeminiParsedCandidate:
+        """
+        Parse resume using Gemini AI without blocking the event loop
+        
+        Args:
+            resume_text: Raw resume text content
+            semaphore: Caps the number of in-flight Gemini calls (optional)
+            rate_limiter: Spaces out Gemini calls to respect the provider's rate limit (optional)
             
-            # Clean the response text (remove any markdown formatting)
-            response_text = response.text.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            elif response_text.startswith('```'):
-                response_text = response_text.replace('```', '').strip()
-            
-            # Parse JSON response
-            try:
-                parsed_data = json.loads(response_text)
-                return self.create_candidate_from_json(parsed_data)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response from Gemini: {e}")
-                logger.error(f"Response was: {response_text}")
+        Returns:
+            GeminiParsedCandidate object with categorized information
+        """
+        if not self.initialized:
+            logger.error("Gemini AI not initialized. Please provide API key.")
+            return GeminiParsedCandidate()
+        
+        cached, cache_key, embedding = await self._lookup_caches_async(resume_text, semaphore, rate_limiter)
+        if cached is not None:
+            return cached
+        
+        try:
+            prompt = self.create_parsing_prompt(resume_text)
+            extraction = await self._generate_extraction_async(prompt, semaphore, rate_limiter)
+            if extraction is None:
                 return GeminiParsedCandidate()
-                
+            # Cache writes hit the disk and take a threading lock, so keep them off the loop
+            return await asyncio.to_thread(self._store_candidate, extraction, cache_key, embedding)
+        
         except Exception as e:
             logger.error(f"Error parsing resume with Gemini AI: {e}")
             return GeminiParsedCandidate()
     
+    def _generate_extraction(self, prompt: str) -> Optional[ResumeExtraction]:
+        """Ask Gemini for a schema-valid extraction, feeding validation errors back on failure"""
+        contents = [{'role': 'user', 'parts': [prompt]}]
+        for attempt in range(MAX_VALIDATION_RETRIES + 1):
+            response = self._call_with_retry(contents)
+            data, error = self._validate_response(response)
+            if error is None:
+                return data
+            if attempt < MAX_VALIDATION_RETRIES:
+                contents += self._feedback_turns(response, error)
+                time.sleep(1.0 * (attempt + 1))
+        
+        logger.error(f"Gemini output failed schema validation: {error}")
+        return None
+    
+    async def _generate_extraction_async(self, prompt: str,
+                                         semaphore: Optional[asyncio.Semaphore] = None,
+                                         rate_limiter: Optional['RateLimiter'] = None) -> Optional[ResumeExtraction]:
+        """Async variant of _generate_extraction"""
+        contents = [{'role': 'user', 'parts': [prompt]}]
+        for attempt in range(MAX_VALIDATION_RETRIES + 1):
+            response = await self._call_with_retry_async(contents, semaphore, rate_limiter)
+            data, error = self._validate_response(response)
+            if error is None:
+                return data
+            if attempt < MAX_VALIDATION_RETRIES:
+                contents += self._feedback_turns(response, error)
+                await asyncio.sleep(1.0 * (attempt + 1))
+        
+        logger.error(f"Gemini output failed schema validation: {error}")
+        return None
+    
+    @staticmethod
+    def _validate_response(response):
+        """
+        Validate a Gemini response against ResumeExtraction
+        
+        Returns:
+            Tuple of (extraction, None) on success or (None, error message)
+        """
+        response_text = response.text if response else ''
+        if not response_text:
+            return None, 'Empty response'
+        try:
+            return _EXTRACTION_DECODER.decode(response_text.encode('utf-8')), None
+        except msgspec.ValidationError as e:
+            return None, str(e)
+        except msgspec.DecodeError as e:
+            return None, f"Invalid JSON: {e}"
+    
+    @staticmethod
+    def _feedback_turns(response, error: str) -> List[Dict[str, Any]]:
+        """Conversation turns asking Gemini to correct its previous output"""
+        turns = []
+        if response and response.text:
+            turns.append({'role': 'model', 'parts': [response.text]})
+        turns.append({'role': 'user', 'parts': [f"Your output had error: {error}. Fix and retry."]})
+        return turns
+    
+    def _call_with_retry(self, contents, max_attempts: int = 3,
+                         base: float = 1.0, cap: float = 47.0,
+                         generation_config: Dict[str, Any] = _GENERATION_CONFIG):
+        """Call Gemini, retrying rate-limit and transient server errors with exponential backoff"""
+        for attempt in range(max_attempts):
+            try:
+                return self.model.generate_content(contents, generation_config=generation_config)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, max_attempts, base, cap)
+                if delay is None:
+                    raise
+                logger.warning(f"Transient Gemini error, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+    
+    async def _call_with_retry_async(self, contents,
+                                     semaphore: Optional[asyncio.Semaphore] = None,
+                                     rate_limiter: Optional['RateLimiter'] = None,
+                                     max_attempts: int = 3, base: float = 1.0, cap: float = 47.0):
+        """Async variant of _call_with_retry; the semaphore slot is released while backing off"""
+        for attempt in range(max_attempts):
+            try:
+                async with semaphore or contextlib.nullcontext():
+                    if rate_limiter:
+                        await rate_limiter.wait()
+                    return await self.model.generate_content_async(contents, generation_config=_GENERATION_CONFIG)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, max_attempts, base, cap)
+                if delay is None:
+                    raise
+                logger.warning(f"Transient Gemini error, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int, max_attempts: int,
+                     base: float, cap: float) -> Optional[float]:
+        """
+        Decide whether a failed Gemini call should be retried
+        
+        Returns:
+            Seconds to wait before the next attempt, or None to re-raise
+        """
+        if attempt + 1 >= max_attempts:
+            return None
+        
+        message = str(error)
+        lowered = message.lower()
+        is_transient = (
+            isinstance(error, _TRANSIENT_ERRORS)
+            or 'rate limit' in lowered
+            or 'quota' in lowered
+        )
+        if not is_transient:
+            return None
+        
+        # Prefer the server-provided delay when the error carries one
+        match = _RETRY_DELAY_RE.search(message)
+        if match:
+            return min(cap, float(match.group(1)))
+        return min(cap, base * (2 ** attempt))
+    
+    def _lookup_caches(self, resume_text: str):
+        """
+        Look the resume up in the exact-hash cache, then the semantic cache
+        
+        Returns:
+            Tuple of (cached candidate or None, cache key, embedding) - the key and
+            embedding are reused to store the fresh parse on a miss
+        """
+        cached, cache_key = self._lookup_exact_cache(resume_text)
+        if cached is not None:
+            return cached, cache_key, None
+        
+        # Near-duplicates (reformatted or lightly edited resumes) reuse an earlier parse
+        embedding = None
+        if self.semantic_cache:
+            embedding = SemanticExtractionCache.embed(resume_text)
+            cached = self._lookup_semantic_cache(resume_text, embedding)
+            if cached is not None:
+                return cached, cache_key, embedding
+        
+        return None, cache_key, embedding
+    
+    async def _lookup_caches_async(self, resume_text: str,
+                                   semaphore: Optional[asyncio.Semaphore] = None,
+                                   rate_limiter: Optional['RateLimiter'] = None):
+        """
+        Async variant of _lookup_caches; the embedding call is a Gemini request, so it
+        takes a semaphore slot and waits on the rate limiter like generation calls do
+        """
+        cached, cache_key = await asyncio.to_thread(self._lookup_exact_cache, resume_text)
+        if cached is not None:
+            return cached, cache_key, None
+        
+        embedding = None
+        if self.semantic_cache:
+            async with semaphore or contextlib.nullcontext():
+                if rate_limiter:
+                    await rate_limiter.wait()
+                embedding = await asyncio.to_thread(SemanticExtractionCache.embed, resume_text)
+            cached = await asyncio.to_thread(self._lookup_semantic_cache, resume_text, embedding)
+            if cached is not None:
+                return cached, cache_key, embedding
+        
+        return None, cache_key, embedding
+    
+    def _lookup_exact_cache(self, resume_text: str):
+        """
+        Look the resume up in the exact-hash cache
+        
+        Returns:
+            Tuple of (cached candidate or None, cache key or None when caching is off)
+        """
+        if not self.cache:
+            return None, None
+        cache_key = ExtractionCache.make_key(resume_text)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached Gemini extraction")
+            return self.create_candidate_from_extraction(cached), cache_key
+        return None, cache_key
+    
+    def _lookup_semantic_cache(self, resume_text: str, embedding) -> Optional[GeminiParsedCandidate]:
+        """
+        Return the cached candidate for a similar resume, if any
+        
+        Resumes built from one template embed almost identically, so a hit is only
+        reused when this text names the same person (cached email and full name)
+        """
+        if embedding is None:
+            return None
+        cached = self.semantic_cache.get(embedding)
+        if cached is None:
+            return None
+        
+        text = _WHITESPACE_RE.sub(' ', resume_text.lower())
+        identifiers = [
+            _WHITESPACE_RE.sub(' ', str(cached.get(field) or '').lower()).strip()
+            for field in ('email', 'full_name')
+        ]
+        if not any(identifiers) or not all(identifier in text for identifier in identifiers if identifier):
+            logger.info("Semantic cache hit belongs to a different candidate, parsing afresh")
+            return None
+        
+        logger.info("Using semantically cached Gemini extraction")
+        return self.create_candidate_from_json(cached)
+    
+    def _store_candidate(self, extraction: ResumeExtraction, cache_key: Optional[str],
+                         embedding) -> GeminiParsedCandidate:
+        """Build a candidate from an extraction and cache successful parses"""
+        candidate = self.create_candidate_from_extraction(extraction)
+        if has_core_fields(candidate):
+            candidate_data = asdict(candidate)
+            if cache_key:
+                self.cache.put(cache_key, candidate_data)
+            if embedding is not None:
+                self.semantic_cache.put(embedding, candidate_data)
+        return candidate
+    
+    def create_candidate_from_extraction(self, extraction: ResumeExtraction) -> GeminiParsedCandidate:
+        """Create GeminiParsedCandidate from a decoded, already-typed extraction"""
+        fields = msgspec.structs.asdict(extraction)
+        for name, value in fields.items():
+            fields[name] = self.clean_list_field(value) if name in _LIST_FIELDS else value.strip()
+        return GeminiParsedCandidate(**fields)
+    
     def create_candidate_from_json(self, data: Dict[str, Any]) -> GeminiParsedCandidate:
         """Create GeminiParsedCandidate from JSON data"""
         candidate = GeminiParsedCandidate()
@@ -188,30 +804,28 @@ Please respond with ONLY the JSON object, no additional text or explanation.
         return candidate
     
     def clean_list_field(self, field_data) -> List[str]:
-        """Clean and validate list fields"""
+        """Clean and validate list fields, stopping once 20 items are collected"""
         if not field_data:
             return []
         
         if isinstance(field_data, str):
-            # If it's a string, try to split it
-            field_data = [item.strip() for item in field_data.split(',') if item.strip()]
-        
-        if isinstance(field_data, list):
-            # Clean each item
-            cleaned = []
-            for item in field_data:
-                if isinstance(item, str):
-                    item = item.strip()
-                    if item and len(item) > 1:  # Avoid single characters
-                        cleaned.append(item)
-                else:
-                    # Convert to string if not already
-                    item_str = str(item).strip()
-                    if item_str and len(item_str) > 1:
-                        cleaned.append(item_str)
-            return cleaned[:20]  # Limit to 20 items max
-        
-        return []
+            # If it's a string, split it
+            items = field_data.split(',')
+        elif isinstance(field_data, list):
+            # Convert to string if not already
+            items = (item if isinstance(item, str) else str(item) for item in field_data)
+        else:
+            return []
+        
+        cleaned = []
+        append = cleaned.append
+        for item in items:
+            item = item.strip()
+            if len(item) > 1:  # Avoid empty items and single characters
+                append(item)
+                if len(cleaned) == 20:  # Limit to 20 items max
+                    break
+        return cleaned
     
     def validate_parsed_data(self, candidate: GeminiParsedCandidate) -> Dict[str, List[str]]:
         """
@@ -224,8 +838,7 @@ Please respond with ONLY the JSON object, no additional text or explanation.
         
         # Validate email format
         if candidate.email:
-            email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-            if not email_pattern.match(candidate.email):
+            if not _EMAIL_RE.match(candidate.email):
                 issues.setdefault('email', []).append('Invalid email format')
         
         # Validate LinkedIn URL
@@ -238,18 +851,18 @@ Please respond with ONLY the JSON object, no additional text or explanation.
         # Validate phone format
         if candidate.phone:
             # Basic phone validation - should contain digits
-            if not re.search(r'\d{3,}', candidate.phone):
+            if not _PHONE_RE.search(candidate.phone):
                 issues.setdefault('phone', []).append('Phone number appears invalid')
         
         # Check for potential categorization errors in skills
         if candidate.skills:
             for skill in candidate.skills:
-                skill_lower = skill.lower()
+                term_kinds = {match.lastgroup for match in _SKILL_TERMS_RE.finditer(skill.lower())}
                 # Check if education terms are in skills
-                if any(term in skill_lower for term in ['university', 'college', 'bachelor', 'master', 'phd', 'degree']):
+                if 'education' in term_kinds:
                     issues.setdefault('skills', []).append(f'Education term found in skills: {skill}')
                 # Check if company names are in skills (basic check)
-                if any(term in skill_lower for term in ['inc', 'corp', 'ltd', 'llc', 'company']):
+                if 'company' in term_kinds:
                     issues.setdefault('skills', []).append(f'Company name might be in skills: {skill}')
         
         return issues
@@ -277,19 +890,16 @@ class HybridResumeParser:
     Falls back to traditional parsing if Gemini fails
     """
     
-    def __init__(self, gemini_api_key: str = None):
-        # Initialize traditional parser
-        try:
-            from resume_parser import ResumeParser
-            self.traditional_parser = ResumeParser()
-            self.traditional_available = True
-        except ImportError:
-            self.traditional_parser = None
-            self.traditional_available = False
-            logger.warning("Traditional resume parser not available")
+    def __init__(self, gemini_api_key: str = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        # Traditional parser is stateless, so every instance shares one
+        self.traditional_parser = get_traditional_parser()
+        self.traditional_available = self.traditional_parser is not None
         
-        # Initialize Gemini parser
-        self.gemini_parser = GeminiResumeParser(gemini_api_key)
+        # Initialize Gemini parser, degrading to traditional parsing when the library is missing
+        if gemini_api_key and not GEMINI_AVAILABLE:
+            logger.warning("Gemini AI library not available. Install via: pip install google-generativeai")
+            gemini_api_key = None
+        self.gemini_parser = GeminiResumeParser(gemini_api_key, cache_dir=cache_dir)
     
     def parse_resume(self, resume_text: str, use_gemini: bool = True) -> Dict[str, Any]:
         """
@@ -302,36 +912,129 @@ class HybridResumeParser:
         Returns:
             Dictionary with parsed candidate data
         """
-        result = {
-            'success': False,
-            'method': 'none',
-            'data': {},
-            'issues': [],
-            'raw_text': resume_text[:500] + '...' if len(resume_text) > 500 else resume_text
-        }
+        if not is_parseable_text(resume_text):
+            logger.warning("Resume text too short to parse")
+            return self._empty_result(resume_text, 'Resume text too short to parse')
+        
+        gemini_result = None
         
         # Try Gemini AI first (if available and requested)
         if use_gemini and self.gemini_parser.initialized:
             try:
                 logger.info("Attempting to parse resume with Gemini AI...")
                 gemini_result = self.gemini_parser.parse_resume_with_gemini(resume_text)
-                
-                if gemini_result.full_name:  # Basic check for successful parsing
-                    # Validate the results
-                    issues = self.gemini_parser.validate_parsed_data(gemini_result)
-                    
-                    result['success'] = True
-                    result['method'] = 'gemini'
-                    result['data'] = self.convert_to_dict(gemini_result)
-                    result['issues'] = issues
-                    
-                    logger.info("Successfully parsed resume with Gemini AI")
-                    return result
-                else:
-                    logger.warning("Gemini AI parsing failed - no name extracted")
             except Exception as e:
                 logger.error(f"Gemini AI parsing failed: {e}")
         
+        return self._build_result(resume_text, gemini_result)
+    
+    async def parse_resumes(self, texts: List[str], use_gemini: bool = True,
+                            concurrency: int = 8, rps: float = 5.0,
+                            burst: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of resumes with concurrent Gemini calls
+        
+        Args:
+            texts: Raw resume texts
+            use_gemini: Whether to use Gemini AI (fallback to traditional if fails)
+            concurrency: Maximum number of Gemini calls in flight
+            rps: Average Gemini calls dispatched per second
+            burst: Calls that may go out back to back before rps applies (defaults to one second's worth)
+            
+        Returns:
+            List of parse results in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = RateLimiter(rps, burst)
+        
+        async def _parse_one(resume_text: str) -> Dict[str, Any]:
+            if not is_parseable_text(resume_text):
+                logger.warning("Resume text too short to parse")
+                return self._empty_result(resume_text, 'Resume text too short to parse')
+            
+            gemini_result = None
+            if use_gemini and self.gemini_parser.initialized:
+                try:
+                    gemini_result = await self.gemini_parser.parse_resume_with_gemini_async(
+                        resume_text, semaphore=semaphore, rate_limiter=rate_limiter
+                    )
+                except Exception as e:
+                    logger.error(f"Gemini AI parsing failed: {e}")
+            return self._build_result(resume_text, gemini_result)
+        
+        return list(await asyncio.gather(*(_parse_one(text) for text in texts)))
+    
+    def parse_resumes_batched(self, texts: List[str], use_gemini: bool = True,
+                              batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of resumes, packing several into each Gemini call
+        
+        Args:
+            texts: Raw resume texts
+            use_gemini: Whether to use Gemini AI (fallback to traditional if fails)
+            batch_size: Maximum number of resumes per Gemini call
+            
+        Returns:
+            List of parse results in the same order as texts
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        parseable = []
+        for index, resume_text in enumerate(texts):
+            if is_parseable_text(resume_text):
+                parseable.append(index)
+            else:
+                logger.warning("Resume text too short to parse")
+                results[index] = self._empty_result(resume_text, 'Resume text too short to parse')
+        
+        gemini_results = [None] * len(parseable)
+        if use_gemini and self.gemini_parser.initialized and parseable:
+            try:
+                gemini_results = self.gemini_parser.parse_resumes_batched(
+                    [texts[index] for index in parseable], batch_size=batch_size
+                )
+            except Exception as e:
+                logger.error(f"Gemini AI parsing failed: {e}")
+        
+        for index, gemini_result in zip(parseable, gemini_results):
+            results[index] = self._build_result(texts[index], gemini_result)
+        return results
+    
+    def _new_result(self, resume_text: str) -> Dict[str, Any]:
+        """Create an unsuccessful parse result for the given text"""
+        return {
+            'success': False,
+            'method': 'none',
+            'data': {},
+            'issues': [],
+            'raw_text': resume_text[:500] + '...' if len(resume_text) > 500 else resume_text
+        }
+    
+    def _empty_result(self, resume_text: str, reason: str) -> Dict[str, Any]:
+        """Unsuccessful parse result explaining why parsing was skipped"""
+        result = self._new_result(resume_text)
+        result['issues'] = [reason]
+        return result
+    
+    def _build_result(self, resume_text: str,
+                      gemini_result: Optional[GeminiParsedCandidate]) -> Dict[str, Any]:
+        """Build the parse result from Gemini's output, falling back to traditional parsing"""
+        result = self._new_result(resume_text)
+        
+        if gemini_result is not None:
+            if has_core_fields(gemini_result):  # Structural check for successful parsing
+                # Validate the results
+                issues = self.gemini_parser.validate_parsed_data(gemini_result)
+                
+                result['success'] = True
+                result['method'] = 'gemini'
+                result['data'] = self.convert_to_dict(gemini_result)
+                result['issues'] = issues
+                
+                logger.info("Successfully parsed resume with Gemini AI")
+                return result
+            else:
+                logger.warning("Gemini AI parsing failed - too few fields extracted")
+        
         # Fallback to traditional parsing
         if self.traditional_available:
             try:
@@ -389,19 +1092,6 @@ class HybridResumeParser:
             'languages': ''
         }
 
-def install_gemini_dependency():
-    """Install Google Generative AI library"""
-    import subprocess
-    import sys
-    
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "google-generativeai"])
-        print("✅ Successfully installed google-generativeai")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install google-generativeai: {e}")
-        return False
-
 def test_gemini_parsing():
     """Test function for Gemini parsing"""
     # This would require an actual API key to test
@@ -1,19 +1,32 @@
 """
 HR Automation - Email Configuration
-Updated with user-provided Gmail credentials for direct email sending
+SMTP credentials are read from the environment (or .env) for direct email sending
 """
 
 import os
-from dataclasses import dataclass
-from typing import Dict, Any
-
-@dataclass
+import ssl
+import sys
+import types
+import string
+import smtplib
+import functools
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+@dataclass(slots=True, frozen=True)
 class EmailConfig:
     """Email configuration dataclass"""
-    SMTP_SERVER: str = "smtp.gmail.com"
-    SMTP_PORT: int = 587
-    SMTP_USERNAME: str = "ankitatestuser123@gmail.com"
-    SMTP_PASSWORD: str = "zrgcvwpqzpvfrele"  # App password
+    SMTP_SERVER: str = field(default_factory=lambda: os.environ.get("SMTP_SERVER", "smtp.gmail.com"))
+    SMTP_PORT: int = field(default_factory=lambda: int(os.environ.get("SMTP_PORT", "587")))
+    SMTP_USERNAME: str = field(default_factory=lambda: os.environ.get("SMTP_USERNAME", ""))
+    SMTP_PASSWORD: str = field(default_factory=lambda: os.environ.get("SMTP_PASSWORD", ""))  # App password
     
     # Company information
     COMPANY_NAME: str = "XYZ"
@@ -118,16 +131,109 @@ Phone: {hr_contact_phone}"""
     }
 }
 
+# Templates are read-only configuration; freeze them and intern the names used as lookup keys
+EMAIL_TEMPLATES = types.MappingProxyType({
+    sys.intern(name): types.MappingProxyType(template)
+    for name, template in EMAIL_TEMPLATES.items()
+})
+
+_FORMATTER = string.Formatter()
+
+def _compile_template(text: str) -> List[Tuple[str, str, str, str]]:
+    """Split a format string once into (literal, field_name, conversion, format_spec) parts"""
+    return [
+        (literal, field_name or '', conversion or '', format_spec or '')
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(text)
+    ]
+
+# Pre-parsed subject/body of every template, so rendering is a plain join
+_COMPILED_TEMPLATES = types.MappingProxyType({
+    name: (_compile_template(template['subject']), _compile_template(template['body']))
+    for name, template in EMAIL_TEMPLATES.items()
+})
+
+def _render_compiled(parts: List[Tuple[str, str, str, str]], template_vars: Dict[str, Any]) -> str:
+    """Render pre-parsed template parts; raises KeyError for a missing variable like str.format"""
+    chunks = []
+    for literal, field_name, conversion, format_spec in parts:
+        chunks.append(literal)
+        if field_name:
+            value = template_vars[field_name]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            chunks.append(format(value, format_spec))
+    return ''.join(chunks)
+
+def render_email_template(template_name: str, **template_vars) -> Dict[str, str]:
+    """Render a template's subject and body with the given variables"""
+    if template_name not in _COMPILED_TEMPLATES:
+        raise ValueError(f"Template '{template_name}' not found. Available templates: {list(EMAIL_TEMPLATES.keys())}")
+    
+    subject_parts, body_parts = _COMPILED_TEMPLATES[template_name]
+    return {
+        'subject': _render_compiled(subject_parts, template_vars),
+        'body': _render_compiled(body_parts, template_vars)
+    }
+
+@functools.lru_cache(maxsize=1)
 def get_email_config() -> EmailConfig:
-    """Get email configuration instance"""
+    """Get the shared email configuration, resolved from the environment once"""
     return EmailConfig()
 
-def get_email_template(template_name: str) -> Dict[str, str]:
-    """Get email template by name"""
-    if template_name not in EMAIL_TEMPLATES:
+# Each thread keeps one authenticated SMTP session open across sends
+_smtp_local = threading.local()
+
+def get_smtp_connection(config: Optional[EmailConfig] = None) -> smtplib.SMTP:
+    """Get this thread's SMTP connection, opening it (STARTTLS + login) only when needed"""
+    config = config or get_email_config()
+    
+    server = getattr(_smtp_local, 'smtp', None)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        close_smtp_connection()
+    
+    server = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT, timeout=10)
+    try:
+        server.starttls(context=ssl.create_default_context())
+        server.login(config.SMTP_USERNAME, config.SMTP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    
+    _smtp_local.smtp = server
+    return server
+
+def close_smtp_connection():
+    """Close this thread's SMTP connection, if any"""
+    server = getattr(_smtp_local, 'smtp', None)
+    if server is None:
+        return
+    del _smtp_local.smtp
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+def send_email_message(to_email: str, message: str, config: Optional[EmailConfig] = None):
+    """Send a message over this thread's connection, reconnecting once if the server dropped it"""
+    config = config or get_email_config()
+    try:
+        get_smtp_connection(config).sendmail(config.SMTP_USERNAME, to_email, message)
+    except smtplib.SMTPServerDisconnected:
+        close_smtp_connection()
+        get_smtp_connection(config).sendmail(config.SMTP_USERNAME, to_email, message)
+
+def get_email_template(template_name: str) -> Mapping[str, str]:
+    """Get email template by name (read-only)"""
+    template = EMAIL_TEMPLATES.get(template_name)
+    if template is None:
         raise ValueError(f"Template '{template_name}' not found. Available templates: {list(EMAIL_TEMPLATES.keys())}")
     
-    return EMAIL_TEMPLATES[template_name]
+    return template
 
 def get_available_templates() -> list:
     """Get list of available email templates"""
@@ -3,22 +3,57 @@ LinkedIn Profile Scraper Module
 Extracts candidate information from LinkedIn profile URLs
 """
 
+import os
 import re
+import sys
+import json
+import math
+import queue
+import asyncio
+import hashlib
 import requests
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, asdict
 from urllib.parse import urlparse
 import time
 import random
 
+# Async HTTP client for batched profile fetching
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # Web scraping libraries
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     BS4_AVAILABLE = True
+    # Profile pages are only read for <title> and <meta>; skip building the rest of the tree
+    _HEAD_STRAINER = SoupStrainer(['title', 'meta'])
 except ImportError:
     BS4_AVAILABLE = False
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+    HTML_PARSER = 'lxml'  # C parser backend for BeautifulSoup
+except ImportError:
+    LXML_AVAILABLE = False
+    HTML_PARSER = 'html.parser'
+
+# Multi-pattern skill matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
@@ -33,7 +68,131 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Advertise the best compression the HTTP stack can decode; brotli/zstandard are optional.
+# urllib3 and httpx decode br and zstd with the same libraries, so urllib3's list holds for both.
+try:
+    from urllib3.util.request import ACCEPT_ENCODING as _DECODABLE_ENCODINGS
+except ImportError:
+    _DECODABLE_ENCODINGS = 'gzip,deflate'
+ACCEPT_ENCODING = ', '.join(
+    encoding for encoding in ('zstd', 'br', 'gzip', 'deflate')
+    if encoding in _DECODABLE_ENCODINGS.split(',')
+)
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Batched fetches share one keep-alive pool to www.linkedin.com
+MAX_FETCH_CONCURRENCY = 20
+
+# After </head>, a streamed page's remainder is read off up to this many bytes so the
+# connection goes back to the pool; a longer tail is cheaper to drop with the socket
+MAX_DRAIN_BYTES = 64 * 1024
+
+# LinkedIn rejects bursts of concurrent sessions, so keep the browser pool small
+DEFAULT_DRIVER_POOL_SIZE = 3
+
+# Profile requests allowed per minute across all scraping paths
+LINKEDIN_RATE_LIMIT = int(os.environ.get('LINKEDIN_RATE_LIMIT', '30'))
+
+# Scraped profiles are kept for a week; URL-pattern guesses from pages that loaded
+# without a usable name are retried after a day; transport failures are never cached
+DEFAULT_PROFILE_CACHE_DIR = os.path.join('data', 'linkedin_cache')
+PROFILE_CACHE_TTL = 7 * 86400
+NEGATIVE_CACHE_TTL = 86400
+
+# Extraction methods reported by LinkedInScraper.extract_profile_info_with_method
+SCRAPE_SUCCESS_METHODS = ('api', 'requests', 'selenium')
+URL_PATTERN_METHOD = 'url_pattern'
+FAILED_METHOD = 'failed'
+
+# Expected number of cached profiles; the Bloom filter grows past this if the cache already holds more
+PROFILE_BLOOM_CAPACITY = 10_000
+
+# Patterns used on every profile, compiled once
+_TRAILING_NUM_RE = re.compile(r'-\d+$')
+_USERNAME_CLEAN_RE = re.compile(r'[^A-Za-z0-9_-]')
+# A profile path is exactly /in/<username>, optionally with a trailing slash
+_PROFILE_PATH_RE = re.compile(r'^/in/([^/]+)/?$', re.IGNORECASE)
+LINKEDIN_HOME_URL = 'https://www.linkedin.com/'
+PROFILE_URL_PREFIX = 'https://www.linkedin.com/in/'
+_TITLE_NAME_RE = re.compile(r'^([^|]+)')
+
+# Username separators become spaces in one pass
+_USERNAME_SEP_TABLE = str.maketrans('-_', '  ')
+
+# Common technical skills to look for; interned so every profile shares the same string objects
+COMMON_SKILLS = tuple(map(sys.intern, (
+    'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'PHP', 'Go', 'Rust', 'Swift',
+    'React', 'Angular', 'Vue.js', 'Node.js', 'Django', 'Flask', 'Spring', 'Laravel',
+    'HTML', 'CSS', 'TypeScript', 'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'Linux',
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
+    'REST API', 'GraphQL', 'Microservices', 'DevOps', 'CI/CD', 'Agile', 'Scrum'
+)))
+
+# One alternation scans the text once for every skill; longest first so prefixes don't win
+_SKILLS_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(COMMON_SKILLS, key=len, reverse=True))) + r')\b',
+    re.IGNORECASE
+)
+_SKILL_CANON = {skill.lower(): skill for skill in COMMON_SKILLS}
+
+# Aho-Corasick automaton over the lowercased skills: one linear scan regardless of skill count
+if AHOCORASICK_AVAILABLE:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in COMMON_SKILLS:
+        _SKILL_AUTOMATON.add_word(_skill.lower(), (len(_skill), _skill))
+    _SKILL_AUTOMATON.make_automaton()
+    del _skill
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Same rule as regex \\b: a word character on exactly one side of index"""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+    after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+    return before != after
+
+# Selenium profile selectors, tried in order for each field
+PROFILE_SELECTORS = {
+    'name': [
+        'h1.text-heading-xlarge',
+        'h1.top-card-layout__title',
+        '.pv-text-details__left-panel h1'
+    ],
+    'headline': [
+        '.text-body-medium.break-words',
+        '.top-card-layout__headline',
+        '.pv-text-details__left-panel .text-body-medium'
+    ],
+    'location': [
+        '.text-body-small.inline.t-black--light.break-words',
+        '.top-card-layout__first-subline',
+        '.pv-text-details__left-panel .text-body-small'
+    ],
+}
+
+# Subresources the scraper never reads; blocking them makes profile loads much lighter.
+# Stylesheets stay allowed because innerText depends on them (e.g. visually hidden text).
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.mp4',
+    '*analytics*', '*doubleclick*',
+]
+
+_FLAT_SELECTORS = [selector for selectors in PROFILE_SELECTORS.values() for selector in selectors]
+
+_QUERY_SELECTORS_JS = (
+    "return arguments[0].map(s => { const e = document.querySelector(s); "
+    "return e ? e.innerText.trim() : null; });"
+)
+
+@dataclass(slots=True)
 class LinkedInProfile:
     """Represents a LinkedIn profile data"""
     full_name: str = ""
@@ -44,17 +203,243 @@ class LinkedInProfile:
     current_position: str = ""
     headline: str = ""
     about: str = ""
-    skills: List[str] = None
-    experience: List[Dict[str, str]] = None
-    education: List[Dict[str, str]] = None
-    
-    def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-        if self.experience is None:
-            self.experience = []
-        if self.education is None:
-            self.education = []
+    skills: List[str] = field(default_factory=list)
+    experience: List[Dict[str, str]] = field(default_factory=list)
+    education: List[Dict[str, str]] = field(default_factory=list)
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hex digests: false positives are possible, false negatives are not"""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+    
+    def _positions(self, digest: str) -> List[int]:
+        # Double hashing: two 64-bit halves of the digest generate every bit position
+        raw = bytes.fromhex(digest)
+        h1 = int.from_bytes(raw[:8], 'big')
+        h2 = int.from_bytes(raw[8:16], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, digest: str):
+        positions = self._positions(digest)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, digest: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+class ProfileCache:
+    """Disk cache of scraped profiles keyed by normalized URL, one JSON file per profile"""
+    
+    def __init__(self, cache_dir: str = DEFAULT_PROFILE_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # In-memory filter of cached keys so URLs never seen before skip the disk entirely;
+        # seeded from the cache file names, which are the keys
+        existing = [path.stem for path in self.cache_dir.glob('*.json')]
+        self._seen = BloomFilter(max(PROFILE_BLOOM_CAPACITY, 2 * len(existing)))
+        for key in existing:
+            self._seen.add(key)
+    
+    @staticmethod
+    def _key(linkedin_url: str) -> str:
+        return hashlib.sha256(linkedin_url.encode('utf-8')).hexdigest()
+    
+    def get(self, linkedin_url: str) -> Optional[LinkedInProfile]:
+        """Return the cached profile for a normalized URL, or None if missing or stale"""
+        key = self._key(linkedin_url)
+        if key not in self._seen:
+            return None
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry['expires_at'] < time.time():
+                return None
+            return LinkedInProfile(**entry['profile'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable profile cache entry for {linkedin_url}: {e}")
+            return None
+    
+    def put(self, linkedin_url: str, profile: LinkedInProfile, method: str):
+        """
+        Store a profile; anything but a real scrape expires sooner so it gets retried
+        
+        Args:
+            linkedin_url: Normalized profile URL
+            profile: Extracted profile
+            method: Extraction method that produced the profile
+        """
+        ttl = PROFILE_CACHE_TTL if method in SCRAPE_SUCCESS_METHODS else NEGATIVE_CACHE_TTL
+        entry = {
+            'cached_at': datetime.now(timezone.utc).isoformat(),
+            'expires_at': time.time() + ttl,
+            'profile': asdict(profile)
+        }
+        key = self._key(linkedin_url)
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self._seen.add(key)
+        except OSError as e:
+            logger.warning(f"Failed to write profile cache entry for {linkedin_url}: {e}")
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by the threaded and async scraping paths"""
+    
+    def __init__(self, rate: int, period: float = 60.0):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait until it is actually available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.fill_rate
+    
+    def acquire(self):
+        """Block the calling thread until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+_RATE_LIMITER = TokenBucket(LINKEDIN_RATE_LIMIT)
+
+def read_page_head(chunks) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Incrementally parse HTML chunks, stopping as soon as </head> is reached
+    
+    Args:
+        chunks: Iterable of HTML byte chunks, e.g. response.iter_content()
+        
+    Returns:
+        Tuple of (title text, [(meta property, meta content), ...])
+    """
+    parser = etree.HTMLPullParser(events=('end',))
+    title = ''
+    metas = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if element.tag == 'title':
+                title = element.text or ''
+            elif element.tag == 'meta':
+                metas.append((element.get('property') or '', element.get('content') or ''))
+            elif element.tag == 'head':
+                return title, metas
+    return title, metas
+
+def drain_chunks(chunks, limit: int = MAX_DRAIN_BYTES) -> bool:
+    """
+    Consume what is left of a streamed body so its connection can be reused
+    
+    Args:
+        chunks: The partially consumed chunk iterator
+        limit: Stop (leaving the connection to be closed) after this many bytes
+        
+    Returns:
+        True if the body was read to the end
+    """
+    drained = 0
+    for chunk in chunks:
+        drained += len(chunk)
+        if drained > limit:
+            return False
+    return True
+
+def create_chrome_driver():
+    """Start a headless Chrome driver configured for profile scraping"""
+    # Setup Chrome options
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # Run in background
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.page_load_strategy = 'eager'  # Return once the DOM is ready, not after subresources
+    
+    # Initialize driver
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(15)
+    
+    # Abort media, fonts and trackers at the network layer
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning(f"Could not block heavy requests via DevTools: {e}")
+    return driver
+
+class SeleniumDriverPool:
+    """Pool of reusable headless Chrome drivers, started lazily up to size"""
+    
+    def __init__(self, size: int = DEFAULT_DRIVER_POOL_SIZE):
+        self.size = size
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._starting = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take an idle driver, starting a new one while under size, else wait for one"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            start_new = len(self._drivers) + self._starting < self.size
+            if start_new:
+                self._starting += 1  # Claim the slot before the slow startup
+        
+        if not start_new:
+            return self._idle.get()
+        
+        try:
+            driver = create_chrome_driver()
+            with self._lock:
+                self._drivers.append(driver)
+            return driver
+        finally:
+            with self._lock:
+                self._starting -= 1
+    
+    def release(self, driver):
+        """Return a driver to the pool for the next profile"""
+        self._idle.put(driver)
+    
+    def close(self):
+        """Quit every driver the pool started"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Failed to quit Chrome driver: {e}")
 
 class LinkedInScraper:
     """LinkedIn profile scraper with multiple strategies"""
@@ -65,130 +450,190 @@ class LinkedInScraper:
     def setup_session(self):
         """Setup requests session with proper headers"""
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-    
-    def extract_profile_info(self, linkedin_url: str) -> LinkedInProfile:
+        self.session.headers.update(REQUEST_HEADERS)
+        # Started by the first real fetch, so batched or cached runs never open it
+        self._prewarm_thread = None
+        self._prewarm_lock = threading.Lock()
+    
+    def _start_prewarm(self) -> threading.Thread:
+        """Start pre-warming the LinkedIn connection once and return its thread"""
+        with self._prewarm_lock:
+            if self._prewarm_thread is None:
+                self._prewarm_thread = threading.Thread(target=self._prewarm_connection, daemon=True)
+                self._prewarm_thread.start()
+            return self._prewarm_thread
+    
+    def _prewarm_connection(self):
+        """Open a pooled connection to LinkedIn ahead of the first real request"""
+        try:
+            self.session.head(LINKEDIN_HOME_URL, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"LinkedIn connection pre-warm failed: {e}")
+    
+    def extract_profile_info(self, linkedin_url: str, page_content: Optional[bytes] = None) -> LinkedInProfile:
         """
         Extract information from LinkedIn profile URL
         
         Args:
             linkedin_url: LinkedIn profile URL
+            page_content: Profile HTML already fetched by fetch_many, b'' if that fetch failed (optional)
             
         Returns:
             LinkedInProfile object with extracted information
         """
-        profile = LinkedInProfile()
-        profile.linkedin_url = self.normalize_linkedin_url(linkedin_url)
+        return self.extract_profile_info_with_method(linkedin_url, page_content)[0]
+    
+    def extract_profile_info_with_method(self, linkedin_url: str,
+                                         page_content: Optional[bytes] = None) -> Tuple[LinkedInProfile, str]:
+        """
+        Extract information from LinkedIn profile URL and report how it was obtained
         
-        if not self.is_valid_linkedin_url(linkedin_url):
+        Args:
+            linkedin_url: LinkedIn profile URL
+            page_content: Profile HTML already fetched by fetch_many, b'' if that fetch failed (optional)
+            
+        Returns:
+            (profile, method) where method is 'requests' or 'selenium' for a real scrape,
+            'url_pattern' when a page loaded but only the URL gave a name, and 'failed'
+            when no page could be loaded at all
+        """
+        parsed = self._parse_linkedin_url(linkedin_url)
+        if parsed is None:
             logger.error("Invalid LinkedIn URL format")
-            return profile
+            return LinkedInProfile(linkedin_url=self.normalize_linkedin_url(linkedin_url)), FAILED_METHOD
+        
+        profile = LinkedInProfile(linkedin_url=parsed[0])
+        page_loaded = False
         
         try:
-            # Try different extraction methods
-            success = False
-            
             # Method 1: Try basic web scraping (often blocked)
-            if not success:
-                try:
-                    profile = self.scrape_with_requests(profile)
-                    if profile.full_name:
-                        success = True
-                        logger.info("Successfully scraped with requests method")
-                except Exception as e:
-                    logger.warning(f"Requests method failed: {e}")
+            try:
+                profile, page_loaded = self._scrape_with_requests(profile, page_content)
+                if profile.full_name:
+                    logger.info("Successfully scraped with requests method")
+                    return profile, 'requests'
+            except Exception as e:
+                logger.warning(f"Requests method failed: {e}")
             
             # Method 2: Try with Selenium (more reliable but slower)
-            if not success and SELENIUM_AVAILABLE:
+            if SELENIUM_AVAILABLE:
                 try:
-                    profile = self.scrape_with_selenium(profile)
+                    profile, selenium_loaded = self._scrape_with_selenium(profile)
+                    page_loaded = page_loaded or selenium_loaded
                     if profile.full_name:
-                        success = True
                         logger.info("Successfully scraped with Selenium method")
+                        return profile, 'selenium'
                 except Exception as e:
                     logger.warning(f"Selenium method failed: {e}")
             
             # Method 3: Extract from URL pattern (limited info)
-            if not success:
-                profile = self.extract_from_url_pattern(profile)
-                logger.info("Using URL pattern extraction (limited info)")
-            
-            return profile
+            profile = self.extract_from_url_pattern(profile)
+            logger.info("Using URL pattern extraction (limited info)")
+            return profile, URL_PATTERN_METHOD if page_loaded else FAILED_METHOD
             
         except Exception as e:
             logger.error(f"Error extracting LinkedIn profile: {e}")
-            return profile
+            return profile, FAILED_METHOD
     
-    def scrape_with_requests(self, profile: LinkedInProfile) -> LinkedInProfile:
+    def scrape_with_requests(self, profile: LinkedInProfile,
+                             page_content: Optional[bytes] = None) -> LinkedInProfile:
         """Attempt to scrape using requests (often blocked by LinkedIn)"""
+        return self._scrape_with_requests(profile, page_content)[0]
+    
+    def _scrape_with_requests(self, profile: LinkedInProfile,
+                              page_content: Optional[bytes] = None) -> Tuple[LinkedInProfile, bool]:
+        """scrape_with_requests, also reporting whether the profile page was retrieved"""
+        page_loaded = False
         try:
-            # Add random delay to avoid rate limiting
-            time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(profile.linkedin_url, timeout=10)
-            
-            if response.status_code != 200:
-                logger.warning(f"HTTP {response.status_code} response from LinkedIn")
-                return profile
-            
-            if not BS4_AVAILABLE:
-                logger.warning("BeautifulSoup not available for HTML parsing")
-                return profile
+            head = None
+            if page_content is None:
+                # Resolve DNS and finish the TLS handshake while waiting out the rate limit
+                prewarm = self._start_prewarm()
+                
+                # Stay under the per-minute budget, with a little jitter
+                _RATE_LIMITER.acquire()
+                time.sleep(random.uniform(0, 0.2))
+                
+                # requests.Session isn't thread-safe, so the warm-up must finish first
+                prewarm.join()
+                
+                # Stream the body so reading stops at </head> instead of buffering the whole page
+                with self.session.get(profile.linkedin_url, timeout=10, stream=LXML_AVAILABLE) as response:
+                    if response.status_code != 200:
+                        logger.warning(f"HTTP {response.status_code} response from LinkedIn")
+                        return profile, False
+                    logger.debug(f"Profile page Content-Encoding: {response.headers.get('Content-Encoding')}")
+                    if LXML_AVAILABLE:
+                        chunks = response.iter_content(8192)
+                        head = read_page_head(chunks)
+                        # Closing mid-body drops the socket; a short tail is worth reading off
+                        if not drain_chunks(chunks):
+                            logger.debug("Profile page tail too long to drain, dropping connection")
+                    else:
+                        page_content = response.content
+            elif not page_content:
+                return profile, False  # Batched fetch already failed for this URL
+            page_loaded = True
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if head is None:
+                if LXML_AVAILABLE:
+                    head = read_page_head([page_content])
+                elif BS4_AVAILABLE:
+                    soup = BeautifulSoup(page_content, HTML_PARSER, parse_only=_HEAD_STRAINER)
+                    title = soup.find('title')
+                    # The strained tree holds only title/meta tags
+                    head = (title.text if title else '', [
+                        (meta.get('property', ''), meta.get('content', ''))
+                        for meta in soup.find_all('meta', recursive=False)
+                    ])
+                else:
+                    logger.warning("Neither lxml nor BeautifulSoup available for HTML parsing")
+                    return profile, page_loaded
+            title_text, metas = head
             
             # Extract name from title or meta tags
-            title = soup.find('title')
-            if title and title.text:
+            if title_text:
                 # LinkedIn titles often have format "Name | LinkedIn"
-                name_match = re.search(r'^([^|]+)', title.text.strip())
+                name_match = _TITLE_NAME_RE.search(title_text.strip())
                 if name_match:
                     profile.full_name = name_match.group(1).strip()
             
             # Try to extract other information from meta tags
-            for meta in soup.find_all('meta'):
-                property_name = meta.get('property', '')
-                content = meta.get('content', '')
-                
+            for property_name, content in metas:
                 if 'og:title' in property_name and content:
                     if not profile.full_name:
                         profile.full_name = content.split('|')[0].strip()
                 elif 'og:description' in property_name and content:
                     profile.headline = content[:200]
             
-            return profile
+            return profile, page_loaded
             
         except Exception as e:
             logger.error(f"Requests scraping failed: {e}")
-            return profile
+            return profile, page_loaded
     
-    def scrape_with_selenium(self, profile: LinkedInProfile) -> LinkedInProfile:
-        """Attempt to scrape using Selenium (more reliable but requires Chrome)"""
+    def scrape_with_selenium(self, profile: LinkedInProfile, driver=None) -> LinkedInProfile:
+        """
+        Attempt to scrape using Selenium (more reliable but requires Chrome)
+        
+        Args:
+            profile: Profile to fill in; its linkedin_url is loaded
+            driver: Already running driver, e.g. from SeleniumDriverPool (optional).
+                Without one a driver is started for this call and quit afterwards.
+        """
+        return self._scrape_with_selenium(profile, driver)[0]
+    
+    def _scrape_with_selenium(self, profile: LinkedInProfile, driver=None) -> Tuple[LinkedInProfile, bool]:
+        """scrape_with_selenium, also reporting whether the profile page loaded"""
         if not SELENIUM_AVAILABLE:
             logger.warning("Selenium not available")
-            return profile
+            return profile, False
         
-        driver = None
+        owns_driver = driver is None
+        page_loaded = False
         try:
-            # Setup Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')  # Run in background
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-            
-            # Initialize driver
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(15)
+            if owns_driver:
+                driver = create_chrome_driver()
             
             # Navigate to LinkedIn profile
             driver.get(profile.linkedin_url)
@@ -197,96 +642,61 @@ class LinkedInScraper:
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
+            page_loaded = True
             
             # Extract information
             try:
-                # Extract name
-                name_selectors = [
-                    'h1.text-heading-xlarge',
-                    'h1.top-card-layout__title',
-                    '.pv-text-details__left-panel h1'
-                ]
+                # One script call reads every candidate selector instead of a round-trip per selector
+                texts = driver.execute_script(_QUERY_SELECTORS_JS, _FLAT_SELECTORS)
                 
-                for selector in name_selectors:
-                    try:
-                        name_element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if name_element and name_element.text.strip():
-                            profile.full_name = name_element.text.strip()
-                            break
-                    except:
-                        continue
+                # Walk the flat results group by group, keeping the first usable text
+                found = {}
+                position = 0
+                for group, selectors in PROFILE_SELECTORS.items():
+                    group_texts = texts[position:position + len(selectors)]
+                    position += len(selectors)
+                    for text in group_texts:
+                        if not text:
+                            continue
+                        # Filter out non-location text
+                        if group == 'location' and not any(indicator in text.lower() for indicator in ['city', 'state', 'country', ',']):
+                            continue
+                        found[group] = text
+                        break
                 
-                # Extract headline/current position
-                headline_selectors = [
-                    '.text-body-medium.break-words',
-                    '.top-card-layout__headline',
-                    '.pv-text-details__left-panel .text-body-medium'
-                ]
-                
-                for selector in headline_selectors:
-                    try:
-                        headline_element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if headline_element and headline_element.text.strip():
-                            profile.headline = headline_element.text.strip()
-                            profile.current_position = headline_element.text.strip()
-                            break
-                    except:
-                        continue
-                
-                # Extract location
-                location_selectors = [
-                    '.text-body-small.inline.t-black--light.break-words',
-                    '.top-card-layout__first-subline',
-                    '.pv-text-details__left-panel .text-body-small'
-                ]
-                
-                for selector in location_selectors:
-                    try:
-                        location_element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if location_element and location_element.text.strip():
-                            text = location_element.text.strip()
-                            # Filter out non-location text
-                            if any(indicator in text.lower() for indicator in ['city', 'state', 'country', ',']):
-                                profile.location = text
-                                break
-                    except:
-                        continue
+                if 'name' in found:
+                    profile.full_name = found['name']
+                if 'headline' in found:
+                    profile.headline = found['headline']
+                    profile.current_position = found['headline']
+                if 'location' in found:
+                    profile.location = found['location']
                 
             except Exception as e:
                 logger.warning(f"Error extracting specific elements: {e}")
             
-            return profile
+            return profile, page_loaded
             
         except Exception as e:
             logger.error(f"Selenium scraping failed: {e}")
-            return profile
+            return profile, page_loaded
         
         finally:
-            if driver:
+            if owns_driver and driver:
                 driver.quit()
     
     def extract_from_url_pattern(self, profile: LinkedInProfile) -> LinkedInProfile:
         """Extract basic info from LinkedIn URL pattern"""
         try:
             # Extract username from URL
-            url_parts = profile.linkedin_url.split('/')
-            username = None
-            
-            for i, part in enumerate(url_parts):
-                if part == 'in' and i + 1 < len(url_parts):
-                    username = url_parts[i + 1]
-                    break
+            parsed = self._parse_linkedin_url(profile.linkedin_url)
             
-            if username:
-                # Try to convert username to readable name
-                # Remove common suffixes
-                username = re.sub(r'-\d+$', '', username)  # Remove trailing numbers
-                username = username.replace('-', ' ')
-                username = username.replace('_', ' ')
+            if parsed:
+                # Try to convert username to readable name, dropping trailing numbers
+                username = _TRAILING_NUM_RE.sub('', parsed[1]).translate(_USERNAME_SEP_TABLE)
                 
                 # Capitalize words
-                name_parts = username.split()
-                capitalized_parts = [part.capitalize() for part in name_parts if part.isalpha()]
+                capitalized_parts = [part.capitalize() for part in username.split() if part.isalpha()]
                 
                 if len(capitalized_parts) >= 2:
                     profile.full_name = ' '.join(capitalized_parts[:3])  # Limit to 3 parts
@@ -297,74 +707,115 @@ class LinkedInScraper:
             logger.error(f"URL pattern extraction failed: {e}")
             return profile
     
-    def is_valid_linkedin_url(self, url: str) -> bool:
-        """Validate LinkedIn URL format"""
-        if not url:
-            return False
-        
-        # Normalize URL
-        url = self.normalize_linkedin_url(url)
-        
-        # Check if it's a LinkedIn profile URL
-        linkedin_pattern = re.compile(
-            r'^https?://(?:www\.)?linkedin\.com/in/[A-Za-z0-9_-]+/?$',
-            re.IGNORECASE
-        )
+    @staticmethod
+    def _parse_linkedin_url(url: str) -> Optional[Tuple[str, str]]:
+        """
+        Normalize and validate a LinkedIn profile URL in one pass
         
-        return bool(linkedin_pattern.match(url))
-    
-    def normalize_linkedin_url(self, url: str) -> str:
-        """Normalize LinkedIn URL format"""
-        if not url:
-            return ""
+        Returns:
+            Tuple of (normalized URL, username), or None if it is not a profile URL
+        """
+        # Cheap substring scan rejects most non-profile URLs before any parsing
+        if not url or 'linkedin.com/in/' not in url.lower():
+            return None
         
         # Add https if missing
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        # Parse URL
         parsed = urlparse(url)
         
-        # Ensure it's linkedin.com
-        if 'linkedin.com' not in parsed.netloc.lower():
-            return url  # Return as-is if not LinkedIn
+        # Ensure it's linkedin.com or a subdomain, not a lookalike such as linkedin.com.evil.example
+        host = parsed.hostname or ''
+        if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+            return None
+        
+        path_match = _PROFILE_PATH_RE.match(parsed.path)
+        if not path_match:
+            return None
         
-        # Reconstruct clean URL
-        path_parts = parsed.path.strip('/').split('/')
+        # Query parameters are dropped; usernames recur across pipelines, so share them
+        username = sys.intern(_USERNAME_CLEAN_RE.sub('', path_match.group(1)))
+        if not username:
+            return None
+        return PROFILE_URL_PREFIX + username, username
+    
+    def is_valid_linkedin_url(self, url: str) -> bool:
+        """Validate LinkedIn URL format"""
+        return self._parse_linkedin_url(url) is not None
+    
+    def normalize_linkedin_url(self, url: str) -> str:
+        """Normalize LinkedIn URL format"""
+        if not url:
+            return ""
         
-        if len(path_parts) >= 2 and path_parts[0] == 'in':
-            username = path_parts[1]
-            # Remove any query parameters or extra parts
-            username = re.sub(r'[^A-Za-z0-9_-]', '', username)
-            return f"https://www.linkedin.com/in/{username}"
+        parsed = self._parse_linkedin_url(url)
+        if parsed:
+            return parsed[0]
         
-        return url
+        # Return as-is (with a scheme) if not a LinkedIn profile
+        return url if url.startswith(('http://', 'https://')) else 'https://' + url
     
     def extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from any text content"""
         if not text:
             return []
         
-        # Common technical skills to look for
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'PHP', 'Go', 'Rust', 'Swift',
-            'React', 'Angular', 'Vue.js', 'Node.js', 'Django', 'Flask', 'Spring', 'Laravel',
-            'HTML', 'CSS', 'TypeScript', 'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'Linux',
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
-            'REST API', 'GraphQL', 'Microservices', 'DevOps', 'CI/CD', 'Agile', 'Scrum'
-        ]
-        
-        found_skills = []
+        if not AHOCORASICK_AVAILABLE:
+            found_skills = dict.fromkeys(_SKILL_CANON[match.lower()] for match in _SKILLS_RE.findall(text))
+            return list(found_skills)[:15]  # Limit to 15 skills
+        
+        # Keep whole-word matches only, ordered by where they start in the text
         text_lower = text.lower()
+        matches = []
+        for end, (length, skill) in _SKILL_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, end + 1):
+                matches.append((start, skill))
+        matches.sort()
         
-        for skill in common_skills:
-            if skill.lower() in text_lower:
-                # Check if it's a whole word match
-                if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                    found_skills.append(skill)
+        found_skills = dict.fromkeys(skill for _, skill in matches)
+        return list(found_skills)[:15]  # Limit to 15 skills
+
+async def fetch_many(urls: List[str], concurrency: int = MAX_FETCH_CONCURRENCY) -> List[Optional[bytes]]:
+    """
+    Fetch several LinkedIn pages concurrently over one pooled HTTP/2 client
+    
+    Args:
+        urls: Normalized profile URLs
+        concurrency: Maximum number of requests in flight
+        
+    Returns:
+        Page bodies in the same order as urls, None where the fetch failed
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    
+    async with httpx.AsyncClient(limits=limits, http2=True, timeout=10.0,
+                                 headers=REQUEST_HEADERS, follow_redirects=True) as client:
+        # Establish the HTTP/2 connection once so the batch multiplexes over it
+        # instead of every request racing to open its own
+        try:
+            await client.head(LINKEDIN_HOME_URL)
+        except httpx.HTTPError as e:
+            logger.debug(f"LinkedIn connection pre-warm failed: {e}")
         
-        return found_skills[:15]  # Limit to 15 skills
+        async def bounded_get(url: str) -> Optional[bytes]:
+            try:
+                async with semaphore:
+                    await _RATE_LIMITER.acquire_async()
+                    await asyncio.sleep(random.uniform(0, 0.2))
+                    response = await client.get(url)
+            except httpx.HTTPError as e:
+                logger.warning(f"Request to {url} failed: {e}")
+                return None
+            if response.status_code != 200:
+                logger.warning(f"HTTP {response.status_code} response from LinkedIn")
+                return None
+            logger.debug(f"Profile page Content-Encoding: {response.headers.get('Content-Encoding')}")
+            return response.content
+        
+        return list(await asyncio.gather(*(bounded_get(url) for url in urls)))
 
 class LinkedInAPIClient:
     """
@@ -397,38 +848,63 @@ class LinkedInAPIClient:
 class LinkedInProfileExtractor:
     """Main class that combines different extraction methods"""
     
-    def __init__(self, use_selenium: bool = False, api_client: LinkedInAPIClient = None):
+    def __init__(self, use_selenium: bool = False, api_client: LinkedInAPIClient = None,
+                 cache_dir: Optional[str] = DEFAULT_PROFILE_CACHE_DIR):
         self.scraper = LinkedInScraper()
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
         self.api_client = api_client
+        self.cache = ProfileCache(cache_dir) if cache_dir else None
+    
+    def _get_cached(self, normalized_url: str) -> Optional[LinkedInProfile]:
+        """Look a normalized profile URL up in the profile cache"""
+        if not self.cache:
+            return None
+        profile = self.cache.get(normalized_url)
+        if profile is not None:
+            logger.info("Using cached LinkedIn profile")
+        return profile
+    
+    def _store_cached(self, normalized_url: str, profile: LinkedInProfile, method: str):
+        """Cache a profile unless it came from a failed fetch, which should be retried next time"""
+        if self.cache and method != FAILED_METHOD:
+            self.cache.put(normalized_url, profile, method)
         
-    def extract_profile(self, linkedin_url: str) -> LinkedInProfile:
+    def extract_profile(self, linkedin_url: str, page_content: Optional[bytes] = None) -> LinkedInProfile:
         """
         Extract profile information using best available method
         
         Args:
             linkedin_url: LinkedIn profile URL
+            page_content: Profile HTML already fetched by fetch_many (optional)
             
         Returns:
             LinkedInProfile object with extracted information
         """
         try:
             # Validate URL
-            if not self.scraper.is_valid_linkedin_url(linkedin_url):
+            parsed = self.scraper._parse_linkedin_url(linkedin_url)
+            if parsed is None:
                 logger.error("Invalid LinkedIn URL format")
                 return LinkedInProfile(linkedin_url=linkedin_url)
+            normalized_url = parsed[0]
+            
+            cached = self._get_cached(normalized_url)
+            if cached is not None:
+                return cached
             
             # Try API first if available
             if self.api_client and self.api_client.access_token:
                 try:
                     profile = self.api_client.get_profile_by_url(linkedin_url)
                     if profile.full_name:
+                        self._store_cached(normalized_url, profile, 'api')
                         return profile
                 except Exception as e:
                     logger.warning(f"API method failed: {e}")
             
             # Try scraping methods
-            profile = self.scraper.extract_profile_info(linkedin_url)
+            profile, method = self.scraper.extract_profile_info_with_method(normalized_url, page_content)
+            self._store_cached(normalized_url, profile, method)
             
             return profile
             
@@ -436,26 +912,107 @@ class LinkedInProfileExtractor:
             logger.error(f"Profile extraction failed: {e}")
             return LinkedInProfile(linkedin_url=linkedin_url)
     
+    def extract_profiles(self, linkedin_urls: List[str]) -> List[LinkedInProfile]:
+        """
+        Extract several profiles, fetching all pages concurrently in one event loop
+        
+        Args:
+            linkedin_urls: LinkedIn profile URLs
+            
+        Returns:
+            LinkedInProfile objects in the same order as linkedin_urls
+        """
+        pages: List[Optional[bytes]] = [None] * len(linkedin_urls)
+        
+        if HTTPX_AVAILABLE:
+            # Only fetch valid URLs that extract_profile won't answer from the cache
+            valid = []
+            fetch_urls = []
+            for index, url in enumerate(linkedin_urls):
+                parsed = self.scraper._parse_linkedin_url(url)
+                if parsed and self._get_cached(parsed[0]) is None:
+                    valid.append(index)
+                    fetch_urls.append(parsed[0])
+            if fetch_urls:
+                try:
+                    fetched = asyncio.run(fetch_many(fetch_urls))
+                    for index, page_content in zip(valid, fetched):
+                        # b'' marks a failed fetch so it is not retried one request at a time
+                        pages[index] = page_content if page_content is not None else b''
+                except Exception as e:
+                    logger.warning(f"Batched fetch failed, fetching profiles individually: {e}")
+        
+        return [self.extract_profile(url, page_content) for url, page_content in zip(linkedin_urls, pages)]
+    
+    def extract_profiles_selenium(self, linkedin_urls: List[str],
+                                  pool_size: int = DEFAULT_DRIVER_POOL_SIZE) -> List[LinkedInProfile]:
+        """
+        Extract several profiles with Selenium, reusing a small pool of browsers
+        
+        Args:
+            linkedin_urls: LinkedIn profile URLs
+            pool_size: Number of Chrome drivers (and worker threads) to run
+            
+        Returns:
+            LinkedInProfile objects in the same order as linkedin_urls
+        """
+        if not SELENIUM_AVAILABLE:
+            logger.warning("Selenium not available, falling back to standard extraction")
+            return [self.extract_profile(url) for url in linkedin_urls]
+        
+        pool = SeleniumDriverPool(pool_size)
+        
+        def scrape_one(linkedin_url: str) -> LinkedInProfile:
+            parsed = self.scraper._parse_linkedin_url(linkedin_url)
+            if parsed is None:
+                logger.error("Invalid LinkedIn URL format")
+                return LinkedInProfile(linkedin_url=linkedin_url)
+            normalized_url = parsed[0]
+            
+            cached = self._get_cached(normalized_url)
+            if cached is not None:
+                return cached
+            
+            profile = LinkedInProfile(linkedin_url=normalized_url)
+            driver = pool.acquire()
+            try:
+                # Share the rate budget, with jitter so pooled browsers don't hit LinkedIn in lockstep
+                _RATE_LIMITER.acquire()
+                time.sleep(random.uniform(0.5, 1.5))
+                profile, page_loaded = self.scraper._scrape_with_selenium(profile, driver)
+            finally:
+                pool.release(driver)
+            
+            if profile.full_name:
+                method = 'selenium'
+            else:
+                profile = self.scraper.extract_from_url_pattern(profile)
+                method = URL_PATTERN_METHOD if page_loaded else FAILED_METHOD
+            self._store_cached(normalized_url, profile, method)
+            return profile
+        
+        try:
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                return list(executor.map(scrape_one, linkedin_urls))
+        finally:
+            pool.close()
+    
     def extract_basic_info_from_url(self, linkedin_url: str) -> Dict[str, str]:
         """
         Extract basic information that can be inferred from URL
         This is a fallback when scraping fails
         """
         try:
-            normalized_url = self.scraper.normalize_linkedin_url(linkedin_url)
-            
-            # Extract username
-            username = ""
-            url_parts = normalized_url.split('/')
-            for i, part in enumerate(url_parts):
-                if part == 'in' and i + 1 < len(url_parts):
-                    username = url_parts[i + 1]
-                    break
+            parsed = self.scraper._parse_linkedin_url(linkedin_url)
+            if parsed:
+                normalized_url, username = parsed
+            else:
+                normalized_url, username = self.scraper.normalize_linkedin_url(linkedin_url), ""
             
             # Convert username to potential name
             name = ""
             if username:
-                name_parts = username.replace('-', ' ').replace('_', ' ').split()
+                name_parts = username.translate(_USERNAME_SEP_TABLE).split()
                 name_parts = [part.capitalize() for part in name_parts if part.isalpha()]
                 if len(name_parts) >= 2:
                     name = ' '.join(name_parts[:3])
@@ -477,9 +1034,12 @@ class LinkedInProfileExtractor:
         """Get list of available extraction methods"""
         methods = ['url_pattern']
         
-        if BS4_AVAILABLE:
+        if BS4_AVAILABLE or LXML_AVAILABLE:
             methods.append('requests_scraping')
         
+        if (BS4_AVAILABLE or LXML_AVAILABLE) and HTTPX_AVAILABLE:
+            methods.append('batched_async_scraping')
+        
         if SELENIUM_AVAILABLE:
             methods.append('selenium_scraping')
         
@@ -492,16 +1052,20 @@ def install_dependencies():
     
     dependencies = [
         "requests",
+        "httpx[http2]",
         "beautifulsoup4",
+        "lxml",
+        "brotli",
+        "zstandard",
         "selenium"
     ]
     
-    for dep in dependencies:
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
-            print(f"✅ Installed {dep}")
-        except Exception as e:
-            print(f"❌ Failed to install {dep}: {e}")
+    # One pip run resolves everything together instead of starting pip per package
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *dependencies])
+        print(f"✅ Installed {', '.join(dependencies)}")
+    except Exception as e:
+        print(f"❌ Failed to install {', '.join(dependencies)}: {e}")
     
     print("\n📋 Additional Setup Required:")
     print("For Selenium scraping, you need to:")
@@ -7,17 +7,18 @@ import os
 import sys
 import json
 import argparse
-from datetime import datetime
-from dotenv import load_dotenv
+from functools import lru_cache
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from hr_agent import HRRecruitmentAgent
-from reporting import ReportGenerator
+# Heavy modules (hr_agent, reporting, dotenv) are imported inside the functions that
+# need them, so --help and the web launcher start without loading them
 
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from environment variables"""
+    """Load configuration from environment variables (parsed once per process)"""
+    from dotenv import load_dotenv
     load_dotenv()
     
     config = {
@@ -34,10 +35,29 @@ def load_config():
     
     return config
 
+def write_json(data):
+    """Write data to stdout as indented JSON, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        print(json.dumps(data, indent=2, default=str))
+        return
+    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(
+        data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    ))
+    sys.stdout.buffer.flush()
+
+@lru_cache(maxsize=1)
+def get_agent():
+    """Get the process-wide HR agent, built on first use"""
+    from hr_agent import HRRecruitmentAgent
+    return HRRecruitmentAgent(load_config())
+
 def process_job_command(args):
     """Process job-related commands"""
-    config = load_config()
-    agent = HRRecruitmentAgent(config)
+    agent = get_agent()
     
     if args.action == 'add':
         if not args.description:
@@ -62,8 +82,7 @@ def process_job_command(args):
 
 def source_candidates_command(args):
     """Source candidates for a job"""
-    config = load_config()
-    agent = HRRecruitmentAgent(config)
+    agent = get_agent()
     
     job_id = args.job_id
     max_candidates = args.max_candidates or 20
@@ -88,8 +107,7 @@ def source_candidates_command(args):
 
 def run_outreach_command(args):
     """Run outreach campaign"""
-    config = load_config()
-    agent = HRRecruitmentAgent(config)
+    agent = get_agent()
     
     job_id = args.job_id
     min_score = args.min_score or 0.7
@@ -124,8 +142,10 @@ def run_outreach_command(args):
 
 def generate_report_command(args):
     """Generate reports"""
-    config = load_config()
-    agent = HRRecruitmentAgent(config)
+    from datetime import datetime
+    from reporting import ReportGenerator
+    
+    agent = get_agent()
     report_gen = ReportGenerator(agent)
     
     if args.type == 'daily':
@@ -133,7 +153,7 @@ def generate_report_command(args):
         report = agent.generate_daily_report(date)
         
         if args.format == 'json':
-            print(json.dumps(report, indent=2, default=str))
+            write_json(report)
         else:
             # Table format
             print(f"\n📊 Daily Report for {date}")
@@ -207,7 +227,14 @@ def main():
         generate_report_command(args)
     elif args.command == 'web':
         print("🚀 Launching web interface...")
-        os.system("streamlit run src/streamlit_app.py")
+        sys.stdout.flush()  # exec replaces the process without flushing Python's buffers
+        app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'streamlit_app.py')
+        try:
+            # Replace this process with Streamlit instead of forking a shell for it
+            os.execvp("streamlit", ["streamlit", "run", app_path])
+        except FileNotFoundError:
+            print("❌ Error: streamlit not found. Install it with: pip install streamlit")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
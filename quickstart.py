@@ -6,103 +6,574 @@ This script helps you get started quickly with sample data
 
 import os
 import sys
-import json
-from dotenv import load_dotenv
+import importlib.util
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-def check_prerequisites():
-    """Check if all prerequisites are met"""
-    print("🔍 Checking prerequisites...")
+ENV_PATH = '.env'
+
+def _env_signature(path=ENV_PATH):
+    """Return (path, mtime_ns, size) for the env file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4)
+def _load_env(path, mtime_ns, size):
+    """Parse an env file; keyed on its stat so it is re-read only after it changes"""
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        # Reported by the prerequisite checks
+        return {}
+    return dotenv_values(path)
+
+def env(key, default=None):
+    """
+    Look up a setting, preferring the process environment over .env
+    
+    Args:
+        key: Variable name
+        default: Value returned when the variable is set in neither place
+        
+    Returns:
+        The configured value or default
+    """
+    value = os.environ.get(key)
+    if value is None:
+        signature = _env_signature()
+        if signature is not None:
+            value = _load_env(*signature).get(key)
+    return default if value is None else value
+
+@contextmanager
+def buffered_output():
+    """Coalesce a phase's messages into a single write instead of one per line"""
+    line_buffering = getattr(sys.stdout, 'line_buffering', False)
+    if line_buffering:
+        sys.stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        if line_buffering:
+            sys.stdout.reconfigure(line_buffering=True)
+
+def ask_yes_no(question, env_var):
+    """
+    Ask a yes/no question, answering from an environment variable when stdin is not a terminal
+    
+    Args:
+        question: Prompt shown to an interactive user
+        env_var: Variable consulted instead of prompting under CI or Docker
+        
+    Returns:
+        True for a yes answer
+    """
+    if not sys.stdin.isatty():
+        answer = (env(env_var) or '').lower().strip()
+        print(f"{question}{answer or 'n'} (from {env_var})")
+        return answer in ('1', 'y', 'yes', 'true')
+    return input(question).lower().strip() in ('y', 'yes')
+
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    """Settings shared by the prerequisite checks and the sample data setup"""
+    google_api_key: Optional[str]
+    ollama_host: str
+    ollama_model: str
+    database_path: str
+
+@lru_cache(maxsize=4)
+def _build_config(env_signature):
+    """Read the agent settings; env_signature only keys the cache"""
+    return AgentConfig(
+        google_api_key=env('GOOGLE_API_KEY'),
+        ollama_host=env('OLLAMA_HOST', 'http://localhost:11434'),
+        ollama_model=env('OLLAMA_MODEL', 'llama3.1:8b'),
+        database_path=env('DATABASE_PATH', './data/hr_recruitment.db')
+    )
+
+def get_config():
+    """Return the agent settings, rebuilt only when the env file has changed"""
+    return _build_config(_env_signature())
+
+@lru_cache(maxsize=1)
+def get_http_session():
+    """Return one pooled session so every Ollama call reuses the same connection"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Model inventory kept between runs and invalidated when the Ollama server version changes
+OLLAMA_MODELS_CACHE = os.path.join('.hr_agent_cache', 'models.json')
+
+def _read_models_cache(host, version):
+    """Return the cached model names for host at version, or None"""
+    import json
+    try:
+        with open(OLLAMA_MODELS_CACHE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('_host') != host or cached.get('_version') != version:
+        return None
+    return frozenset(cached.get('models', []))
+
+def _write_models_cache(host, version, model_names):
+    """Atomically replace the cached model names"""
+    import json
+    os.makedirs(os.path.dirname(OLLAMA_MODELS_CACHE), exist_ok=True)
+    tmp_path = OLLAMA_MODELS_CACHE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'_host': host, '_version': version, 'models': sorted(model_names)}, f)
+    os.replace(tmp_path, OLLAMA_MODELS_CACHE)
+
+@lru_cache(maxsize=2)
+def list_ollama_models(host, refresh=False):
+    """
+    Return the names of the models pulled on an Ollama server
+    
+    GET /api/version proves the server is up. The model list comes from the
+    on-disk cache while the server version is unchanged, else from /api/tags.
+    
+    Args:
+        host: Ollama base URL
+        refresh: Ignore the on-disk cache
+        
+    Returns:
+        Frozenset of model names
+    """
+    base_url = host.rstrip('/')
+    session = get_http_session()
+    response = session.get(f"{base_url}/api/version", timeout=5)
+    response.raise_for_status()
+    version = response.json()['version']
+    
+    if not refresh:
+        cached = _read_models_cache(host, version)
+        if cached is not None:
+            return cached
+    
+    response = session.get(f"{base_url}/api/tags", timeout=5)
+    response.raise_for_status()
+    model_names = frozenset(model['name'] for model in response.json()['models'])
+    try:
+        _write_models_cache(host, version, model_names)
+    except OSError:
+        pass
+    return model_names
+
+def preload_ollama_model(host, model_name):
+    """
+    Load a model into Ollama memory and keep it resident
+    
+    keep_alive=-1 stops Ollama unloading the model between the sample
+    pipeline's LLM calls, so each call skips the reload and prompt prefill.
     
-    # Check if .env file exists
-    if not os.path.exists('.env'):
+    Args:
+        host: Ollama base URL
+        model_name: Model to load
+        
+    Returns:
+        True if the model was loaded
+    """
+    import requests
+    try:
+        response = get_http_session().post(
+            f"{host.rstrip('/')}/api/generate",
+            json={"model": model_name, "prompt": "", "keep_alive": -1},
+            timeout=120
+        )
+        response.raise_for_status()
+        return True
+    except requests.RequestException as e:
+        print(f"⚠️ Could not preload Ollama model {model_name}: {e}")
+        return False
+
+def pull_ollama_model(host, model_name):
+    """
+    Pull a model onto an Ollama server, printing progress as it streams in
+    
+    Args:
+        host: Ollama base URL
+        model_name: Model to pull
+        
+    Returns:
+        True if the pull completed
+    """
+    import json
+    import requests
+    last_line = None
+    try:
+        with get_http_session().post(
+            f"{host.rstrip('/')}/api/pull",
+            json={"model": model_name, "stream": True},
+            stream=True,
+            timeout=(5, None)
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                progress = json.loads(line)
+                if 'error' in progress:
+                    print(f"\n❌ Pull failed: {progress['error']}")
+                    return False
+                
+                status = progress.get('status', '')
+                if progress.get('total'):
+                    percent = progress.get('completed', 0) * 100 // progress['total']
+                    status = f"{status} {percent}%"
+                if status != last_line:
+                    print(f"\r  📥 {status:<70}", end='', flush=True)
+                    last_line = status
+        print()
+        return last_line == 'success'
+    except (requests.RequestException, ValueError) as e:
+        print(f"\n❌ Error pulling Ollama model {model_name}: {e}")
+        return False
+
+def _check_env_file(config):
+    """Check that the .env file exists"""
+    if not os.path.exists(ENV_PATH):
         print("❌ .env file not found")
         print("📝 Please copy .env.example to .env and add your API keys")
         return False
-    
-    # Load environment variables
-    load_dotenv()
-    
-    # Check Google API key
-    if not os.getenv('GOOGLE_API_KEY'):
+    return True
+
+def _check_dotenv_installed(config):
+    """Probe for python-dotenv without importing it"""
+    if importlib.util.find_spec('dotenv') is None:
+        print("❌ python-dotenv not installed")
+        print("📦 Please install dependencies with: pip install -r requirements.txt")
+        return False
+    return True
+
+def _check_google_key(config):
+    """Check that the Google API key is configured"""
+    if not config.google_api_key:
         print("❌ GOOGLE_API_KEY not found in .env file")
         print("📝 Please add your Google Gemini API key to the .env file")
         return False
-    
-    # Check if Ollama is running
+    return True
+
+def _check_ollama(config):
+    """Check that Ollama is running and the required model is available"""
+    import requests
     try:
-        import requests
-        response = requests.get(os.getenv('OLLAMA_HOST', 'http://localhost:11434'), timeout=5)
-        print("✅ Ollama is running")
-    except:
+        model_names = list_ollama_models(config.ollama_host)
+        if config.ollama_model not in model_names:
+            # The cached inventory may predate a manual `ollama pull`
+            model_names = list_ollama_models(config.ollama_host, refresh=True)
+    except (requests.ConnectionError, requests.Timeout):
         print("❌ Ollama not running or not accessible")
         print("🚀 Please start Ollama with: ollama serve")
         return False
-    
-    # Check if required model is available
-    try:
-        import ollama
-        client = ollama.Client(host=os.getenv('OLLAMA_HOST', 'http://localhost:11434'))
-        models = client.list()
-        model_name = os.getenv('OLLAMA_MODEL', 'llama3.1:8b')
-        
-        if any(model['name'] == model_name for model in models['models']):
-            print(f"✅ Ollama model {model_name} is available")
-        else:
-            print(f"❌ Ollama model {model_name} not found")
-            print(f"📥 Please pull the model with: ollama pull {model_name}")
-            return False
-    except Exception as e:
+    except (requests.RequestException, KeyError, TypeError, ValueError) as e:
         print(f"❌ Error checking Ollama models: {e}")
         return False
+    print("✅ Ollama is running")
+    
+    model_name = config.ollama_model
+    if model_name in model_names:
+        print(f"✅ Ollama model {model_name} is available")
+        return True
     
-    print("✅ All prerequisites met!")
+    print(f"❌ Ollama model {model_name} not found")
+    if not ask_yes_no(f"📥 Would you like to pull {model_name} now? (y/n): ", 'QUICKSTART_PULL_MODEL'):
+        print(f"📥 Please pull the model with: ollama pull {model_name}")
+        return False
+    
+    host = config.ollama_host
+    if not pull_ollama_model(host, model_name):
+        return False
+    print(f"✅ Ollama model {model_name} pulled")
+    
+    # Load the fresh model now so the first real request does not pay for it
+    preload_ollama_model(host, model_name)
     return True
 
-def setup_sample_data():
-    """Set up the system with sample data"""
-    print("📊 Setting up sample data...")
+# Cheapest checks first so a local misconfiguration never waits on the network
+PREREQUISITE_CHECKS = (_check_env_file, _check_dotenv_installed, _check_google_key, _check_ollama)
+
+# Written after a successful check so later runs can skip the Ollama probes
+PREREQUISITES_MARKER = '.quickstart_ok'
+
+def _prerequisites_fingerprint(config):
+    """Hash the .env state, API key presence and Ollama settings a passed check depends on, or None if unavailable"""
+    signature = _env_signature()
+    if signature is None or importlib.util.find_spec('dotenv') is None:
+        return None
     
-    try:
-        from hr_agent import HRRecruitmentAgent
-        
-        # Load configuration
-        load_dotenv()
-        config = {
-            'google_api_key': os.getenv('GOOGLE_API_KEY'),
-            'ollama_host': os.getenv('OLLAMA_HOST', 'http://localhost:11434'),
-            'ollama_model': os.getenv('OLLAMA_MODEL', 'llama3.1:8b'),
-            'database_path': os.getenv('DATABASE_PATH', './data/hr_recruitment.db')
-        }
+    import hashlib
+    # The key may come from the process environment, which the .env stat doesn't cover
+    has_google_key = bool(config.google_api_key)
+    state = f"{signature[1]}|{signature[2]}|{has_google_key}|{config.ollama_model}|{config.ollama_host}"
+    return hashlib.sha256(state.encode()).hexdigest()
+
+def check_prerequisites(config, force=False):
+    """
+    Check if all prerequisites are met, stopping at the first failure
+    
+    Args:
+        config: Agent settings from get_config()
+        force: Run every check even if a previous run passed with the same settings
         
-        # Initialize agent
-        agent = HRRecruitmentAgent(config)
+    Returns:
+        True if all prerequisites are met
+    """
+    marker = Path(PREREQUISITES_MARKER)
+    if not force:
+        fingerprint = _prerequisites_fingerprint(config)
+        if fingerprint and marker.is_file() and marker.read_text().strip() == fingerprint:
+            print("✅ Prerequisites already verified with these settings (use --force-check to re-run)")
+            return True
+    
+    with buffered_output():
+        print("🔍 Checking prerequisites...")
         
-        # Load sample job descriptions
-        with open('templates/sample_job_descriptions.json', 'r') as f:
-            sample_jobs = json.load(f)
+        if not all(check(config) for check in PREREQUISITE_CHECKS):
+            marker.unlink(missing_ok=True)
+            return False
         
-        # Add first sample job
-        first_job = sample_jobs['job_descriptions'][0]
-        job_id = agent.process_job_description(first_job['description'], first_job['company'])
+        fingerprint = _prerequisites_fingerprint(config)
+        if fingerprint:
+            marker.write_text(fingerprint)
+        print("✅ All prerequisites met!")
+    return True
+
+def load_first_sample_job(path='templates/sample_job_descriptions.json'):
+    """
+    Decode only the first entry of the sample job_descriptions array
+    
+    Args:
+        path: Sample job descriptions JSON file
         
-        print(f"✅ Added sample job: {first_job['title']} (ID: {job_id})")
+    Returns:
+        The first job description dict
+    """
+    import re
+    import json
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    
+    # Jump to the first array element and stop decoding once it is complete
+    key = text.find('"job_descriptions"')
+    start = text.find('[', key) + 1 if key != -1 else 0
+    if start:
+        decoder = json.JSONDecoder()
+        first = re.compile(r'\s*').match(text, start).end()
+        try:
+            first_job, _ = decoder.raw_decode(text, first)
+            if isinstance(first_job, dict):
+                return first_job
+        except json.JSONDecodeError:
+            pass
+    return json.loads(text)['job_descriptions'][0]
+
+# A long-lived agent process that quickstart hands work to, so repeat runs skip
+# importing hr_agent, opening the database and loading the Ollama model
+# Windows has no Unix sockets, so it listens on loopback; HR_AGENT_DAEMON_PORT moves it
+AGENT_DAEMON_ADDRESS = (('127.0.0.1', int(os.environ.get('HR_AGENT_DAEMON_PORT', 47821)))
+                        if sys.platform == 'win32'
+                        else os.path.join(os.path.expanduser('~'), '.hr_agent.sock'))
+AGENT_DAEMON_KEY_PATH = os.path.join(os.path.expanduser('~'), '.hr_agent.key')
+AGENT_DAEMON_METHODS = frozenset({'run_pipeline', 'generate_daily_report', 'get_pipeline_status'})
+AGENT_DAEMON_SHUTDOWN = 'shutdown'
+
+def _daemon_authkey(create=False):
+    """Read the daemon's shared secret, or write a fresh owner-only one when create is set"""
+    if create:
+        import secrets
+        authkey = secrets.token_bytes(32)
+        # O_CREAT's mode only applies to new files, so replace any old key outright
+        try:
+            os.remove(AGENT_DAEMON_KEY_PATH)
+        except FileNotFoundError:
+            pass
+        fd = os.open(AGENT_DAEMON_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(authkey)
+        return authkey
+    try:
+        with open(AGENT_DAEMON_KEY_PATH, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _connect_to_daemon():
+    """Return a connection to a running agent daemon, or None"""
+    authkey = _daemon_authkey()
+    if authkey is None:
+        return None
+    from multiprocessing import AuthenticationError
+    from multiprocessing.connection import Client
+    try:
+        return Client(AGENT_DAEMON_ADDRESS, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+def call_agent_daemon(method, **kwargs):
+    """
+    Run an HRRecruitmentAgent method in the agent daemon
+    
+    Args:
+        method: One of AGENT_DAEMON_METHODS
+        **kwargs: Keyword arguments for the method
         
-        # Source some candidates
-        print("🔎 Sourcing sample candidates...")
-        candidates = agent.source_candidates(job_id, 10)
-        print(f"✅ Sourced {len(candidates)} candidates")
+    Returns:
+        The method's result, or None if no daemon is running
+    """
+    conn = _connect_to_daemon()
+    if conn is None:
+        return None
+    with conn:
+        conn.send((method, kwargs))
+        status, payload = conn.recv()
+    if status == 'error':
+        raise RuntimeError(f"Agent daemon: {payload}")
+    return payload
+
+def stop_agent_daemon():
+    """
+    Ask a running agent daemon to shut down
+    
+    Returns:
+        True if a daemon was running and acknowledged the request
+    """
+    try:
+        return call_agent_daemon(AGENT_DAEMON_SHUTDOWN) is not None
+    except (OSError, EOFError):
+        return False
+
+def _remove_stale_socket(address):
+    """Unlink a Unix socket file left by a daemon that exited without cleaning up"""
+    if not isinstance(address, str) or not os.path.exists(address):
+        return
+    import socket
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(address)
+    except ConnectionRefusedError:
+        # Nothing is accepting on it, so bind() would fail on a dead file
+        os.remove(address)
+    except OSError:
+        pass
+    else:
+        raise RuntimeError(f"Another process is listening on {address}")
+    finally:
+        probe.close()
+
+def serve_agent(agent):
+    """
+    Serve agent calls on AGENT_DAEMON_ADDRESS until a shutdown call or Ctrl+C
+    
+    Args:
+        agent: Object exposing the AGENT_DAEMON_METHODS
+    """
+    from multiprocessing import AuthenticationError
+    from multiprocessing.connection import Listener
+    
+    _remove_stale_socket(AGENT_DAEMON_ADDRESS)
+    authkey = _daemon_authkey(create=True)
+    try:
+        # Closing the listener also unlinks its Unix socket file
+        with Listener(AGENT_DAEMON_ADDRESS, authkey=authkey) as listener:
+            print(f"🛰️ Agent daemon listening on {AGENT_DAEMON_ADDRESS} (Ctrl+C or --stop-daemon to stop)")
+            running = True
+            while running:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                with conn:
+                    try:
+                        method, kwargs = conn.recv()
+                        if method == AGENT_DAEMON_SHUTDOWN:
+                            running = False
+                            response = ('ok', True)
+                        elif method not in AGENT_DAEMON_METHODS:
+                            raise ValueError(f"Unsupported call: {method}")
+                        else:
+                            response = ('ok', getattr(agent, method)(**kwargs))
+                    except (OSError, EOFError):
+                        continue
+                    except Exception as e:
+                        response = ('error', str(e))
+                    try:
+                        conn.send(response)
+                    except (OSError, EOFError):
+                        pass
+        print("👋 Agent daemon stopped")
+    except KeyboardInterrupt:
+        print("\n👋 Agent daemon stopped")
+    finally:
+        if os.path.exists(AGENT_DAEMON_KEY_PATH):
+            os.remove(AGENT_DAEMON_KEY_PATH)
+
+def run_agent_daemon(config):
+    """Hold one agent with its model loaded and serve calls over a local socket until stopped"""
+    existing = _connect_to_daemon()
+    if existing is not None:
+        existing.close()
+        print(f"✅ Agent daemon already running on {AGENT_DAEMON_ADDRESS}")
+        return
+    
+    from hr_agent import HRRecruitmentAgent
+    
+    agent = HRRecruitmentAgent(asdict(config))
+    preload_ollama_model(config.ollama_host, config.ollama_model)
+    serve_agent(agent)
+
+def setup_sample_data(config):
+    """Set up the system with sample data using the settings checked by check_prerequisites"""
+    print("📊 Setting up sample data...")
+    
+    try:
+        # Add the first sample job, source candidates, draft outreach and report in one pass
+        first_job = load_first_sample_job()
+        pipeline_args = {
+            'job_description': first_job['description'],
+            'company': first_job['company'],
+            'max_candidates': 10,
+            'min_match_score': 0.5,
+            'max_outreach': 3
+        }
         
-        # Generate sample outreach
-        print("📧 Generating sample outreach...")
-        campaigns = agent.generate_outreach_campaigns(job_id, 0.5, 3)
-        print(f"✅ Generated {len(campaigns)} outreach emails")
+        # A running agent daemon already has the agent and model loaded
+        results = call_agent_daemon('run_pipeline', **pipeline_args)
+        if results is not None:
+            print("🛰️ Sample pipeline ran in the agent daemon")
+        else:
+            # Load the Ollama model in the background while the agent is imported and
+            # Gemini analyzes the job; Ollama holds the first chat request until the
+            # model is resident, and keep_alive keeps it loaded for the later steps
+            print(f"🧠 Loading Ollama model {config.ollama_model} in the background...")
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(preload_ollama_model, config.ollama_host, config.ollama_model)
+                
+                # Initialize agent
+                from hr_agent import HRRecruitmentAgent
+                agent = HRRecruitmentAgent(asdict(config))
+                results = agent.run_pipeline(**pipeline_args)
         
-        # Generate sample report
-        print("📊 Generating sample report...")
-        report = agent.generate_daily_report()
+        print(f"✅ Added sample job: {first_job['title']} (ID: {results['job_id']})")
+        print(f"✅ Sourced {len(results['candidates'])} candidates")
+        print(f"✅ Generated {len(results['campaigns'])} outreach emails")
         print("✅ Sample report generated")
         
         print("\n🎉 Sample data setup completed!")
@@ -114,36 +585,61 @@ def setup_sample_data():
         print(f"❌ Error setting up sample data: {e}")
         return False
 
+SAMPLE_DATA_NEXT_STEPS = """
+🚀 Quick start completed successfully!
+
+Next steps:
+1. 🌐 Launch web interface: python main.py web
+2. 📋 Or use CLI: python main.py job list
+3. 📖 Read the README.md for detailed usage instructions"""
+
+PREREQUISITES_NEXT_STEPS = """
+✅ Prerequisites verified! You're ready to use the HR Agent.
+
+Next steps:
+1. 🌐 Launch web interface: python main.py web
+2. 💼 Add your first job: python main.py job add -d 'your job description'
+3. 📖 Read the README.md for detailed instructions"""
+
 def main():
     """Main quickstart function"""
-    print("🤖 AI HR Recruitment Agent - Quick Start")
-    print("=" * 50)
+    import argparse
+    parser = argparse.ArgumentParser(description='AI HR Recruitment Agent - Quick Start')
+    parser.add_argument('--force-check', action='store_true',
+                        help='Re-run all prerequisite checks even if a previous run passed')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep an agent with its model loaded running for later quickstart runs')
+    parser.add_argument('--stop-daemon', action='store_true',
+                        help='Stop a running agent daemon and exit')
+    args = parser.parse_args()
+    
+    if args.stop_daemon:
+        print("👋 Agent daemon stopped" if stop_agent_daemon() else "ℹ️ No agent daemon running")
+        return
+    
+    print("🤖 AI HR Recruitment Agent - Quick Start\n" + "=" * 50)
     
     # Check prerequisites
-    if not check_prerequisites():
+    # Read the settings once and share them with every step
+    config = get_config()
+    if not check_prerequisites(config, force=args.force_check):
         print("\n❌ Prerequisites not met. Please fix the issues above and try again.")
         return
     
+    if args.daemon:
+        run_agent_daemon(config)
+        return
+    
     print("\n" + "=" * 50)
     
     # Ask if user wants to set up sample data
-    setup_sample = input("📊 Would you like to set up sample data for testing? (y/n): ").lower().strip()
-    
-    if setup_sample in ['y', 'yes']:
-        if setup_sample_data():
-            print("\n🚀 Quick start completed successfully!")
-            print("\nNext steps:")
-            print("1. 🌐 Launch web interface: python main.py web")
-            print("2. 📋 Or use CLI: python main.py job list")
-            print("3. 📖 Read the README.md for detailed usage instructions")
+    if ask_yes_no("📊 Would you like to set up sample data for testing? (y/n): ", 'QUICKSTART_SAMPLE_DATA'):
+        if setup_sample_data(config):
+            print(SAMPLE_DATA_NEXT_STEPS)
         else:
             print("\n❌ Sample data setup failed. Check the error messages above.")
     else:
-        print("\n✅ Prerequisites verified! You're ready to use the HR Agent.")
-        print("\nNext steps:")
-        print("1. 🌐 Launch web interface: python main.py web")
-        print("2. 💼 Add your first job: python main.py job add -d 'your job description'")
-        print("3. 📖 Read the README.md for detailed instructions")
+        print(PREREQUISITES_NEXT_STEPS)
 
 if __name__ == "__main__":
     main()
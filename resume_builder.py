@@ -6,28 +6,56 @@ Perfect Batpharma template matching with robust parsing and Streamlit integratio
 import os
 import io
 import re
+import copy
 import json
+import functools
+import hashlib
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import tempfile
 import logging
 from pathlib import Path
+from types import SimpleNamespace
 
-# PDF and document processing
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib import colors
-    from reportlab.lib.colors import HexColor
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-    from reportlab.pdfgen import canvas
-    from reportlab.platypus.flowables import Flowable
-    REPORTLAB_AVAILABLE = True
-except ImportError as e:
-    REPORTLAB_AVAILABLE = False
-    print(f"ReportLab not available: {e}")
+# PDF generation: ReportLab is imported the first time a PDF is needed
+@functools.lru_cache(maxsize=1)
+def _reportlab() -> Optional[SimpleNamespace]:
+    """
+    Import the ReportLab names PDF generation uses, once per process
+    
+    Returns:
+        Namespace of ReportLab names, or None when ReportLab is missing
+    """
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        from reportlab.lib import colors
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.enums import TA_LEFT
+    except ImportError as e:
+        print(f"ReportLab not available: {e}")
+        return None
+    
+    return SimpleNamespace(
+        A4=A4, getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+        SimpleDocTemplate=SimpleDocTemplate, Paragraph=Paragraph, Spacer=Spacer,
+        colors=colors, TA_LEFT=TA_LEFT,
+        # Brand colour shared by the page template and paragraph styles
+        BATPHARMA_BLUE=HexColor('#2E86AB')
+    )
+
+def _import_reportlab() -> bool:
+    """
+    Import ReportLab the first time a PDF is needed
+    
+    Returns:
+        True when ReportLab is available
+    """
+    return _reportlab() is not None
 
 # Import existing parsers
 try:
@@ -37,29 +65,77 @@ except ImportError:
     RESUME_PARSER_AVAILABLE = False
     print("Traditional resume parser not available")
 
-try:
-    from gemini_parser import HybridResumeParser
-    GEMINI_PARSER_AVAILABLE = True
-except ImportError:
-    GEMINI_PARSER_AVAILABLE = False
-    print("Hybrid/Gemini parser not available")
+# Gemini parser is only imported once a Gemini API key is supplied; None until probed
+GEMINI_PARSER_AVAILABLE: Optional[bool] = None
+
+def _import_gemini_parser() -> bool:
+    """
+    Import HybridResumeParser into module globals on first use
+    
+    Returns:
+        True when the Gemini parser is available
+    """
+    global GEMINI_PARSER_AVAILABLE, HybridResumeParser
+    
+    if GEMINI_PARSER_AVAILABLE is None:
+        try:
+            from gemini_parser import HybridResumeParser
+            GEMINI_PARSER_AVAILABLE = True
+        except ImportError:
+            GEMINI_PARSER_AVAILABLE = False
+            print("Hybrid/Gemini parser not available")
+    
+    return GEMINI_PARSER_AVAILABLE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns used on every resume, compiled once
+_YEARS_RE = re.compile(r'(\d+)\+?\s*years?', re.IGNORECASE)
+_SENTENCE_RE = re.compile(r'.+?(?:[.!?]+(?=\s|$)|$)', re.DOTALL)
+
+class _SafeNameTable(dict):
+    """str.translate table that drops punctuation and symbols, filled in per character"""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        mapped = codepoint if char.isalnum() or char.isspace() or char in '_-' else None
+        self[codepoint] = mapped
+        return mapped
+
+# Punctuation (any script) and emoji dropped from candidate names when building PDF filenames
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+# Parsed results kept per ResumeDataParser so re-uploads skip Gemini and the NLP pass
+PARSE_CACHE_SIZE = 128
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_parser() -> Optional['ResumeParser']:
+    """Build the traditional ResumeParser once per process; it only holds compiled patterns"""
+    if not RESUME_PARSER_AVAILABLE:
+        return None
+    try:
+        parser = ResumeParser()
+        logger.info("Initialized traditional parser")
+        return parser
+    except Exception as e:
+        logger.warning(f"Failed to initialize traditional parser: {e}")
+        return None
+
 class BatpharmaTemplate:
     """Handles EXACT Batpharma template formatting matching the original"""
     
     @staticmethod
     def create_page_template(canvas, doc):
         """Create page with exact Batpharma signature placement based on original template analysis"""
+        rl = _reportlab()
         canvas.saveState()
         
         # Based on template analysis: BATPHARMA appears around bottom right area
         # Original template coordinates show signature area around (416.8, 673.8) to (595.5, 842.2)
-        page_width = A4[0]   # 595.5 points
-        page_height = A4[1]  # 842.25 points
+        page_width = rl.A4[0]   # 595.5 points
+        page_height = rl.A4[1]  # 842.25 points
         
         # Position signature exactly like the original template
         # From analysis: text appears in bottom section
@@ -68,11 +144,11 @@ class BatpharmaTemplate:
         
         # Draw "BATPHARMA" signature in company blue color
         canvas.setFont("Helvetica-Bold", 8)
-        canvas.setFillColor(HexColor('#2E86AB'))
+        canvas.setFillColor(rl.BATPHARMA_BLUE)
         canvas.drawString(sig_x, sig_y, "BATPHARMA")
         
         # Draw decorative line above signature (like original)
-        canvas.setStrokeColor(HexColor('#2E86AB'))
+        canvas.setStrokeColor(rl.BATPHARMA_BLUE)
         canvas.setLineWidth(0.8)
         canvas.line(sig_x, sig_y - 3, sig_x + 55, sig_y - 3)
         
@@ -81,11 +157,8 @@ class BatpharmaTemplate:
 class ResumeExtractor:
     """Handles text extraction using existing proven parser methods"""
     
-    def __init__(self):
-        if RESUME_PARSER_AVAILABLE:
-            self.parser = ResumeParser()
-        else:
-            self.parser = None
+    def __init__(self, parser: Optional['ResumeParser'] = None):
+        self.parser = parser if parser is not None else _get_shared_parser()
     
     def extract_text(self, file_content: bytes, filename: str) -> str:
         """Extract text using existing parser system"""
@@ -95,40 +168,28 @@ class ResumeExtractor:
         file_extension = Path(filename).suffix.lower()
         
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file_path = tmp_file.name
-            
-            # Use existing parser methods
+            # Use existing parser methods on the uploaded bytes directly
             if file_extension == '.pdf':
-                text = self.parser.extract_text_from_pdf(tmp_file_path)
+                return self.parser.extract_text_from_pdf_bytes(file_content)
             elif file_extension in ['.docx', '.doc']:
-                text = self.parser.extract_text_from_docx(tmp_file_path)
+                return self.parser.extract_text_from_docx_bytes(file_content)
             elif file_extension == '.txt':
-                text = self.parser.extract_text_from_txt(tmp_file_path)
+                return self.parser.extract_text_from_txt_bytes(file_content)
             else:
                 raise ValueError(f"Unsupported file type: {file_extension}")
             
-            # Clean up
-            os.unlink(tmp_file_path)
-            return text
-            
         except Exception as e:
             logger.error(f"Text extraction failed: {e}")
-            try:
-                os.unlink(tmp_file_path)
-            except:
-                pass
             raise
 
 class ResumeDataParser:
     """Parses resume text using existing hybrid parser system for maximum accuracy"""
     
-    def __init__(self, gemini_api_key: Optional[str] = None):
+    def __init__(self, gemini_api_key: Optional[str] = None, traditional_parser: Optional['ResumeParser'] = None):
         self.gemini_api_key = gemini_api_key
         
         # Initialize hybrid parser (Gemini + traditional)
-        if GEMINI_PARSER_AVAILABLE and gemini_api_key:
+        if gemini_api_key and _import_gemini_parser():
             try:
                 self.hybrid_parser = HybridResumeParser(gemini_api_key)
                 logger.info("Initialized hybrid parser with Gemini AI")
@@ -138,19 +199,36 @@ class ResumeDataParser:
         else:
             self.hybrid_parser = None
         
-        # Initialize traditional parser as fallback
-        if RESUME_PARSER_AVAILABLE:
-            try:
-                self.traditional_parser = ResumeParser()
-                logger.info("Initialized traditional parser as fallback")
-            except Exception as e:
-                logger.warning(f"Failed to initialize traditional parser: {e}")
-                self.traditional_parser = None
-        else:
-            self.traditional_parser = None
+        # Traditional parser as fallback, shared with the extractor
+        self.traditional_parser = traditional_parser if traditional_parser is not None else _get_shared_parser()
+        
+        self._cache: OrderedDict = OrderedDict()
     
     def parse_resume_text(self, text: str) -> Dict[str, Any]:
-        """Parse resume text using existing parser system"""
+        """Parse resume text using existing parser system, reusing the result for identical text"""
+        key = hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.info("Using cached parse result for identical resume text")
+            result = copy.deepcopy(cached)
+            result['processed_at'] = datetime.now().isoformat()
+            return result
+        
+        result = self._parse_resume_text_uncached(text)
+        
+        # Failures may be transient (e.g. Gemini errors), so only successes are kept;
+        # with a hybrid parser, anything but a Gemini parse is a degraded fallback
+        if result['parsing_method'] != 'failed' and (
+                result['parsing_method'] == 'gemini' or self.hybrid_parser is None):
+            self._cache[key] = copy.deepcopy(result)
+            if len(self._cache) > PARSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+    
+    def _parse_resume_text_uncached(self, text: str) -> Dict[str, Any]:
+        """Run the hybrid parser, then the traditional parser, then fall back to minimal data"""
+        now_iso = datetime.now().isoformat()
         
         # Try hybrid parser first (includes Gemini AI)
         if self.hybrid_parser:
@@ -179,7 +257,7 @@ class ResumeDataParser:
                         'linkedin_url': data.get('linkedin_url', ''),
                         'parsing_method': result['method'],
                         'parsing_issues': result.get('issues', []),
-                        'processed_at': datetime.now().isoformat()
+                        'processed_at': now_iso
                     }
                 else:
                     logger.warning("Hybrid parser failed, trying traditional parser only")
@@ -208,7 +286,7 @@ class ResumeDataParser:
                     'linkedin_url': result.linkedin_url or '',
                     'parsing_method': 'traditional',
                     'parsing_issues': [],
-                    'processed_at': datetime.now().isoformat()
+                    'processed_at': now_iso
                 }
             except Exception as e:
                 logger.error(f"Traditional parser error: {e}")
@@ -231,7 +309,7 @@ class ResumeDataParser:
             'linkedin_url': '',
             'parsing_method': 'failed',
             'parsing_issues': ['All parsing methods failed'],
-            'processed_at': datetime.now().isoformat()
+            'processed_at': now_iso
         }
     
     def _extract_years(self, exp_text: str) -> int:
@@ -239,8 +317,7 @@ class ResumeDataParser:
         if not exp_text:
             return 0
         
-        pattern = re.compile(r'(\d+)\+?\s*years?', re.IGNORECASE)
-        match = pattern.search(str(exp_text))
+        match = _YEARS_RE.search(str(exp_text))
         if match:
             try:
                 return int(match.group(1))
@@ -253,12 +330,12 @@ class ResumeDataParser:
         if not skills_data:
             return []
         
+        # Stop stripping once the cap is reached; Gemini sometimes returns 50+ skills
         if isinstance(skills_data, list):
-            return [skill.strip() for skill in skills_data if skill and skill.strip()][:15]
+            return list(islice((skill.strip() for skill in skills_data if skill and skill.strip()), 15))
         
         if isinstance(skills_data, str):
-            skills = [skill.strip() for skill in skills_data.split(',') if skill.strip()]
-            return skills[:15]
+            return list(islice((skill.strip() for skill in skills_data.split(',') if skill.strip()), 15))
         
         return []
     
@@ -268,109 +345,138 @@ class ResumeDataParser:
             return []
         
         if isinstance(education_data, list):
-            return [edu.strip() for edu in education_data if edu and edu.strip()][:3]
+            return list(islice((edu.strip() for edu in education_data if edu and edu.strip()), 3))
         
         if isinstance(education_data, str):
-            education = [edu.strip() for edu in education_data.replace('|', '\n').split('\n') if edu.strip()]
-            return education[:3]
+            entries = education_data.replace('|', '\n').split('\n')
+            return list(islice((edu.strip() for edu in entries if edu.strip()), 3))
         
         return []
 
+@functools.lru_cache(maxsize=1)
+def _build_batpharma_styles() -> Dict[str, Any]:
+    """Build the paragraph styles that exactly match the Batpharma template layout, once per process"""
+    rl = _reportlab()
+    normal = rl.getSampleStyleSheet()['Normal']
+    styles = {}
+    
+    # EXACT match to template: Large name at top (DANIEL GALLEGO position: 34.7, 47.1)
+    styles['BatpharmaExactName'] = rl.ParagraphStyle(
+        name='BatpharmaExactName',
+        parent=normal,
+        fontSize=26,
+        fontName='Helvetica-Bold',
+        spaceAfter=6,
+        spaceBefore=30,
+        alignment=rl.TA_LEFT,
+        textColor=rl.colors.black,
+        leftIndent=35  # Match template left margin
+    )
+    
+    # Position/title below name (UX DESIGNER position: 62.8, 84.8)
+    styles['BatpharmaExactTitle'] = rl.ParagraphStyle(
+        name='BatpharmaExactTitle',
+        parent=normal,
+        fontSize=14,
+        fontName='Helvetica',
+        spaceAfter=12,
+        alignment=rl.TA_LEFT,
+        textColor=rl.colors.black,
+        leftIndent=35
+    )
+    
+    # Contact info (hello@reallygreatsite.com position around 40.4, 108.5)
+    styles['BatpharmaExactContact'] = rl.ParagraphStyle(
+        name='BatpharmaExactContact',
+        parent=normal,
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=20,
+        alignment=rl.TA_LEFT,
+        textColor=rl.colors.black,
+        leftIndent=35
+    )
+    
+    # Section headings in blue (SUMMARY position: 52.8, 147.3)
+    styles['BatpharmaExactSection'] = rl.ParagraphStyle(
+        name='BatpharmaExactSection',
+        parent=normal,
+        fontSize=12,
+        fontName='Helvetica-Bold',
+        spaceAfter=6,
+        spaceBefore=12,
+        alignment=rl.TA_LEFT,
+        textColor=rl.BATPHARMA_BLUE,
+        leftIndent=35
+    )
+    
+    # Content text (body text style)
+    styles['BatpharmaExactContent'] = rl.ParagraphStyle(
+        name='BatpharmaExactContent',
+        parent=normal,
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=6,
+        alignment=rl.TA_LEFT,
+        textColor=rl.colors.black,
+        leftIndent=35
+    )
+    
+    # Skills list (indented like template skills at 36.2, 275.7)
+    styles['BatpharmaExactSkills'] = rl.ParagraphStyle(
+        name='BatpharmaExactSkills',
+        parent=normal,
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=3,
+        alignment=rl.TA_LEFT,
+        textColor=rl.colors.black,
+        leftIndent=55  # More indented for skills
+    )
+    
+    return styles
+
+def _as_list(value, separator: Optional[str] = ',') -> List[str]:
+    """Normalize a list, or a string split on separator, into stripped non-empty entries"""
+    if not value:
+        return []
+    if isinstance(value, list):
+        items = value
+    elif separator:
+        items = str(value).split(separator)
+    else:
+        items = [str(value)]
+    return [item.strip() for item in items if item and item.strip()]
+
 class ExactBatpharmaPDFGenerator:
     """Generates PDF resumes matching EXACTLY the Batpharma template format"""
     
     def __init__(self):
-        if not REPORTLAB_AVAILABLE:
+        if not _import_reportlab():
             raise ImportError("ReportLab not available. Install with: pip install reportlab")
         
-        self.setup_exact_styles()
-    
-    def setup_exact_styles(self):
-        """Setup styles that exactly match the Batpharma template layout"""
-        self.styles = getSampleStyleSheet()
-        
-        # EXACT match to template: Large name at top (DANIEL GALLEGO position: 34.7, 47.1)
-        self.styles.add(ParagraphStyle(
-            name='BatpharmaExactName',
-            parent=self.styles['Normal'],
-            fontSize=26,
-            fontName='Helvetica-Bold',
-            spaceAfter=6,
-            spaceBefore=30,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            leftIndent=35  # Match template left margin
-        ))
-        
-        # Position/title below name (UX DESIGNER position: 62.8, 84.8)
-        self.styles.add(ParagraphStyle(
-            name='BatpharmaExactTitle',
-            parent=self.styles['Normal'],
-            fontSize=14,
-            fontName='Helvetica',
-            spaceAfter=12,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            leftIndent=35
-        ))
-        
-        # Contact info (hello@reallygreatsite.com position around 40.4, 108.5)
-        self.styles.add(ParagraphStyle(
-            name='BatpharmaExactContact',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=20,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            leftIndent=35
-        ))
-        
-        # Section headings in blue (SUMMARY position: 52.8, 147.3)
-        self.styles.add(ParagraphStyle(
-            name='BatpharmaExactSection',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            fontName='Helvetica-Bold',
-            spaceAfter=6,
-            spaceBefore=12,
-            alignment=TA_LEFT,
-            textColor=HexColor('#2E86AB'),
-            leftIndent=35
-        ))
-        
-        # Content text (body text style)
-        self.styles.add(ParagraphStyle(
-            name='BatpharmaExactContent',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=6,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            leftIndent=35
-        ))
-        
-        # Skills list (indented like template skills at 36.2, 275.7)
-        self.styles.add(ParagraphStyle(
-            name='BatpharmaExactSkills',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=3,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            leftIndent=55  # More indented for skills
-        ))
-    
-    def generate_pdf(self, resume_data: Dict[str, Any]) -> bytes:
-        """Generate PDF matching EXACTLY the Batpharma template"""
-        buffer = io.BytesIO()
+        # Styles are pure data, so every generator shares one set
+        self.styles = _build_batpharma_styles()
+    
+    def generate_pdf(self, resume_data: Dict[str, Any], output=None) -> Optional[bytes]:
+        """
+        Generate PDF matching EXACTLY the Batpharma template
+        
+        Args:
+            resume_data: Parsed resume fields
+            output: File path or binary file object to write the PDF to directly
+            
+        Returns:
+            PDF bytes, or None when the PDF was written to output
+        """
+        rl = _reportlab()
+        Paragraph, Spacer = rl.Paragraph, rl.Spacer
+        buffer = io.BytesIO() if output is None else None
         
         # Use exact A4 size from template analysis (595.5 x 842.25 points)
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
+        doc = rl.SimpleDocTemplate(
+            output if output is not None else buffer,
+            pagesize=rl.A4,
             rightMargin=50,
             leftMargin=35,  # Match template left margin exactly
             topMargin=40,   # Match template top spacing
@@ -378,6 +484,14 @@ class ExactBatpharmaPDFGenerator:
         )
         
         story = []
+        section_style = self.styles['BatpharmaExactSection']
+        content_style = self.styles['BatpharmaExactContent']
+        
+        # Normalize the list fields once; each may arrive as a list or a delimited string
+        skills = _as_list(resume_data.get('skills'))[:9]  # Match template skill count
+        education = _as_list(resume_data.get('education'), separator=None)
+        languages = _as_list(resume_data.get('languages'))
+        certifications = _as_list(resume_data.get('certifications'))
         
         # === HEADER SECTION - EXACT MATCH TO TEMPLATE ===
         # Large name (matching DANIEL GALLEGO position)
@@ -403,83 +517,76 @@ class ExactBatpharmaPDFGenerator:
             story.append(Paragraph(contact_text, self.styles['BatpharmaExactContact']))
         
         # === SUMMARY SECTION (matching template SUMMARY position) ===
-        story.append(Paragraph("SUMMARY", self.styles['BatpharmaExactSection']))
+        story.append(Paragraph("SUMMARY", section_style))
         summary_text = resume_data.get('summary', 'Professional with experience across various technologies and methodologies.')
-        story.append(Paragraph(summary_text, self.styles['BatpharmaExactContent']))
+        story.append(Paragraph(summary_text, content_style))
         story.append(Spacer(1, 6))
         
         # === TECHNICAL SKILLS SECTION (matching template layout) ===
-        if resume_data.get('skills'):
-            story.append(Paragraph("TECHNICAL SKILLS", self.styles['BatpharmaExactSection']))
-            
-            skills = resume_data['skills'] if isinstance(resume_data['skills'], list) else []
-            if not skills and resume_data.get('skills'):
-                skills = [s.strip() for s in str(resume_data['skills']).split(',')]
+        if skills:
+            story.append(Paragraph("TECHNICAL SKILLS", section_style))
             
             # Display skills in left column format exactly like template
-            for skill in skills[:9]:  # Match template skill count
-                if skill.strip():
-                    story.append(Paragraph(skill.strip(), self.styles['BatpharmaExactSkills']))
+            skills_style = self.styles['BatpharmaExactSkills']
+            story.extend([Paragraph(skill, skills_style) for skill in skills])
             
             story.append(Spacer(1, 8))
         
         # === PROFESSIONAL EXPERIENCE SECTION ===
-        story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['BatpharmaExactSection']))
+        story.append(Paragraph("PROFESSIONAL EXPERIENCE", section_style))
         
         if resume_data.get('current_position') and resume_data.get('current_company'):
             # Job title and company (like template format)
             job_title = f"{resume_data['current_position']}, {resume_data['current_company']}"
-            story.append(Paragraph(job_title, self.styles['BatpharmaExactContent']))
+            story.append(Paragraph(job_title, content_style))
             
             # Experience bullet points (matching template bullet style)
             if resume_data.get('summary'):
-                summary_sentences = resume_data['summary'].split('. ')
-                for sentence in summary_sentences[:3]:  # Limit to 3 bullets
-                    if sentence.strip() and len(sentence.strip()) > 10:
-                        clean_sentence = sentence.strip().rstrip('.')
-                        story.append(Paragraph(f"• {clean_sentence}.", self.styles['BatpharmaExactContent']))
+                # Limit to 3 bullets; finditer stops scanning once they are found
+                for match in islice(_SENTENCE_RE.finditer(resume_data['summary']), 3):
+                    sentence = match.group(0).strip()
+                    if len(sentence) > 10:
+                        if sentence[-1] not in '.!?':
+                            sentence += '.'
+                        story.append(Paragraph(f"• {sentence}", content_style))
         else:
             # Fallback experience section
-            story.append(Paragraph("Professional Experience Available", self.styles['BatpharmaExactContent']))
+            story.append(Paragraph("Professional Experience Available", content_style))
             if resume_data.get('summary'):
-                story.append(Paragraph(f"• {resume_data['summary']}", self.styles['BatpharmaExactContent']))
+                story.append(Paragraph(f"• {resume_data['summary']}", content_style))
         
         story.append(Spacer(1, 8))
         
         # === EDUCATION SECTION ===
-        if resume_data.get('education'):
-            story.append(Paragraph("EDUCATION", self.styles['BatpharmaExactSection']))
+        if education:
+            story.append(Paragraph("EDUCATION", section_style))
             
-            education = resume_data['education'] if isinstance(resume_data['education'], list) else [resume_data['education']]
-            for edu in education:
-                if edu and edu.strip():
-                    story.append(Paragraph(edu.strip(), self.styles['BatpharmaExactContent']))
+            story.extend([Paragraph(edu, content_style) for edu in education])
         
         story.append(Spacer(1, 8))
         
         # === ADDITIONAL INFORMATION SECTION ===
-        story.append(Paragraph("ADDITIONAL INFORMATION", self.styles['BatpharmaExactSection']))
+        story.append(Paragraph("ADDITIONAL INFORMATION", section_style))
         
         # Languages (matching template format)
-        languages = resume_data.get('languages', [])
-        if languages and isinstance(languages, list) and any(languages):
-            lang_text = f"Languages: {', '.join([lang for lang in languages if lang.strip()])}"
-            story.append(Paragraph(lang_text, self.styles['BatpharmaExactContent']))
+        if languages:
+            story.append(Paragraph(f"Languages: {', '.join(languages)}", content_style))
         
         # Certifications
-        certifications = resume_data.get('certifications', [])
-        if certifications and isinstance(certifications, list) and any(certifications):
-            cert_text = f"Certifications: {', '.join([cert for cert in certifications if cert.strip()])}"
-            story.append(Paragraph(cert_text, self.styles['BatpharmaExactContent']))
+        if certifications:
+            story.append(Paragraph(f"Certifications: {', '.join(certifications)}", content_style))
         
         # Total experience
         if resume_data.get('experience_years'):
             exp_text = f"Total Experience: {resume_data['experience_years']} years"
-            story.append(Paragraph(exp_text, self.styles['BatpharmaExactContent']))
+            story.append(Paragraph(exp_text, content_style))
         
         # Build PDF with exact Batpharma template
         doc.build(story, onFirstPage=BatpharmaTemplate.create_page_template, onLaterPages=BatpharmaTemplate.create_page_template)
         
+        if buffer is None:
+            return None
+        
         pdf_bytes = buffer.getvalue()
         buffer.close()
         
@@ -489,26 +596,38 @@ class ResumeBuilder:
     """Main resume builder with exact Batpharma template matching and robust parsing"""
     
     def __init__(self, gemini_api_key: Optional[str] = None):
-        self.extractor = ResumeExtractor()
-        self.parser = ResumeDataParser(gemini_api_key)
+        # One traditional parser serves both text extraction and the parsing fallback
+        traditional_parser = _get_shared_parser()
+        self.extractor = ResumeExtractor(parser=traditional_parser)
+        self.parser = ResumeDataParser(gemini_api_key, traditional_parser=traditional_parser)
         
-        if REPORTLAB_AVAILABLE:
-            self.pdf_generator = ExactBatpharmaPDFGenerator()
-        else:
-            self.pdf_generator = None
-            logger.error("ReportLab not available for PDF generation")
+        # Created on first PDF so listing/deleting never imports ReportLab
+        self._pdf_generator: Optional[ExactBatpharmaPDFGenerator] = None
         
         # Create generated resumes directory
         self.generated_dir = Path('generated_resumes')
         self.generated_dir.mkdir(exist_ok=True)
         
+        # (directory mtime_ns, listing) from the last scan of generated_dir
+        self._dir_cache: Tuple[int, List[Dict[str, Any]]] = (-1, [])
+        
         self.gemini_api_key = gemini_api_key
         
         # Log initialization status
         logger.info(f"Resume Builder initialized:")
         logger.info(f"  - Traditional parser: {RESUME_PARSER_AVAILABLE}")
-        logger.info(f"  - Gemini parser: {GEMINI_PARSER_AVAILABLE and bool(gemini_api_key)}")
-        logger.info(f"  - ReportLab: {REPORTLAB_AVAILABLE}")
+        logger.info(f"  - Gemini parser: {self.parser.hybrid_parser is not None}")
+        logger.info(f"  - ReportLab: {_import_reportlab() if _reportlab.cache_info().currsize else 'loaded on first PDF'}")
+    
+    @property
+    def pdf_generator(self) -> Optional[ExactBatpharmaPDFGenerator]:
+        """PDF generator, created on first use; None when ReportLab is missing"""
+        if self._pdf_generator is None:
+            if _import_reportlab():
+                self._pdf_generator = ExactBatpharmaPDFGenerator()
+            else:
+                logger.error("ReportLab not available for PDF generation")
+        return self._pdf_generator
     
     def get_supported_formats(self) -> List[str]:
         """Get supported file formats"""
@@ -516,15 +635,26 @@ class ResumeBuilder:
     
     def validate_file(self, file_content: bytes, filename: str) -> Tuple[bool, str]:
         """Validate uploaded file"""
+        return self._validate(len(file_content), filename)
+    
+    def validate_upload(self, file_obj, filename: str) -> Tuple[bool, str]:
+        """Validate an uploaded file object by extension and size without reading its content"""
+        file_obj.seek(0, os.SEEK_END)
+        size = file_obj.tell()
+        file_obj.seek(0)
+        return self._validate(size, filename)
+    
+    def _validate(self, size: int, filename: str) -> Tuple[bool, str]:
+        """Check the extension and byte size of an upload"""
         file_extension = Path(filename).suffix.lower()
         
         if file_extension not in self.get_supported_formats():
             return False, f"Unsupported format. Supported: {', '.join(self.get_supported_formats())}"
         
-        if len(file_content) == 0:
+        if size == 0:
             return False, "File is empty"
         
-        if len(file_content) > 10 * 1024 * 1024:  # 10MB limit
+        if size > 10 * 1024 * 1024:  # 10MB limit
             return False, "File too large (max 10MB)"
         
         return True, "File is valid"
@@ -561,26 +691,72 @@ class ResumeBuilder:
             logger.error(f"Resume processing failed: {e}")
             raise
     
+    def process_upload(self, file_obj, filename: str) -> Dict[str, Any]:
+        """
+        Process an uploaded file object, such as a Streamlit UploadedFile
+        
+        Unsupported, empty and oversized uploads are rejected before the content is read.
+        
+        Args:
+            file_obj: Seekable binary file object
+            filename: Original filename
+            
+        Returns:
+            Parsed resume data, as from process_resume
+        """
+        is_valid, message = self.validate_upload(file_obj, filename)
+        if not is_valid:
+            raise ValueError(f"File validation failed: {message}")
+        
+        return self.process_resume(file_obj.read(), filename)
+    
+    def process_resumes_batch(self, items: List[Tuple[bytes, str]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process several resumes in parallel worker processes
+        
+        Text extraction and traditional parsing are CPU-bound, so each worker
+        process runs its own ResumeBuilder.
+        
+        Args:
+            items: (file_content, filename) pairs
+            max_workers: Worker processes to use (defaults to one per CPU)
+            
+        Returns:
+            One dict per item, in order, with filename, success and either data or error
+        """
+        if not items:
+            return []
+        
+        if len(items) == 1:
+            return [_process_resume_safely(self, *items[0])]
+        
+        workers = min(len(items), max_workers or os.cpu_count() or 1)
+        logger.info(f"Processing {len(items)} resumes across {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self.gemini_api_key,)) as executor:
+            return list(executor.map(_process_resume_in_worker, items))
+    
     def generate_resume_pdf(self, resume_data: Dict[str, Any], candidate_name: str = None) -> Tuple[bytes, str]:
         """Generate PDF in EXACT Batpharma template format"""
         if not self.pdf_generator:
             raise ImportError("PDF generator not available. Install reportlab: pip install reportlab")
         
         try:
-            # Generate PDF using exact Batpharma template
-            logger.info("Generating PDF with EXACT Batpharma template")
-            pdf_bytes = self.pdf_generator.generate_pdf(resume_data)
-            
             # Create filename
             name = candidate_name or resume_data.get('full_name', 'Unknown')
-            safe_name = re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')
+            safe_name = '_'.join(name.translate(_SAFE_NAME_TABLE).split())
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{safe_name}_Batpharma_Resume_{timestamp}.pdf"
             
-            # Save to generated resumes directory
-            file_path = self.generated_dir / filename
-            with open(file_path, 'wb') as f:
-                f.write(pdf_bytes)
+            # Callers get the bytes back, so the PDF is held in memory once anyway; building
+            # it in a buffer and saving that avoids reading the file back, and a failed
+            # render never leaves a partial file behind
+            logger.info("Generating PDF with EXACT Batpharma template")
+            buffer = io.BytesIO()
+            self.pdf_generator.generate_pdf(resume_data, output=buffer)
+            with open(self.generated_dir / filename, 'wb') as f:
+                f.write(buffer.getbuffer())
+            pdf_bytes = buffer.getvalue()
             
             logger.info(f"Generated exact Batpharma resume: {filename} ({len(pdf_bytes)} bytes)")
             return pdf_bytes, filename
@@ -590,16 +766,26 @@ class ResumeBuilder:
             raise
     
     def get_generated_resumes(self) -> List[Dict[str, Any]]:
-        """Get list of generated resumes"""
-        resumes = []
+        """Get list of generated resumes, rescanning only when the directory has changed"""
+        try:
+            dir_mtime = self.generated_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        cached_mtime, cached_resumes = self._dir_cache
+        if dir_mtime == cached_mtime:
+            return list(cached_resumes)
         
-        if self.generated_dir.exists():
-            for file_path in self.generated_dir.glob('*.pdf'):
-                stat = file_path.stat()
+        resumes = []
+        with os.scandir(self.generated_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.pdf') or not entry.is_file():
+                    continue
+                stat = entry.stat()
                 
                 resumes.append({
-                    'filename': file_path.name,
-                    'path': str(file_path),
+                    'filename': entry.name,
+                    'path': str(self.generated_dir / entry.name),
                     'size': stat.st_size,
                     'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                     'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -607,7 +793,8 @@ class ResumeBuilder:
         
         # Sort by creation time (newest first)
         resumes.sort(key=lambda x: x['created'], reverse=True)
-        return resumes
+        self._dir_cache = (dir_mtime, resumes)
+        return list(resumes)
     
     def delete_resume(self, filename: str) -> bool:
         """Delete a generated resume file"""
@@ -633,6 +820,24 @@ class ResumeBuilder:
             logger.error(f"Failed to read {filename}: {e}")
             return None
 
+# Per-process builder used by process_resumes_batch workers
+_worker_builder: Optional[ResumeBuilder] = None
+
+def _init_batch_worker(gemini_api_key: Optional[str]):
+    """Create the worker process's ResumeBuilder once"""
+    global _worker_builder
+    _worker_builder = ResumeBuilder(gemini_api_key)
+
+def _process_resume_safely(builder: ResumeBuilder, file_content: bytes, filename: str) -> Dict[str, Any]:
+    """Process one resume, reporting failure in the result instead of raising"""
+    try:
+        return {'filename': filename, 'success': True, 'data': builder.process_resume(file_content, filename)}
+    except Exception as e:
+        return {'filename': filename, 'success': False, 'error': str(e)}
+
+def _process_resume_in_worker(item: Tuple[bytes, str]) -> Dict[str, Any]:
+    return _process_resume_safely(_worker_builder, *item)
+
 # Utility functions for Streamlit integration
 def get_resume_builder(gemini_api_key: Optional[str] = None) -> ResumeBuilder:
     """Get configured resume builder instance"""
@@ -642,7 +847,7 @@ def check_dependencies() -> Tuple[bool, List[str]]:
     """Check if all dependencies are available"""
     missing_deps = []
     
-    if not REPORTLAB_AVAILABLE:
+    if not _import_reportlab():
         missing_deps.append("reportlab")
     
     if not RESUME_PARSER_AVAILABLE:
@@ -666,7 +871,7 @@ def check_pdf_dependencies() -> Tuple[bool, List[str]]:
         missing_deps.append("PyPDF2")
     
     try:
-        import fitz  # PyMuPDF
+        import pymupdf
     except ImportError:
         missing_deps.append("PyMuPDF")
     
@@ -718,7 +923,7 @@ def test_exact_resume_builder():
         print(f"✅ Generated EXACT Batpharma PDF: {filename} ({len(pdf_bytes)} bytes)")
         
         # Verify signature placement
-        import fitz
+        from resume_parser import fitz
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
             tmp.write(pdf_bytes)
             tmp_path = tmp.name
@@ -3,14 +3,31 @@ Resume Parser Module
 Extracts candidate information from resume files (PDF, DOCX, TXT)
 """
 
+import io
 import re
 import os
 import logging
+import hashlib
+import functools
+import importlib.util
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # File parsing libraries
+try:
+    # PyMuPDF, preferred for speed and text fidelity; the legacy fitz name prints
+    # a deprecation warning on newer releases, so use it only on old ones
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 try:
     import PyPDF2
     PDF_AVAILABLE = True
@@ -24,23 +41,44 @@ except ImportError:
     DOCX_AVAILABLE = False
 
 try:
-    import spacy
-    # Load English model if available
-    try:
-        nlp = spacy.load("en_core_web_sm")
-        NLP_AVAILABLE = True
-    except OSError:
-        # Model not installed, use basic regex parsing
-        nlp = None
-        NLP_AVAILABLE = False
+    # Installed alongside requests; used to guess the encoding of non-UTF-8 text resumes
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
 except ImportError:
-    nlp = None
-    NLP_AVAILABLE = False
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+# spaCy and its English model are only probed here; the model is loaded by _get_nlp() on first use
+NLP_AVAILABLE = (
+    importlib.util.find_spec("spacy") is not None
+    and importlib.util.find_spec("en_core_web_sm") is not None
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed candidates kept per ResumeParser so duplicate resumes skip the regex pass
+PARSE_TEXT_CACHE_SIZE = 1024
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the spaCy English model once, without the components the parser does not use
+    
+    Returns:
+        spaCy Language pipeline, or None if spaCy or the model is unavailable
+    """
+    if not NLP_AVAILABLE:
+        return None
+    
+    try:
+        import spacy
+        # tok2vec stays because the tagger and parser listen to it
+        return spacy.load("en_core_web_sm", exclude=["ner", "lemmatizer", "attribute_ruler"])
+    except (ImportError, OSError) as e:
+        logger.warning(f"Failed to load spaCy model: {e}")
+        return None
+
 @dataclass
 class ParsedCandidate:
     """Represents a candidate parsed from resume"""
@@ -67,6 +105,7 @@ class ResumeParser:
     
     def __init__(self):
         self.setup_patterns()
+        self._parse_cache: OrderedDict = OrderedDict()
         
     def setup_patterns(self):
         """Setup regex patterns for information extraction"""
@@ -86,6 +125,16 @@ class ResumeParser:
             re.compile(r'^([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)', re.MULTILINE)
         ]
         
+        # A whole line that looks like a 2-3 word name
+        self.name_heuristic = re.compile(r'^[A-Za-z][a-z]*\s+[A-Za-z][a-z]*(?:\s+[A-Za-z][a-z]*)?$')
+        
+        # Location patterns
+        self.location_patterns = [
+            re.compile(r'([A-Za-z\s]+,\s*[A-Z]{2}(?:\s+\d{5})?)', re.MULTILINE),  # City, State ZIP
+            re.compile(r'([A-Za-z\s]+,\s*[A-Za-z\s]+)', re.MULTILINE),  # City, State/Country
+        ]
+        self.location_excludes_re = re.compile(r'university|college|company|inc|corp', re.IGNORECASE)
+        
         # Experience indicators
         self.experience_patterns = [
             re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', re.IGNORECASE),
@@ -109,6 +158,33 @@ class ResumeParser:
             'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
             'REST API', 'GraphQL', 'Microservices', 'DevOps', 'CI/CD', 'Agile', 'Scrum'
         ]
+        
+        # One whole-word alternation over every common skill, longest first, so the text is scanned once
+        self.common_skills_lookup = {skill.lower(): skill for skill in self.common_skills}
+        self.common_skills_pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(skill) for skill in sorted(self.common_skills_lookup, key=len, reverse=True)) + r')\b',
+            re.IGNORECASE
+        )
+        
+        # Keyword checks for the line scan, run against lowercased lines. These match
+        # substrings like the keyword lists they replace, so no \b boundaries.
+        self.name_excludes_re = re.compile(r'email|phone|linkedin|address')
+        self.section_headers_re = re.compile(r'experience|employment|work history|career')
+        self.section_enders_re = re.compile(r'education|skills|projects|certifications')
+        self.current_work_re = re.compile(r'present|current|2023|2024|2025')
+        self.company_indicators_re = re.compile(r'inc|corp|ltd|llc|company')
+        self.title_words_re = re.compile(r'engineer|developer|manager|analyst|specialist|lead|senior')
+        
+        # Education keywords, searched directly in the resume text
+        self.edu_re = re.compile(r'university|college|bachelor|master|phd|degree|diploma', re.IGNORECASE)
+        
+        # Separators inside a skills section and characters stripped from each skill
+        self.skills_split_pattern = re.compile(r'[,•·\n-]+')
+        self.skill_cleanup_pattern = re.compile(r'[^\w\s+#.-]')
+        
+        # Whitespace normalization: runs of newlines or spaces collapse to their first character.
+        # Single characters are left unmatched, so they cost no replacement callback.
+        self.whitespace_runs_pattern = re.compile(r'\n\n+| {2,}')
     
     def parse_resume_file(self, file_path: str) -> ParsedCandidate:
         """
@@ -120,35 +196,80 @@ class ResumeParser:
         Returns:
             ParsedCandidate object with extracted information
         """
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
+        try:
+            return self._parse_extracted_text(self.extract_text_from_file(file_path))
+        except Exception as e:
+            logger.error(f"Error parsing resume file: {e}")
             return ParsedCandidate()
+    
+    def parse_resume_files(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[ParsedCandidate]:
+        """
+        Parse several resume files, extracting their text in parallel worker processes
         
-        # Get file extension
-        file_ext = Path(file_path).suffix.lower()
+        Text extraction (PDF especially) is the CPU-bound step and shares no state,
+        so it runs in a process pool; the regex parsing then runs here.
         
-        try:
-            # Extract text based on file type
-            if file_ext == '.pdf':
-                text = self.extract_text_from_pdf(file_path)
-            elif file_ext == '.docx':
-                text = self.extract_text_from_docx(file_path)
-            elif file_ext in ['.txt', '.text']:
-                text = self.extract_text_from_txt(file_path)
-            else:
-                logger.error(f"Unsupported file type: {file_ext}")
-                return ParsedCandidate()
-            
-            if not text.strip():
-                logger.error("No text extracted from file")
-                return ParsedCandidate()
+        Args:
+            file_paths: Paths to resume files
+            max_workers: Worker processes to use (defaults to one per CPU)
             
-            # Parse the extracted text
-            return self.parse_text(text)
+        Returns:
+            One ParsedCandidate per path, in order (empty for files that could not be parsed)
+        """
+        if len(file_paths) <= 1:
+            return [self.parse_resume_file(file_path) for file_path in file_paths]
+        
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        logger.info(f"Extracting {len(file_paths)} resumes across {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            texts = list(executor.map(_extract_text_safely, file_paths))
+        
+        candidates = []
+        for text in texts:
+            try:
+                candidates.append(self._parse_extracted_text(text))
+            except Exception as e:
+                logger.error(f"Error parsing resume file: {e}")
+                candidates.append(ParsedCandidate())
+        return candidates
+    
+    def extract_text_from_file(self, file_path: str) -> Optional[str]:
+        """
+        Extract text from a resume file based on its extension
+        
+        Args:
+            file_path: Path to resume file
             
-        except Exception as e:
-            logger.error(f"Error parsing resume file: {e}")
+        Returns:
+            Extracted text, or None if the file is missing or of an unsupported type
+        """
+        if not os.path.exists(file_path):
+            logger.error(f"File not found: {file_path}")
+            return None
+        
+        # Extract text based on file type
+        file_ext = Path(file_path).suffix.lower()
+        if file_ext == '.pdf':
+            return self.extract_text_from_pdf(file_path)
+        elif file_ext == '.docx':
+            return self.extract_text_from_docx(file_path)
+        elif file_ext in ['.txt', '.text']:
+            return self.extract_text_from_txt(file_path)
+        
+        logger.error(f"Unsupported file type: {file_ext}")
+        return None
+    
+    def _parse_extracted_text(self, text: Optional[str]) -> ParsedCandidate:
+        """Parse text returned by extract_text_from_file, or an empty candidate if there is none"""
+        if text is None:
+            return ParsedCandidate()
+        
+        if not text.strip():
+            logger.error("No text extracted from file")
             return ParsedCandidate()
+        
+        # Parse the extracted text
+        return self.parse_text(text)
     
     def parse_resume_content(self, content: str, filename: str = "uploaded_file") -> ParsedCandidate:
         """
@@ -169,55 +290,101 @@ class ResumeParser:
     
     def extract_text_from_pdf(self, file_path: str) -> str:
         """Extract text from PDF file"""
-        if not PDF_AVAILABLE:
-            raise ImportError("PyPDF2 not available. Install with: pip install PyPDF2")
+        if not (PYMUPDF_AVAILABLE or PDF_AVAILABLE):
+            raise ImportError("No PDF library available. Install with: pip install PyMuPDF")
         
-        text = ""
         try:
+            if PYMUPDF_AVAILABLE:
+                with fitz.open(file_path) as doc:
+                    return self._read_pymupdf_text(doc)
             with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                return self._read_pdf_text(file)
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
+            return ""
+    
+    def extract_text_from_pdf_bytes(self, content: bytes) -> str:
+        """Extract text from in-memory PDF content"""
+        if not (PYMUPDF_AVAILABLE or PDF_AVAILABLE):
+            raise ImportError("No PDF library available. Install with: pip install PyMuPDF")
         
-        return text
+        try:
+            if PYMUPDF_AVAILABLE:
+                with fitz.open(stream=content, filetype='pdf') as doc:
+                    return self._read_pymupdf_text(doc)
+            return self._read_pdf_text(io.BytesIO(content))
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF: {e}")
+            return ""
+    
+    def _read_pymupdf_text(self, doc) -> str:
+        """Concatenate the text of every page in an open PyMuPDF document"""
+        return "\n".join(page.get_text("text") for page in doc)
+    
+    def _read_pdf_text(self, stream) -> str:
+        """Concatenate the text of every page in a binary PDF stream with PyPDF2"""
+        pdf_reader = PyPDF2.PdfReader(stream)
+        return "".join((page.extract_text() or "") + "\n" for page in pdf_reader.pages)
     
     def extract_text_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx not available. Install with: pip install python-docx")
         
-        text = ""
         try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            return self._read_docx_text(file_path)
         except Exception as e:
             logger.error(f"Error extracting text from DOCX: {e}")
+            return ""
+    
+    def extract_text_from_docx_bytes(self, content: bytes) -> str:
+        """Extract text from in-memory DOCX content"""
+        if not DOCX_AVAILABLE:
+            raise ImportError("python-docx not available. Install with: pip install python-docx")
         
-        return text
+        try:
+            return self._read_docx_text(io.BytesIO(content))
+        except Exception as e:
+            logger.error(f"Error extracting text from DOCX: {e}")
+            return ""
+    
+    def _read_docx_text(self, source) -> str:
+        """Concatenate the paragraphs of a DOCX path or binary stream"""
+        doc = Document(source)
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
     
     def extract_text_from_txt(self, file_path: str) -> str:
         """Extract text from TXT file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    return file.read()
-            except Exception as e:
-                logger.error(f"Error reading text file: {e}")
-                return ""
+            # Read once; a non-UTF-8 file is re-decoded from memory, not re-read
+            with open(file_path, 'rb') as file:
+                return self.extract_text_from_txt_bytes(file.read())
         except Exception as e:
             logger.error(f"Error extracting text from TXT: {e}")
             return ""
     
+    def extract_text_from_txt_bytes(self, content: bytes) -> str:
+        """Decode in-memory text content as UTF-8, else the detected encoding, else latin-1"""
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        if CHARSET_NORMALIZER_AVAILABLE:
+            # Sniffing the first 64 KiB is enough to pick an encoding
+            matches = charset_normalizer.from_bytes(content[:65536])
+            best = matches.best()
+            if best is not None:
+                # Short resumes often tie across Western code pages; prefer cp1252 then
+                if any(match.encoding == 'cp1252' and match.chaos <= best.chaos for match in matches):
+                    return content.decode('cp1252', errors='replace')
+                return content.decode(best.encoding, errors='replace')
+        
+        return content.decode('latin-1')
+    
     def parse_text(self, text: str) -> ParsedCandidate:
         """
-        Parse candidate information from resume text
+        Parse candidate information from resume text, reusing the result for identical text
         
         Args:
             text: Resume text content
@@ -225,16 +392,38 @@ class ResumeParser:
         Returns:
             ParsedCandidate object with extracted information
         """
+        key = hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+        else:
+            cached = self._parse_text_uncached(text)
+            self._parse_cache[key] = cached
+            if len(self._parse_cache) > PARSE_TEXT_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        
+        # Callers may mutate the lists, so never hand out the cached ones
+        return replace(cached, skills=list(cached.skills), education=list(cached.education))
+    
+    def clear_cache(self):
+        """Drop all cached parse results"""
+        self._parse_cache.clear()
+    
+    def _parse_text_uncached(self, text: str) -> ParsedCandidate:
+        """Run every extractor over the cleaned resume text"""
         candidate = ParsedCandidate()
         
         # Clean text
         text = self.clean_text(text)
         
+        # One pass over the lines for name, experience summary and current work
+        scanned = self._scan_lines(text.split('\n'))
+        
         # Extract basic information
         candidate.email = self.extract_email(text)
         candidate.phone = self.extract_phone(text)
         candidate.linkedin_url = self.extract_linkedin(text)
-        candidate.full_name = self.extract_name(text)
+        candidate.full_name = scanned['name']
         candidate.location = self.extract_location(text)
         
         # Extract skills
@@ -242,10 +431,10 @@ class ResumeParser:
         
         # Extract experience
         candidate.total_experience = self.extract_experience_years(text)
-        candidate.experience_summary = self.extract_experience_summary(text)
+        candidate.experience_summary = scanned['experience_summary']
         
         # Extract current company and position
-        candidate.current_company, candidate.current_position = self.extract_current_work(text)
+        candidate.current_company, candidate.current_position = scanned['current_work']
         
         # Extract education
         candidate.education = self.extract_education(text)
@@ -255,76 +444,55 @@ class ResumeParser:
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         # Remove extra whitespace
-        text = re.sub(r'\n+', '\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = self.whitespace_runs_pattern.sub(lambda match: match.group(0)[0], text)
         return text.strip()
     
     def extract_email(self, text: str) -> str:
         """Extract email address"""
-        emails = self.email_pattern.findall(text)
-        return emails[0] if emails else ""
+        match = self.email_pattern.search(text)
+        return match.group(0) if match else ""
     
     def extract_phone(self, text: str) -> str:
         """Extract phone number"""
-        phones = self.phone_pattern.findall(text)
-        if phones:
+        match = self.phone_pattern.search(text)
+        if match:
             # Format as (XXX) XXX-XXXX
-            area, prefix, number = phones[0]
+            area, prefix, number = match.groups()
             return f"({area}) {prefix}-{number}"
         return ""
     
     def extract_linkedin(self, text: str) -> str:
         """Extract LinkedIn URL"""
-        linkedin_urls = self.linkedin_pattern.findall(text)
-        if linkedin_urls:
-            url = linkedin_urls[0]
+        match = self.linkedin_pattern.search(text)
+        if match:
+            url = match.group(0)
             # Ensure it starts with https://
             if not url.startswith('http'):
                 url = 'https://' + url
             return url
         return ""
     
-    def extract_name(self, text: str) -> str:
+    def extract_name(self, text: str, lines: Optional[List[str]] = None) -> str:
         """Extract candidate name (usually at the top)"""
-        lines = text.split('\n')
-        
-        # Try to find name in first few lines
-        for line in lines[:5]:
-            line = line.strip()
-            if len(line) > 0 and not any(x in line.lower() for x in ['email', 'phone', 'linkedin', 'address']):
-                # Check if it looks like a name
-                if re.match(r'^[A-Za-z][a-z]*\s+[A-Za-z][a-z]*(?:\s+[A-Za-z][a-z]*)?$', line):
-                    return line
-                
-                # Try name patterns
-                for pattern in self.name_patterns:
-                    match = pattern.search(line)
-                    if match:
-                        return match.group(1)
-        
-        return ""
+        return self._scan_lines(lines if lines is not None else text.split('\n'))['name']
     
     def extract_location(self, text: str) -> str:
         """Extract location/address"""
         # Look for common location patterns
-        location_patterns = [
-            re.compile(r'([A-Za-z\s]+,\s*[A-Z]{2}(?:\s+\d{5})?)', re.MULTILINE),  # City, State ZIP
-            re.compile(r'([A-Za-z\s]+,\s*[A-Za-z\s]+)', re.MULTILINE),  # City, State/Country
-        ]
-        
-        for pattern in location_patterns:
+        for pattern in self.location_patterns:
             matches = pattern.findall(text)
             if matches:
                 # Filter out common false positives
                 for match in matches:
-                    if not any(word in match.lower() for word in ['university', 'college', 'company', 'inc', 'corp']):
+                    if not self.location_excludes_re.search(match):
                         return match.strip()
         
         return ""
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract technical skills"""
-        found_skills = []
+        # Insertion-ordered dict used as an ordered set for O(1) de-duplication
+        found_skills: Dict[str, None] = {}
         
         # First, look for dedicated skills sections
         for pattern in self.skills_section_patterns:
@@ -333,29 +501,21 @@ class ResumeParser:
                 # Parse skills from the section
                 skills_text = match.strip()
                 # Split by common separators
-                skills_parts = re.split(r'[,•·\n-]+', skills_text)
+                skills_parts = self.skills_split_pattern.split(skills_text)
                 for skill in skills_parts:
                     skill = skill.strip()
                     if skill and len(skill) > 1:
-                        found_skills.append(skill)
+                        found_skills[skill] = None
         
         # Also search for common technical skills throughout the text
-        text_lower = text.lower()
-        for skill in self.common_skills:
-            if skill.lower() in text_lower:
-                # Check if it's a whole word match
-                if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                    if skill not in found_skills:
-                        found_skills.append(skill)
+        hits = {self.common_skills_lookup[match.group(1).lower()] for match in self.common_skills_pattern.finditer(text)}
+        for skill in self.common_skills:  # Keep the common_skills order
+            if skill in hits:
+                found_skills.setdefault(skill, None)
         
         # Clean and deduplicate skills
-        cleaned_skills = []
-        for skill in found_skills:
-            skill = re.sub(r'[^\w\s+#.-]', '', skill).strip()
-            if skill and len(skill) > 1 and skill not in cleaned_skills:
-                cleaned_skills.append(skill)
-        
-        return cleaned_skills[:20]  # Limit to top 20 skills
+        cleaned_skills = dict.fromkeys(self.skill_cleanup_pattern.sub('', skill).strip() for skill in found_skills)
+        return [skill for skill in cleaned_skills if len(skill) > 1][:20]  # Limit to top 20 skills
     
     def extract_experience_years(self, text: str) -> str:
         """Extract total years of experience"""
@@ -367,89 +527,137 @@ class ResumeParser:
         
         return ""
     
-    def extract_experience_summary(self, text: str) -> str:
+    def extract_experience_summary(self, text: str, lines: Optional[List[str]] = None) -> str:
         """Extract a summary of work experience"""
-        lines = text.split('\n')
-        experience_lines = []
-        
-        # Look for experience/work history section
-        in_experience_section = False
-        for line in lines:
-            line = line.strip()
-            
-            # Check if we're entering experience section
-            if any(keyword in line.lower() for keyword in ['experience', 'employment', 'work history', 'career']):
-                in_experience_section = True
-                continue
-            
-            # Check if we're leaving experience section
-            if in_experience_section and any(keyword in line.lower() for keyword in ['education', 'skills', 'projects', 'certifications']):
-                break
-            
-            # Collect experience lines
-            if in_experience_section and line and len(line) > 10:
-                experience_lines.append(line)
-                if len(experience_lines) >= 3:  # Limit to first few lines
-                    break
-        
-        if experience_lines:
-            return ' '.join(experience_lines)[:300]  # Limit length
-        
-        return ""
+        return self._scan_lines(lines if lines is not None else text.split('\n'))['experience_summary']
     
-    def extract_current_work(self, text: str) -> tuple:
+    def extract_current_work(self, text: str, lines: Optional[List[str]] = None) -> tuple:
         """Extract current company and position"""
-        lines = text.split('\n')
-        
-        # Look for current work in first part of resume
-        for i, line in enumerate(lines[:20]):
-            line = line.strip()
-            
-            # Look for date patterns that indicate current work
-            if any(keyword in line.lower() for keyword in ['present', 'current', '2023', '2024', '2025']):
-                # Look around this line for company and position
-                context_lines = lines[max(0, i-3):i+3]
-                
-                for context_line in context_lines:
-                    context_line = context_line.strip()
-                    
-                    # Try to identify company (often has Inc, Corp, Ltd, etc.)
-                    if any(indicator in context_line.lower() for indicator in ['inc', 'corp', 'ltd', 'llc', 'company']):
-                        company = context_line
-                        
-                        # Look for position in nearby lines
-                        for pos_line in context_lines:
-                            pos_line = pos_line.strip()
-                            if any(title in pos_line.lower() for title in ['engineer', 'developer', 'manager', 'analyst', 'specialist', 'lead', 'senior']):
-                                return company, pos_line
-                        
-                        return company, ""
-        
-        return "", ""
+        return self._scan_lines(lines if lines is not None else text.split('\n'))['current_work']
     
     def extract_education(self, text: str) -> List[str]:
         """Extract education information"""
         education = []
         
-        # Education indicators
-        education_keywords = ['university', 'college', 'bachelor', 'master', 'phd', 'degree', 'diploma']
+        # Jump between keyword hits and expand each to its line, instead of walking every line
+        pos = 0
+        while len(education) < 3:  # Limit to 3 entries
+            match = self.edu_re.search(text, pos)
+            if not match:
+                break
+            
+            start = text.rfind('\n', 0, match.start()) + 1
+            end = text.find('\n', match.end())
+            if end == -1:
+                end = len(text)
+            
+            line = text[start:end].strip()
+            if len(line) > 5 and len(line) < 150:  # Reasonable length
+                education.append(line)
+            pos = end + 1
+        
+        return education
+    
+    def _scan_lines(self, lines: List[str]) -> Dict[str, Any]:
+        """
+        Extract name, experience summary and current work in one pass
+        
+        Each line is stripped and lowercased once and checked by every extractor that
+        still needs it; the pass stops as soon as all three fields are settled.
         
-        lines = text.split('\n')
-        for line in lines:
+        Args:
+            lines: Lines of cleaned resume text
+            
+        Returns:
+            Dict with name, experience_summary and current_work (company, position)
+        """
+        name = None
+        experience_lines = []
+        in_experience_section = False
+        experience_done = False
+        current_work = None
+        work_lines = []  # Lines in the first 20 that mention current work, awaiting their context
+        stripped_lines = []
+        lowered_lines = []
+        
+        for i, line in enumerate(lines):
             line = line.strip()
-            if any(keyword in line.lower() for keyword in education_keywords):
-                if len(line) > 5 and len(line) < 150:  # Reasonable length
-                    education.append(line)
-                    if len(education) >= 3:  # Limit to 3 entries
-                        break
+            low = line.lower()
+            stripped_lines.append(line)
+            lowered_lines.append(low)
+            
+            # Name: first of the top 5 lines that looks like one
+            if name is None and i < 5 and line and not self.name_excludes_re.search(low):
+                name = self._match_name(line)
+            
+            # Experience summary: first few lines of the experience/work history section
+            if not experience_done:
+                if self.section_headers_re.search(low):
+                    in_experience_section = True
+                elif in_experience_section and self.section_enders_re.search(low):
+                    experience_done = True
+                elif in_experience_section and len(line) > 10:
+                    experience_lines.append(line)
+                    experience_done = len(experience_lines) >= 3  # Limit to first few lines
+            
+            # Current work: date-like lines in the first 20, resolved once the 2 lines after them are read
+            if current_work is None:
+                if i < 20 and self.current_work_re.search(low):
+                    work_lines.append(i)
+                while current_work is None and work_lines and work_lines[0] + 2 <= i:
+                    current_work = self._match_current_work(stripped_lines, lowered_lines, work_lines.pop(0))
+            
+            name_done = name is not None or i >= 4
+            work_done = current_work is not None or (i >= 19 and not work_lines)
+            if name_done and experience_done and work_done:
+                break
         
-        return education
+        # Lines near the end of the text have a shorter trailing context
+        while current_work is None and work_lines:
+            current_work = self._match_current_work(stripped_lines, lowered_lines, work_lines.pop(0))
+        
+        return {
+            'name': name or "",
+            'experience_summary': ' '.join(experience_lines)[:300] if experience_lines else "",  # Limit length
+            'current_work': current_work or ("", ""),
+        }
+    
+    def _match_name(self, line: str) -> Optional[str]:
+        """Return the name in a stripped line, or None if it does not look like one"""
+        # Check if it looks like a name
+        if self.name_heuristic.match(line):
+            return line
+        
+        # Try name patterns
+        for pattern in self.name_patterns:
+            match = pattern.search(line)
+            if match:
+                return match.group(1)
+        
+        return None
+    
+    def _match_current_work(self, stripped_lines: List[str], lowered_lines: List[str], index: int) -> Optional[tuple]:
+        """Find (company, position) in the lines around a current-work line, or None if there is no company"""
+        start, end = max(0, index - 3), index + 3
+        context = list(zip(stripped_lines[start:end], lowered_lines[start:end]))
+        
+        for context_line, context_low in context:
+            # Try to identify company (often has Inc, Corp, Ltd, etc.)
+            if self.company_indicators_re.search(context_low):
+                # Look for position in nearby lines
+                for pos_line, pos_low in context:
+                    if self.title_words_re.search(pos_low):
+                        return context_line, pos_line
+                
+                return context_line, ""
+        
+        return None
     
     def get_supported_file_types(self) -> List[str]:
         """Get list of supported file types"""
         supported = ['.txt']
         
-        if PDF_AVAILABLE:
+        if PYMUPDF_AVAILABLE or PDF_AVAILABLE:
             supported.append('.pdf')
         
         if DOCX_AVAILABLE:
@@ -480,28 +688,48 @@ class ResumeParser:
         
         return True, ""
 
+# Per-process parser used by parse_resume_files workers
+_worker_parser: Optional[ResumeParser] = None
+
+def _extract_text_safely(file_path: str) -> Optional[str]:
+    """Extract one file's text in a worker process, returning None instead of raising"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParser()
+    
+    try:
+        return _worker_parser.extract_text_from_file(file_path)
+    except Exception as e:
+        logger.error(f"Error extracting text from {file_path}: {e}")
+        return None
+
 def install_dependencies():
-    """Install required dependencies"""
+    """Install required dependencies that are not already importable"""
     import subprocess
     import sys
     
+    # (pip package, import name)
     dependencies = [
-        "PyPDF2",
-        "python-docx",
-        "spacy"
+        # "fitz" alone could be the unrelated PyPI package of that name
+        ("PyMuPDF", "pymupdf"),
+        ("python-docx", "docx"),
+        ("spacy", "spacy")
     ]
     
-    for dep in dependencies:
+    # One pip run for everything missing, so the resolver only starts once
+    missing = [package for package, module in dependencies if importlib.util.find_spec(module) is None]
+    if missing:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
         except Exception as e:
-            logger.error(f"Failed to install {dep}: {e}")
+            logger.error(f"Failed to install {', '.join(missing)}: {e}")
     
     # Try to download spacy model
-    try:
-        subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-    except Exception as e:
-        logger.warning(f"Failed to download spacy model: {e}")
+    if importlib.util.find_spec("en_core_web_sm") is None:
+        try:
+            subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
+        except Exception as e:
+            logger.warning(f"Failed to download spacy model: {e}")
 
 # Test function
 def test_parser():
@@ -546,8 +774,8 @@ def test_parser():
 if __name__ == "__main__":
     # Check dependencies
     missing_deps = []
-    if not PDF_AVAILABLE:
-        missing_deps.append("PyPDF2")
+    if not (PYMUPDF_AVAILABLE or PDF_AVAILABLE):
+        missing_deps.append("PyMuPDF or PyPDF2")
     if not DOCX_AVAILABLE:
         missing_deps.append("python-docx")
     if not NLP_AVAILABLE:
@@ -555,7 +783,7 @@ if __name__ == "__main__":
     
     if missing_deps:
         print(f"Missing dependencies: {', '.join(missing_deps)}")
-        print("Install with: pip install PyPDF2 python-docx spacy")
+        print("Install with: pip install PyMuPDF python-docx spacy")
         print("Then: python -m spacy download en_core_web_sm")
     else:
         print("All dependencies available!")
@@ -54,7 +54,11 @@ def check_package_availability(package_name, import_name=None):
         return False
 
 def download_spacy_model():
-    """Download spaCy English model"""
+    """Download spaCy English model unless it is already installed"""
+    if importlib.util.find_spec("en_core_web_sm") is not None:
+        print("✅ spaCy English model already installed")
+        return True
+    
     try:
         result = subprocess.run([
             sys.executable, "-m", "spacy", "download", "en_core_web_sm"
@@ -139,7 +143,7 @@ def main():
     else:
         print("❌ Some packages failed to install")
         print("You can try installing manually:")
-        print("pip install PyPDF2 python-docx spacy requests beautifulsoup4 selenium")
+        print("pip install PyMuPDF PyPDF2 python-docx spacy requests beautifulsoup4 selenium")
     
     print("\n🔧 Setting up spaCy...")
     
@@ -164,6 +168,7 @@ def main():
     
     # Check individual packages
     packages_to_check = [
+        ("PyMuPDF", "pymupdf"),
         ("PyPDF2", "PyPDF2"),
         ("python-docx", "docx"),
         ("spacy", "spacy"),
@@ -1,5 +1,7 @@
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass
@@ -33,11 +35,57 @@ class Job:
     posted_date: datetime
     status: str = "active"  # active, paused, closed
 
+class _BatchConnection:
+    """Connection handed out inside HRDatabase.batch(); commit and close wait for the batch to end"""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+    
+    def cursor(self):
+        return self._conn.cursor()
+    
+    def commit(self):
+        pass
+    
+    def close(self):
+        pass
+
 class HRDatabase:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # Batch connections are per thread; sqlite3 connections can't cross threads
+        self._local = threading.local()
         self.init_database()
     
+    def _connect(self):
+        """Return this thread's open batch connection, or a new connection outside a batch"""
+        batch_conn = getattr(self._local, 'batch_conn', None)
+        if batch_conn is not None:
+            return _BatchConnection(batch_conn)
+        return sqlite3.connect(self.db_path)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Run several operations over one connection and commit them together
+        
+        Writes inside the block are committed once on exit and rolled back if
+        it raises. The write lock is held until the block ends, so keep slow
+        work (LLM calls) outside it. Nested batches join the outer one.
+        """
+        if getattr(self._local, 'batch_conn', None) is not None:
+            yield
+            return
+        
+        conn = sqlite3.connect(self.db_path)
+        self._local.batch_conn = conn
+        try:
+            with conn:
+                yield
+        finally:
+            self._local.batch_conn = None
+            conn.close()
+    
     def init_database(self):
         """Initialize the database with required tables"""
         conn = sqlite3.connect(self.db_path)
@@ -114,7 +162,7 @@ class HRDatabase:
     def add_job(self, title: str, company: str, description: str, 
                 required_skills: List[str], experience_level: str, location: str) -> int:
         """Add a new job posting"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -129,7 +177,7 @@ class HRDatabase:
     
     def add_candidate(self, candidate: Candidate) -> int:
         """Add a new candidate"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -159,7 +207,7 @@ class HRDatabase:
     def log_outreach(self, candidate_id: int, job_id: int, message_content: str, 
                      platform: str = "email", status: str = "sent") -> int:
         """Log an outreach attempt"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -181,7 +229,7 @@ class HRDatabase:
     
     def update_candidate_response(self, candidate_id: int, status: str, response_content: str = ""):
         """Update candidate response status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -199,9 +247,24 @@ class HRDatabase:
         conn.commit()
         conn.close()
     
+    def get_existing_candidate_emails(self, emails: List[str]) -> set:
+        """Return which of the given emails already belong to a stored candidate"""
+        if not emails:
+            return set()
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        placeholders = ','.join('?' * len(emails))
+        cursor.execute(f'SELECT email FROM candidates WHERE email IN ({placeholders})', list(emails))
+        existing = {row[0] for row in cursor.fetchall()}
+        
+        conn.close()
+        return existing
+    
     def get_candidates_by_job(self, job_id: int, limit: int = None) -> List[Dict]:
         """Get all candidates for a specific job"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         query = '''
@@ -229,7 +292,7 @@ class HRDatabase:
         if not date:
             date = datetime.now().strftime('%Y-%m-%d')
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Get metrics for the day
@@ -271,7 +334,7 @@ class HRDatabase:
         if not date:
             date = datetime.now().strftime('%Y-%m-%d')
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -290,7 +353,7 @@ class HRDatabase:
     
     def get_jobs(self, status: str = "active") -> List[Dict]:
         """Get all jobs with specified status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('SELECT * FROM jobs WHERE status = ? ORDER BY posted_date DESC', (status,))
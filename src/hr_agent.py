@@ -165,6 +165,51 @@ HR Recruitment Team"""
             # Fallback calculation
             return self._calculate_match_score_fallback(candidate, job)
     
+    def rank_candidate_matches(self, candidates: List[Dict], job: Dict) -> List[float]:
+        """Score several candidates against one job in a single Ollama call"""
+        if not candidates:
+            return []
+        
+        candidate_lines = "\n".join(
+            f"        {i}. Skills: {candidate.get('skills', [])}; "
+            f"Experience: {candidate.get('experience_years', 0)} years; "
+            f"Location: {candidate.get('location', 'Unknown')}"
+            for i, candidate in enumerate(candidates, 1)
+        )
+        prompt = f"""
+        Calculate a match score (0.0 to 1.0) between each candidate below and this job requirement:
+        
+        Job Requirements:
+        - Required Skills: {job.get('required_skills', [])}
+        - Experience Level: {job.get('experience_level', 'Mid')}
+        - Location: {job.get('location', 'Remote')}
+        
+        Consider:
+        - Skill overlap (weight: 50%)
+        - Experience level match (weight: 30%)
+        - Location compatibility (weight: 20%)
+        
+        Candidates:
+{candidate_lines}
+        
+        Return only a JSON array of {len(candidates)} numbers between 0.0 and 1.0, one per candidate in order (e.g., [0.85, 0.4])
+        """
+        
+        try:
+            response = self.ollama_client.chat(
+                model=self.ollama_model,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            score_text = response['message']['content']
+            scores = json.loads(re.search(r'\[[^\[\]]*\]', score_text).group(0))
+            if len(scores) == len(candidates):
+                return [min(max(float(score), 0.0), 1.0) for score in scores]
+        except Exception as e:
+            print(f"Error batch-ranking candidates with Ollama: {e}")
+        
+        # Fall back to scoring each candidate on its own
+        return [self.rank_candidate_match(candidate, job) for candidate in candidates]
+    
     def _calculate_match_score_fallback(self, candidate: Dict, job: Dict) -> float:
         """Fallback match score calculation"""
         score = 0.0
@@ -320,35 +365,36 @@ class HRRecruitmentAgent:
     
     def process_job_description(self, job_description: str, company: str = "TechCorp") -> int:
         """Process JD and extract requirements using Gemini"""
+        job = self._analyze_job_description(job_description, company)
+        
+        # Save job to database
+        job_id = self.db.add_job(**job)
+        
+        print(f"✅ Job analyzed and saved (ID: {job_id})")
+        return job_id
+    
+    def _analyze_job_description(self, job_description: str, company: str = "TechCorp") -> Dict:
+        """Analyze a JD with Gemini and return the job fields add_job takes, without saving"""
         print("🔍 Analyzing job description...")
         
         # Use Gemini to analyze the JD
         jd_analysis = self.ai_service.analyze_job_description(job_description)
         
-        # Save job to database
-        company_name = company or jd_analysis.get('company') or 'TechCorp'
-        title = jd_analysis.get('title') or 'Software Developer'
-        required_skills = jd_analysis.get('required_skills') or []
-        experience_level = jd_analysis.get('experience_level') or 'Mid'
-        location = jd_analysis.get('location') or 'Remote'
-        
-        job_id = self.db.add_job(
-            title=title,
-            company=company_name,
-            description=job_description,
-            required_skills=required_skills,
-            experience_level=experience_level,
-            location=location
-        )
-        
-        print(f"✅ Job analyzed and saved (ID: {job_id})")
-        print(f"📋 Required skills: {', '.join(jd_analysis.get('required_skills', []))}")
-        print(f"🎯 Experience level: {jd_analysis.get('experience_level', 'Mid')}")
+        job = {
+            'title': jd_analysis.get('title') or 'Software Developer',
+            'company': company or jd_analysis.get('company') or 'TechCorp',
+            'description': job_description,
+            'required_skills': jd_analysis.get('required_skills') or [],
+            'experience_level': jd_analysis.get('experience_level') or 'Mid',
+            'location': jd_analysis.get('location') or 'Remote'
+        }
         
-        return job_id
+        print(f"📋 Required skills: {', '.join(job['required_skills'])}")
+        print(f"🎯 Experience level: {job['experience_level']}")
+        return job
     
-    def source_candidates(self, job_id: int, max_candidates: int = 20) -> List[Dict]:
-        """Source candidates for a specific job"""
+    def source_candidates(self, job_id: int, max_candidates: int = 20, batch: bool = False) -> List[Dict]:
+        """Source candidates for a specific job, scoring them in one LLM call when batch is set"""
         print("🔎 Sourcing candidates...")
         
         # Get job details
@@ -358,18 +404,32 @@ class HRRecruitmentAgent:
         if not job:
             raise ValueError(f"Job with ID {job_id} not found")
         
-        # Search for candidates
+        candidates = self._search_candidates(job, max_candidates)
+        
+        # Rank candidates
+        if batch:
+            match_scores = self.ai_service.rank_candidate_matches(candidates, job)
+        else:
+            match_scores = [self.ai_service.rank_candidate_match(c, job) for c in candidates]
+        
+        ranked_candidates = self._save_candidates(job_id, candidates, match_scores)
+        
+        print(f"✅ Sourced {len(ranked_candidates)} candidates")
+        return ranked_candidates
+    
+    def _search_candidates(self, job: Dict, max_candidates: int) -> List[Dict]:
+        """Search for candidates matching a job's requirements"""
         candidates = self.linkedin_api.search_candidates(
             skills=job['required_skills'],
             location=job['location'],
             experience_min=self._get_min_experience(job['experience_level'])
         )
-        
-        # Rank candidates
+        return candidates[:max_candidates]
+    
+    def _save_candidates(self, job_id: int, candidates: List[Dict], match_scores: List[float]) -> List[Dict]:
+        """Store scored candidates for a job and return them sorted by match score"""
         ranked_candidates = []
-        for candidate_data in candidates[:max_candidates]:
-            match_score = self.ai_service.rank_candidate_match(candidate_data, job)
-            
+        for candidate_data, match_score in zip(candidates, match_scores):
             candidate = Candidate(
                 id=0,  # Will be set by database
                 name=candidate_data['name'],
@@ -392,8 +452,6 @@ class HRRecruitmentAgent:
         
         # Sort by match score
         ranked_candidates.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        print(f"✅ Sourced {len(ranked_candidates)} candidates")
         return ranked_candidates
     
     def _get_min_experience(self, experience_level: str) -> int:
@@ -425,24 +483,26 @@ class HRRecruitmentAgent:
             if candidate['response_status'] == 'not_contacted':
                 # Generate personalized email
                 email_content = self.ai_service.generate_outreach_email(candidate, job)
-                
-                # Log outreach
-                outreach_id = self.db.log_outreach(
-                    candidate['id'], job_id, email_content, "email", "generated"
-                )
-                
-                outreach_campaigns.append({
-                    "candidate_id": candidate['id'],
-                    "candidate_name": candidate['name'],
-                    "candidate_email": candidate['email'],
-                    "match_score": candidate['match_score'],
-                    "email_content": email_content,
-                    "outreach_id": outreach_id
-                })
+                outreach_campaigns.append(self._log_campaign(job_id, candidate, email_content))
         
         print(f"✅ Generated {len(outreach_campaigns)} outreach emails")
         return outreach_campaigns
     
+    def _log_campaign(self, job_id: int, candidate: Dict, email_content: str) -> Dict:
+        """Log a generated outreach email and return its campaign entry"""
+        outreach_id = self.db.log_outreach(
+            candidate['id'], job_id, email_content, "email", "generated"
+        )
+        
+        return {
+            "candidate_id": candidate['id'],
+            "candidate_name": candidate['name'],
+            "candidate_email": candidate['email'],
+            "match_score": candidate['match_score'],
+            "email_content": email_content,
+            "outreach_id": outreach_id
+        }
+    
     def send_outreach_emails(self, outreach_campaigns: List[Dict]) -> Dict:
         """Simulate sending outreach emails (in real implementation, integrate with email service)"""
         print("📤 Sending outreach emails...")
@@ -521,6 +581,63 @@ class HRRecruitmentAgent:
         print("✅ Daily report generated")
         return detailed_report
     
+    def run_pipeline(self, job_description: str, company: str = "TechCorp", max_candidates: int = 20,
+                     min_match_score: float = 0.6, max_outreach: int = 10) -> Dict:
+        """
+        Analyze a job, source and score candidates and draft outreach, then save the
+        job, candidates and outreach in one short database transaction and generate
+        the daily report. Candidates are scored in one batched LLM call.
+        
+        All LLM work happens before the transaction opens, so slow model calls never
+        hold the SQLite write lock and a late LLM error leaves the database untouched.
+        
+        Args:
+            job_description: Raw job description text
+            company: Hiring company name
+            max_candidates: Maximum candidates to source
+            min_match_score: Minimum match score for outreach
+            max_outreach: Maximum outreach emails to generate
+            
+        Returns:
+            Dict with job_id, candidates, campaigns and report
+        """
+        job = self._analyze_job_description(job_description, company)
+        
+        print("🔎 Sourcing candidates...")
+        sourced = self._search_candidates(job, max_candidates)
+        match_scores = self.ai_service.rank_candidate_matches(sourced, job)
+        
+        # Candidates already stored keep their original job, so they get no outreach here
+        print("📧 Generating outreach campaigns...")
+        known_emails = self.db.get_existing_candidate_emails([c['email'] for c in sourced])
+        shortlisted = []
+        for candidate_data, match_score in sorted(zip(sourced, match_scores), key=lambda pair: pair[1], reverse=True):
+            if len(shortlisted) >= max_outreach or match_score < min_match_score:
+                break
+            if candidate_data['email'] not in known_emails:
+                known_emails.add(candidate_data['email'])
+                shortlisted.append({**candidate_data, 'match_score': match_score})
+        drafts = [(candidate, self.ai_service.generate_outreach_email(candidate, job)) for candidate in shortlisted]
+        
+        with self.db.batch():
+            job_id = self.db.add_job(**job)
+            candidates = self._save_candidates(job_id, sourced, match_scores)
+            candidate_ids = {c['email']: c['id'] for c in candidates}
+            campaigns = [
+                self._log_campaign(job_id, {**candidate, 'id': candidate_ids[candidate['email']]}, email_content)
+                for candidate, email_content in drafts
+            ]
+        
+        print(f"✅ Job saved (ID: {job_id}) with {len(candidates)} candidates and {len(campaigns)} outreach emails")
+        report = self.generate_daily_report()
+        
+        return {
+            "job_id": job_id,
+            "candidates": candidates,
+            "campaigns": campaigns,
+            "report": report
+        }
+    
     def get_pipeline_status(self) -> Dict:
         """Get current recruitment pipeline status"""
         jobs = self.db.get_jobs()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for HRDatabase batch transactions
+"""
+
+import os
+import sys
+import tempfile
+import threading
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from database import HRDatabase
+
+def _add_test_job(db, title):
+    return db.add_job(
+        title=title,
+        company="Test Company",
+        description="Test job description",
+        required_skills=["Python", "SQL"],
+        experience_level="Mid",
+        location="Remote"
+    )
+
+def _job_titles(db):
+    return {job['title'] for job in db.get_jobs()}
+
+def test_batch_commit_and_rollback():
+    print("🧪 Testing database batch transactions...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = HRDatabase(os.path.join(tmp_dir, 'test_batch.db'))
+        
+        # Writes inside a batch are committed together on exit
+        with db.batch():
+            _add_test_job(db, "Committed Developer")
+            _add_test_job(db, "Committed Analyst")
+        assert {"Committed Developer", "Committed Analyst"} <= _job_titles(db)
+        print("  ✅ Batch commit: Success")
+        
+        # An error inside a batch rolls back every write in it
+        try:
+            with db.batch():
+                _add_test_job(db, "Rolled Back Developer")
+                raise RuntimeError("late failure")
+        except RuntimeError:
+            pass
+        assert "Rolled Back Developer" not in _job_titles(db)
+        print("  ✅ Batch rollback: Success")
+        
+        # A batch on one thread does not capture writes from another thread
+        try:
+            with db.batch():
+                worker = threading.Thread(target=_add_test_job, args=(db, "Other Thread Developer"))
+                worker.start()
+                worker.join()
+                _add_test_job(db, "Main Thread Developer")
+                raise RuntimeError("late failure")
+        except RuntimeError:
+            pass
+        titles = _job_titles(db)
+        assert "Other Thread Developer" in titles
+        assert "Main Thread Developer" not in titles
+        print("  ✅ Per-thread batch connection: Success")
+
+if __name__ == "__main__":
+    try:
+        test_batch_commit_and_rollback()
+    except AssertionError as e:
+        print(f"❌ Batch test failed: {e}")
+        sys.exit(1)
+    print("\n🎉 All tests passed successfully!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the quickstart agent daemon
+"""
+
+import os
+import stat
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import quickstart
+
+class FakeAgent:
+    def get_pipeline_status(self):
+        return {'jobs': 1}
+    
+    def generate_daily_report(self):
+        raise ValueError("no data yet")
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    if sys.platform == 'win32':
+        pytest.skip("Uses a Unix socket")
+    monkeypatch.setattr(quickstart, 'AGENT_DAEMON_ADDRESS', str(tmp_path / 'agent.sock'))
+    monkeypatch.setattr(quickstart, 'AGENT_DAEMON_KEY_PATH', str(tmp_path / 'agent.key'))
+    
+    server = threading.Thread(target=quickstart.serve_agent, args=(FakeAgent(),), daemon=True)
+    server.start()
+    deadline = time.monotonic() + 5
+    while quickstart._connect_to_daemon() is None:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    yield server
+    quickstart.stop_agent_daemon()
+    server.join(timeout=5)
+
+def test_daemon_round_trip(daemon):
+    assert quickstart.call_agent_daemon('get_pipeline_status') == {'jobs': 1}
+    assert stat.S_IMODE(os.stat(quickstart.AGENT_DAEMON_KEY_PATH).st_mode) == 0o600
+
+def test_daemon_reports_errors(daemon):
+    with pytest.raises(RuntimeError, match="no data yet"):
+        quickstart.call_agent_daemon('generate_daily_report')
+    with pytest.raises(RuntimeError, match="Unsupported call"):
+        quickstart.call_agent_daemon('__init__')
+
+def test_stop_cleans_up(daemon):
+    assert quickstart.stop_agent_daemon()
+    daemon.join(timeout=5)
+    assert not daemon.is_alive()
+    assert not os.path.exists(quickstart.AGENT_DAEMON_ADDRESS)
+    assert not os.path.exists(quickstart.AGENT_DAEMON_KEY_PATH)
+    assert not quickstart.stop_agent_daemon()
+
+def test_stale_socket_is_replaced(tmp_path, monkeypatch):
+    if sys.platform == 'win32':
+        pytest.skip("Uses a Unix socket")
+    import socket
+    address = str(tmp_path / 'agent.sock')
+    # A bound but never-listening socket leaves the same dead file a crashed daemon does
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    dead.bind(address)
+    dead.close()
+    
+    quickstart._remove_stale_socket(address)
+    assert not os.path.exists(address)
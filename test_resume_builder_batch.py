@@ -0,0 +1,24 @@
+"""
+Tests for ResumeBuilder.process_resumes_batch
+"""
+
+from resume_builder import ResumeBuilder
+
+def test_process_resumes_batch_keeps_order_and_isolates_errors(resume_files):
+    items = [(path.read_bytes(), path.name) for path in resume_files]
+    
+    # Two workers so the batch really goes through the process pool
+    results = ResumeBuilder().process_resumes_batch(items, max_workers=2)
+    
+    assert [result['filename'] for result in results] == [path.name for path in resume_files]
+    assert results[0]['success'] and results[0]['data']['email'] == "jane.doe@example.com"
+    assert not results[1]['success'] and "Could not extract any text" in results[1]['error']
+    assert results[2]['success'] and results[2]['data']['email'] == "john.roe@example.com"
+
+def test_process_resumes_batch_single_and_empty():
+    builder = ResumeBuilder()
+    assert builder.process_resumes_batch([]) == []
+    
+    # A single item runs in-process and still reports failure instead of raising
+    [result] = builder.process_resumes_batch([(b"", "empty.txt")])
+    assert result == {'filename': "empty.txt", 'success': False, 'error': "File validation failed: File is empty"}
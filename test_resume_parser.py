@@ -0,0 +1,47 @@
+"""
+Tests for ResumeParser text extraction and batch parsing
+"""
+
+import pytest
+
+from resume_parser import ResumeParser
+
+RESUME_TEXT = "Jane Doe\njane.doe@example.com\nSkills: Python, SQL"
+
+@pytest.fixture
+def parser():
+    return ResumeParser()
+
+def test_extracts_txt(parser, tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_text(RESUME_TEXT, encoding='utf-8')
+    assert "jane.doe@example.com" in parser.extract_text_from_file(str(path))
+
+def test_extracts_docx(parser, tmp_path):
+    docx = pytest.importorskip('docx')
+    document = docx.Document()
+    for line in RESUME_TEXT.splitlines():
+        document.add_paragraph(line)
+    path = tmp_path / "resume.docx"
+    document.save(str(path))
+    assert "jane.doe@example.com" in parser.extract_text_from_file(str(path))
+
+def test_extracts_pdf(parser, tmp_path):
+    pymupdf = pytest.importorskip('pymupdf')
+    path = tmp_path / "resume.pdf"
+    with pymupdf.open() as document:
+        document.new_page().insert_text((72, 72), RESUME_TEXT)
+        document.save(str(path))
+    assert "jane.doe@example.com" in parser.extract_text_from_file(str(path))
+
+def test_unsupported_or_missing_file_gives_none(parser, tmp_path):
+    path = tmp_path / "resume.rtf"
+    path.write_text(RESUME_TEXT, encoding='utf-8')
+    assert parser.extract_text_from_file(str(path)) is None
+    assert parser.extract_text_from_file(str(tmp_path / "missing.txt")) is None
+
+def test_parse_resume_files_leaves_bad_files_empty(parser, resume_files):
+    candidates = parser.parse_resume_files([str(path) for path in resume_files], max_workers=2)
+    
+    assert [candidate.email for candidate in candidates] == ["jane.doe@example.com", "", "john.roe@example.com"]
+    assert candidates[0].full_name == "Jane Doe" and not candidates[1].full_name